@@ -1,4 +1,7 @@
+import importlib.util
 import logging
+import time
+import weakref
 from typing import Any
 
 import httpx
@@ -9,6 +12,51 @@ from supabase._async.client import create_client
 from app.core.third_party_integrations.supabase_home.config import supabase_config
 from app.core.third_party_integrations.supabase_home.exceptions.index import (
     SupabaseAuthError,
+    SupabaseCircuitOpenError,
+    SupabaseConcurrencyLimitError,
+    SupabaseDeadlineExceededError,
+)
+from app.core.third_party_integrations.supabase_home.transport.circuit_breaker import (
+    CircuitBreakerRegistry,
+    service_area,
+)
+from app.core.third_party_integrations.supabase_home.transport.codec import get_codec
+from app.core.third_party_integrations.supabase_home.transport.deadline import (
+    TimeoutBudget,
+    deadline_expired,
+    with_deadline,
+)
+from app.core.third_party_integrations.supabase_home.transport.hedging import hedger
+from app.core.third_party_integrations.supabase_home.transport.http_cache import (
+    CacheEntry,
+    HTTPCache,
+)
+from app.core.third_party_integrations.supabase_home.transport.instrumentation import (
+    track,
+)
+from app.core.third_party_integrations.supabase_home.transport.limiter import (
+    AdaptiveLimiterRegistry,
+)
+from app.core.third_party_integrations.supabase_home.transport.metrics import (
+    BYTES_RECEIVED,
+    BYTES_SENT,
+    REQUEST_RETRIES,
+    metrics,
+)
+from app.core.third_party_integrations.supabase_home.transport.request_logging import (
+    RequestLogger,
+)
+from app.core.third_party_integrations.supabase_home.transport.retry import (
+    RetryPolicy,
+)
+from app.core.third_party_integrations.supabase_home.transport.singleflight import (
+    SingleFlight,
+    request_key,
+)
+from app.core.third_party_integrations.supabase_home.transport.tracing import (
+    current_span,
+    increment_span_attribute,
+    set_span_attribute,
 )
 
 logger = logging.getLogger("apps.supabase_home")
@@ -33,6 +81,17 @@ class SupabaseUnsecureService:
         self.anon_key = supabase_config.anon_key
         self.service_role_key = supabase_config.service_role_key
         self.raw = self._get_service_role_supabase_client()
+        # * Pooled HTTP client, created lazily on first use and shared by every request
+        self._http_client: httpx.AsyncClient | None = None
+        self.retry_policy = RetryPolicy.from_config(supabase_config)
+        self.timeout_budget = TimeoutBudget.from_config(supabase_config)
+        self.circuit_breakers = CircuitBreakerRegistry.from_config(supabase_config)
+        self.limiters = AdaptiveLimiterRegistry.from_config(supabase_config)
+        self.request_logger = RequestLogger.from_config(logger, supabase_config)
+        self.codec = get_codec(supabase_config.json_codec)
+        self.single_flight = SingleFlight()
+        self.http_cache = HTTPCache.from_config(supabase_config)
+        self._register_metrics()
 
         self._configure_service()
 
@@ -59,6 +118,89 @@ class SupabaseUnsecureService:
             raise ValueError("SUPABASE_URL and SUPABASE_SERVICE_ROLE_KEY are required.")
         return create_client(self.base_url, self.service_role_key)
 
+    def _register_metrics(self) -> None:
+        """
+        Publish breaker, limiter, coalescing and cache state as gauges at scrape time.
+        """
+        circuit_state = metrics.gauge(
+            "supabase_circuit_open",
+            "Circuit breaker state per service area (0 closed, 1 half-open, 2 open)",
+            ("service",),
+        )
+        concurrency_limit = metrics.gauge(
+            "supabase_concurrency_limit",
+            "Current adaptive concurrency limit per service area",
+            ("service",),
+        )
+        coalesced = metrics.gauge(
+            "supabase_single_flight_saved",
+            "Upstream calls avoided by single-flight coalescing",
+        )
+        cache_bytes = metrics.gauge(
+            "supabase_http_cache_bytes",
+            "Bytes held by the HTTP response cache",
+        )
+        state_values = {"closed": 0, "half_open": 1, "open": 2}
+
+        # ? A weak reference, so the process-wide registry does not keep the service alive
+        service_ref = weakref.ref(self)
+
+        def collect() -> None:
+            service = service_ref()
+            if service is None:
+                metrics.remove_collector(collect)
+                return
+            for area, snapshot in service.circuit_breakers.snapshot().items():
+                circuit_state.set(area, value=state_values[snapshot["state"]])
+            for area, snapshot in service.limiters.snapshot().items():
+                concurrency_limit.set(area, value=snapshot["limit"])
+            coalesced.set(value=service.single_flight.saved)
+            cache_bytes.set(value=service.http_cache.size_bytes)
+
+        self._metrics_collector = collect
+        metrics.add_collector(collect)
+
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """
+        Return the service-owned pooled HTTP client, creating it on first use.
+
+        The client keeps connections alive between calls so requests skip DNS,
+        TCP and TLS setup. Call `aclose()` on shutdown to release the pool.
+        """
+        if self._http_client is None or self._http_client.is_closed:
+            http2 = supabase_config.http2
+            if http2 and importlib.util.find_spec("h2") is None:
+                logger.warning(
+                    "HTTP/2 requested but the 'h2' package is not installed; using HTTP/1.1"
+                )
+                http2 = False
+            self._http_client = httpx.AsyncClient(
+                timeout=self.timeout_budget.default_timeout(),
+                http2=http2,
+                limits=httpx.Limits(
+                    max_connections=supabase_config.max_connections,
+                    max_keepalive_connections=supabase_config.max_keepalive_connections,
+                    keepalive_expiry=supabase_config.keepalive_expiry,
+                ),
+            )
+        return self._http_client
+
+    async def aclose(self) -> None:
+        """
+        Close the pooled HTTP client and stop publishing this service's gauges.
+        Call from the application's shutdown hook.
+        """
+        metrics.remove_collector(self._metrics_collector)
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
+
+    async def __aenter__(self) -> "SupabaseUnsecureService":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
     def _get_headers(
         self, auth_token: str | None, is_admin: bool = False
     ) -> dict[str, str]:
@@ -82,85 +224,267 @@ class SupabaseUnsecureService:
         self,
         method: str,
         endpoint: str,
-        auth_token: str | None,
+        auth_token: str | None = None,
         is_admin: bool = False,
-        data: dict[str, Any] | None,
-        params: dict[str, Any] | None,
-        headers: dict[str, str] | None,
-        timeout: int = 30,
-    ) -> dict[str, Any]:
+        data: dict[str, Any] | None = None,
+        params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+        timeout: float | None = None,
+        retry_non_idempotent: bool = False,
+        response_type: Any = None,
+        coalesce: bool | None = None,
+        hedge: bool | None = None,
+        cache: bool | None = None,
+    ) -> Any:
+        """
+        Send a request to the Supabase API and decode the JSON response.
+
+        Args:
+            timeout: Upper bound for this call in seconds (defaults to
+                `SupabaseConfig.timeout`); always clipped to the active `deadline()`
+            response_type: Optional type (msgspec Struct, dataclass, pydantic model,
+                `list[...]`) to decode the response body into instead of dicts/lists;
+                `bytes` returns the raw body
+            coalesce: Share one upstream call between concurrent identical GET/HEAD
+                requests (defaults to `SupabaseConfig.enable_single_flight`). The
+                decoded result is shared, so callers must not mutate it.
+            hedge: Send a duplicate GET/HEAD when the first is slower than the observed
+                p95 and use whichever answers first (defaults to
+                `SupabaseConfig.enable_hedging`)
+            cache: Serve GET responses from the HTTP cache, revalidating stale entries
+                with If-None-Match/If-Modified-Since (defaults to
+                `SupabaseConfig.enable_http_cache`). Cached results are shared, so
+                callers must not mutate them.
+        """
         url = f"{self.base_url}{endpoint}"
 
         request_headers = self._get_headers(auth_token, is_admin)
         if headers:
             request_headers.update(headers)
 
-        logger.info(f"Making {method} request to {url}")
-        logger.info(f"Headers: {request_headers}")
-        if "Authorization" in request_headers:
-            auth_header = request_headers["Authorization"]
-            logger.info(f"Authorization header: {auth_header[:15]}...")
-        else:
-            logger.info("No Authorization header found")
-
-        logger.info(f"Request data: {data}")
-        logger.info(f"Request params: {params}")
-
         if (
             data is None
             and "Content-Type" in request_headers
             and request_headers["Content-Type"] == "application/json"
         ):
             data = {}
-            logger.info("Initialized empty JSON data")
+
+        if cache is None:
+            cache = supabase_config.enable_http_cache
+        if hedge is None:
+            hedge = supabase_config.enable_hedging
+        if coalesce is None:
+            coalesce = supabase_config.enable_single_flight
+        # * The span opens before the cache and single-flight so their outcome lands on it
+        return await track(
+            f"{service_area(endpoint)}.{method.lower()}",
+            self._serve_request(
+                method,
+                endpoint,
+                url,
+                request_headers,
+                data,
+                params,
+                timeout,
+                retry_non_idempotent,
+                response_type,
+                coalesce,
+                hedge,
+                cache,
+            ),
+            {"http.method": method, "http.route": endpoint},
+        )
+
+    async def _serve_request(
+        self,
+        method: str,
+        endpoint: str,
+        url: str,
+        request_headers: dict[str, str],
+        data: dict[str, Any] | None,
+        params: dict[str, Any] | None,
+        timeout: float | None,
+        retry_non_idempotent: bool,
+        response_type: Any,
+        coalesce: bool,
+        hedge: bool,
+        cache: bool,
+    ) -> Any:
+        """Answer from the HTTP cache or a shared in-flight call before sending."""
+        safe = method.upper() in ("GET", "HEAD")
+        cache_key = None
+        cached = None
+        if cache and method.upper() == "GET":
+            cache_key = request_key(method, url, params, request_headers) + (response_type,)
+            cached, fresh = self.http_cache.lookup(cache_key)
+            set_span_attribute("cache.hit", fresh)
+            if fresh:
+                return cached.value
+            if cached is not None:
+                request_headers.update(self.http_cache.conditional_headers(cached))
+
+        send = lambda: self._execute_request(  # noqa: E731
+            method,
+            endpoint,
+            url,
+            request_headers,
+            data,
+            params,
+            timeout,
+            retry_non_idempotent,
+            response_type,
+            hedge and safe,
+            cache_key,
+            cached,
+        )
+        if coalesce and safe:
+            key = request_key(method, url, params, request_headers) + (response_type,)
+            return await self.single_flight.do(key, send)
+        return await send()
+
+    async def _execute_request(
+        self,
+        method: str,
+        endpoint: str,
+        url: str,
+        request_headers: dict[str, str],
+        data: dict[str, Any] | None,
+        params: dict[str, Any] | None,
+        timeout: float | None,
+        retry_non_idempotent: bool,
+        response_type: Any,
+        hedge: bool = False,
+        cache_key: Any = None,
+        cached: CacheEntry | None = None,
+    ) -> Any:
+        request_log = self.request_logger
+        content = self.codec.encode(data) if data is not None else None
+        span = current_span()
+        if span is not None:
+            request_headers["traceparent"] = span.traceparent
 
         try:
-            async with httpx.AsyncClient(timeout=timeout) as client:
-                response = await client.request(
+            client = self._get_http_client()
+            started = time.perf_counter()
+            area = service_area(endpoint)
+            operation = f"{area}.{method.lower()}"
+            labels = (area, operation)
+
+            def on_retry(attempt: int, delay: float, reason: str) -> None:
+                REQUEST_RETRIES.inc(*labels)
+                increment_span_attribute("retry.attempts")
+                request_log.retry(method, url, attempt, delay, reason)
+
+            breaker = self.circuit_breakers.get(area)
+            limiter = self.limiters.get(area)
+
+            async def attempt() -> httpx.Response:
+                # * Raises SupabaseDeadlineExceededError up front when the budget is spent
+                attempt_timeout = self.timeout_budget.httpx_timeout(operation, timeout)
+                request = client.request(
                     method=method,
                     url=url,
                     headers=request_headers,
-                    json=data,
+                    content=content,
                     params=params,
+                    timeout=attempt_timeout,
                 )
+                try:
+                    # ? httpx's read timeout is per socket read; the deadline bounds the whole
+                    # ? exchange, so a slow-drip body cannot outlive it
+                    return await with_deadline(operation, request)
+                except httpx.TimeoutException as e:
+                    # ? The caller's deadline ran out, not the upstream: keep it out of the
+                    # ? breaker's failures, the limiter's throttling signal and the retries
+                    if deadline_expired(self.timeout_budget.min_remaining):
+                        raise SupabaseDeadlineExceededError(operation, 0.0) from e
+                    raise
 
-            logger.info(f"Request to {url}: {method} - Status: {response.status_code}")
-            logger.info(f"Response headers: {response.headers}")
+            def send_attempt() -> Any:
+                send = lambda: limiter.run(attempt)  # noqa: E731
+                if hedge:
+                    return hedger.run((area, endpoint), send, service=area)
+                return send()
 
-            try:
-                if response.content:
-                    logger.info(f"Response content: {response.content[:200]}...")
-                    if response.status_code >= 400:
-                        logger.error(f"Error response: {response.content}")
-            except Exception as e:
-                logger.error(f"Error logging response content: {str(e)}")
+            response = await breaker.call(
+                lambda: self.retry_policy.execute(
+                    method,
+                    send_attempt,
+                    retry_non_idempotent=retry_non_idempotent,
+                    on_retry=on_retry,
+                ),
+                is_failure=lambda r: r.status_code >= 500,
+            )
+
+            BYTES_SENT.inc(*labels, amount=len(content or b""))
+            BYTES_RECEIVED.inc(*labels, amount=len(response.content))
+            if span is not None:
+                span.set_attribute("http.status_code", response.status_code)
+                span.set_attribute("http.request.bytes", len(content or b""))
+                span.set_attribute("http.response.bytes", len(response.content))
+            request_log.response(
+                method,
+                url,
+                response.status_code,
+                time.perf_counter() - started,
+                request_headers=request_headers,
+                params=params,
+                data=data,
+                response_headers=response.headers,
+                content=response.content,
+            )
 
             if response.status_code == 401 or response.status_code == 403:
                 error_detail = self._parse_error_response(response)
-                logger.error(f"Authentication error: {error_detail}")
+                request_log.failure(method, url, "authentication error %s", error_detail)
                 raise HTTPException(
                     status_code=response.status_code, detail=str(error_detail)
                 )
 
+            if response.status_code == 304 and cached is not None:
+                # * Not modified: reuse the cached value, skipping transfer and decode
+                return self.http_cache.revalidate(cache_key, cached, response, endpoint)
+
             response.raise_for_status()
 
-            if response.content:
-                return response.json()
-            return {}
+            if response_type is bytes:
+                result = response.content
+            elif not response.content:
+                result = {}
+            elif response_type is not None:
+                result = self.codec.decode_as(response.content, response_type)
+            else:
+                result = self.codec.decode(response.content)
+            if cache_key is not None:
+                self.http_cache.store(cache_key, response, result, endpoint)
+            elif method.upper() not in ("GET", "HEAD") and len(self.http_cache):
+                # ? Writes drop cached reads of the same resource
+                self.http_cache.invalidate_prefix(url)
+            return result
 
         except httpx.HTTPStatusError as e:
             error_detail = self._parse_error_response(e.response)
-            logger.error(f"Supabase API error: {str(e)} - Details: {error_detail}")
+            request_log.failure(
+                method, url, "HTTP %d %s", e.response.status_code, error_detail
+            )
             raise HTTPException(
                 status_code=e.response.status_code, detail=str(error_detail)
             )
 
         except httpx.RequestError as e:
-            logger.error(f"Supabase request exception: {str(e)}")
+            request_log.failure(method, url, "%s: %s", type(e).__name__, e)
             raise HTTPException(status_code=500, detail="Request error")
 
-        except Exception as e:
-            logger.exception(f"Unexpected error during Supabase request: {str(e)}")
+        except (SupabaseCircuitOpenError, SupabaseConcurrencyLimitError) as e:
+            request_log.failure(method, url, "%s", e)
+            raise HTTPException(status_code=503, detail=str(e))
+
+        except SupabaseDeadlineExceededError as e:
+            request_log.failure(method, url, "%s", e)
+            raise HTTPException(status_code=504, detail=str(e))
+
+        except Exception:
+            logger.exception("Unexpected error during Supabase %s %s", method, url)
             raise HTTPException(
                 status_code=500, detail="Unexpected error during Supabase request"
             )
@@ -173,3 +497,72 @@ class SupabaseUnsecureService:
                 "status": getattr(response, "status_code", None),
                 "message": getattr(response, "text", str(response)),
             }
+
+    async def get_bucket(
+        self,
+        bucket_id: str,
+        auth_token: str | None = None,
+        is_admin: bool = False,
+        headers: dict[str, str] | None = None,
+        cache: bool | None = None,
+    ) -> dict[str, Any]:
+        """
+        Fetch bucket metadata through the cached request path.
+        """
+        return await self._make_request(
+            "GET",
+            f"/storage/v1/bucket/{bucket_id}",
+            auth_token=auth_token,
+            is_admin=is_admin,
+            headers=headers,
+            cache=cache,
+        )
+
+    async def list_buckets(
+        self,
+        auth_token: str | None = None,
+        is_admin: bool = False,
+        headers: dict[str, str] | None = None,
+        cache: bool | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        List storage buckets through the cached request path.
+        """
+        return await self._make_request(
+            "GET",
+            "/storage/v1/bucket",
+            auth_token=auth_token,
+            is_admin=is_admin,
+            headers=headers,
+            cache=cache,
+        )
+
+    async def download_object(
+        self,
+        bucket_id: str,
+        path: str,
+        auth_token: str | None = None,
+        is_admin: bool = False,
+        public: bool = False,
+        headers: dict[str, str] | None = None,
+        cache: bool | None = None,
+    ) -> bytes:
+        """
+        Download a storage object as raw bytes.
+
+        Args:
+            public: Use the public object route (no Authorization needed)
+            headers: Extra headers, e.g. the apikey/Authorization of an SDK session
+            cache: See `_make_request`; Storage returns ETags, so repeat
+                downloads of an unchanged object are answered with a 304
+        """
+        prefix = "/storage/v1/object/public" if public else "/storage/v1/object"
+        return await self._make_request(
+            "GET",
+            f"{prefix}/{bucket_id}/{path.lstrip('/')}",
+            auth_token=auth_token,
+            is_admin=is_admin,
+            headers=headers,
+            response_type=bytes,
+            cache=cache,
+        )
@@ -4,6 +4,7 @@ from .sdk.database import SupabaseDatabaseService
 from .sdk.edge_functions import SupabaseEdgeFunctionsService
 from .sdk.realtime import SupabaseRealtimeService
 from .sdk.storage import SupabaseStorageService
+from .transport.instrumentation import instrument
 
 
 class SupabaseClient:
@@ -18,21 +19,28 @@ class SupabaseClient:
     - Realtime
     """
 
-    def __init__(self, client):
+    def __init__(self, client, http=None):
+        """
+        Args:
+            client: supabase-py AsyncClient
+            http: Optional `SupabaseUnsecureService` whose ETag-aware response
+                cache serves cached storage reads
+        """
         # Initialize the raw supabase client
         self._raw_client = client
 
         # Initialize service classes
         self.auth = SupabaseAuthService(client)
         self.database = SupabaseDatabaseService(client)
-        self.storage = SupabaseStorageService(client)
+        self.storage = SupabaseStorageService(client, http=http)
         self.edge_functions = SupabaseEdgeFunctionsService(client)
         self.realtime = SupabaseRealtimeService(client)
 
     @classmethod
-    async def create(cls):
+    @instrument("client.create")
+    async def create(cls, http=None):
         client = await get_supabase_client()
-        return cls(client)
+        return cls(client, http=http)
 
     def get_auth_service(self) -> SupabaseAuthService:
         """
@@ -0,0 +1,79 @@
+"""
+Compare JSON codec backends on PostgREST-shaped payloads.
+
+Usage:
+    python -m app.core.third_party_integrations.supabase_home.benchmarks.bench_codec [rows]
+"""
+
+import datetime
+import random
+import sys
+import timeit
+import uuid
+
+from app.core.third_party_integrations.supabase_home.transport.codec import (
+    available_codecs,
+    get_codec,
+    msgspec,
+)
+
+
+def make_rows(count: int) -> list[dict]:
+    now = datetime.datetime.now(datetime.timezone.utc)
+    return [
+        {
+            "id": i,
+            "uuid": str(uuid.uuid4()),
+            "name": f"Item {i}",
+            "description": "Lorem ipsum dolor sit amet " * random.randint(1, 6),
+            "price": round(random.uniform(1, 1000), 2),
+            "active": bool(i % 2),
+            "tags": ["alpha", "beta", "gamma"][: i % 4],
+            "metadata": {"source": "import", "score": random.random(), "rank": i % 17},
+            "created_at": (now - datetime.timedelta(minutes=i)).isoformat(),
+            "user_id": None if i % 5 == 0 else str(uuid.uuid4()),
+        }
+        for i in range(count)
+    ]
+
+
+def bench(label: str, func, number: int) -> float:
+    seconds = min(timeit.repeat(func, number=number, repeat=3)) / number
+    print(f"  {label:<12} {seconds * 1000:9.2f} ms")
+    return seconds
+
+
+def main(rows: int = 20_000) -> None:
+    payload = make_rows(rows)
+    body = get_codec("json").encode(payload)
+    print(f"{rows} rows, {len(body) / 1_000_000:.1f} MB encoded\n")
+
+    row_type = None
+    if msgspec is not None:
+
+        class Row(msgspec.Struct):
+            id: int
+            uuid: str
+            name: str
+            description: str
+            price: float
+            active: bool
+            tags: list[str]
+            metadata: dict
+            created_at: str
+            user_id: str | None
+
+        row_type = list[Row]
+
+    for name in available_codecs():
+        codec = get_codec(name)
+        print(f"[{name}]")
+        bench("encode", lambda: codec.encode(payload), 5)
+        bench("decode", lambda: codec.decode(body), 5)
+        if row_type is not None:
+            bench("decode_as", lambda: codec.decode_as(body, row_type), 3)
+        print()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20_000)
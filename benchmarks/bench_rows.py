@@ -0,0 +1,100 @@
+"""
+Compare memory and decode time of plain dict rows against compact typed rows
+and against the packed columns `fetch_columns` returns.
+
+Usage:
+    python -m app.core.third_party_integrations.supabase_home.benchmarks.bench_rows [rows]
+"""
+
+import gc
+import sys
+import timeit
+import tracemalloc
+
+from app.core.third_party_integrations.supabase_home.benchmarks.bench_codec import (
+    make_rows,
+)
+from app.core.third_party_integrations.supabase_home.sdk.columns import rows_to_columns
+from app.core.third_party_integrations.supabase_home.sdk.rows import (
+    DEFAULT_ROW_KIND,
+    make_row_type,
+    rows_decoder,
+    select_fields,
+)
+from app.core.third_party_integrations.supabase_home.sdk.schema import SchemaCatalog
+from app.core.third_party_integrations.supabase_home.transport.codec import (
+    get_codec,
+    msgspec,
+)
+
+# * The OpenAPI description PostgREST would publish for `make_rows` rows
+OPENAPI = {
+    "definitions": {
+        "items": {
+            "required": ["id", "uuid", "name", "price", "active", "created_at"],
+            "properties": {
+                "id": {"type": "integer", "format": "bigint"},
+                "uuid": {"type": "string", "format": "uuid"},
+                "name": {"type": "string", "format": "text"},
+                "description": {"type": "string", "format": "text"},
+                "price": {"type": "number", "format": "double precision"},
+                "active": {"type": "boolean", "format": "boolean"},
+                "tags": {"type": "array", "format": "text[]"},
+                "metadata": {"format": "jsonb"},
+                "created_at": {"type": "string", "format": "timestamp with time zone"},
+                "user_id": {"type": "string", "format": "uuid"},
+            },
+        }
+    }
+}
+
+
+def retained(decode, body: bytes) -> tuple[list, int, int]:
+    """Decode once and return the result, the bytes it keeps alive and the peak."""
+    gc.collect()
+    tracemalloc.start()
+    result = decode(body)
+    size, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, size, peak
+
+
+def columns_decoder(table):
+    """The `fetch_columns` path: decode into compact records, then transpose."""
+    row_type = make_row_type(table, "*", DEFAULT_ROW_KIND)
+    decode = rows_decoder(row_type)
+    fields = select_fields(table, "*")
+    return lambda body: rows_to_columns(decode(body), row_type, fields)
+
+
+def main(rows: int = 100_000) -> None:
+    body = get_codec("json").encode(make_rows(rows))
+    table = SchemaCatalog.from_openapi(OPENAPI).table("items")
+    codec = get_codec()
+    print(f"{rows} rows, {len(body) / 1_000_000:.1f} MB encoded, codec {codec.name}\n")
+
+    decoders = {"dict": codec.decode}
+    kinds = ("struct", "dataclass", "namedtuple") if msgspec is not None else ("dataclass", "namedtuple")
+    for kind in kinds:
+        decoders[kind] = rows_decoder(make_row_type(table, "*", kind))
+    # * Columns keep little, but every row's record is alive at the peak
+    decoders["columns"] = columns_decoder(table)
+
+    print(f"  {'rows':<12} {'memory':>10} {'per row':>9} {'peak':>10} {'decode':>11}")
+    baseline = None
+    for label, decode in decoders.items():
+        result, size, peak = retained(decode, body)
+        column = next(iter(result.values())) if isinstance(result, dict) else result
+        assert len(column) == rows
+        del result
+        seconds = min(timeit.repeat(lambda: decode(body), number=1, repeat=3))
+        baseline = baseline or size
+        print(
+            f"  {label:<12} {size / 1_000_000:8.1f} MB {size / rows:7.0f} B "
+            f"{peak / 1_000_000:7.1f} MB {seconds * 1000:8.1f} ms  "
+            f"({size / baseline:.0%} of dict memory)"
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
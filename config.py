@@ -21,12 +21,179 @@ class SupabaseConfig(BaseModel):
     timeout: int = Field(
         default=30, description="Default HTTP timeout for Supabase requests (seconds)"
     )
+    connect_timeout: float = Field(
+        default=5.0, description="Timeout for establishing a connection (seconds)"
+    )
+    read_timeout: float | None = Field(
+        default=None,
+        description="Timeout waiting for response data (seconds); defaults to `timeout`",
+    )
+    pool_timeout: float = Field(
+        default=5.0, description="Timeout waiting for a pooled connection (seconds)"
+    )
+    deadline_min_remaining: float = Field(
+        default=0.05,
+        description="Calls with less deadline budget left than this fail fast (seconds)",
+    )
     retry_attempts: int = Field(
         default=3, description="Number of retry attempts for failed Supabase requests"
     )
+    retry_backoff_base: float = Field(
+        default=0.2, description="Base backoff delay between retries (seconds)"
+    )
+    retry_backoff_max: float = Field(
+        default=5.0, description="Maximum backoff delay for a single retry (seconds)"
+    )
+    retry_total_timeout: float = Field(
+        default=30.0,
+        description="Total time budget across all attempts of one request (seconds)",
+    )
+    circuit_breaker_failure_threshold: int = Field(
+        default=5, description="Consecutive failures that open a service-area circuit"
+    )
+    circuit_breaker_recovery_timeout: float = Field(
+        default=30.0, description="Seconds an open circuit waits before probing again"
+    )
+    circuit_breaker_half_open_max_calls: int = Field(
+        default=1, description="Concurrent probe requests allowed while half-open"
+    )
+    concurrency_initial_limit: int = Field(
+        default=20, description="Initial concurrent requests allowed per service area"
+    )
+    concurrency_min_limit: int = Field(
+        default=1, description="Lower bound for the adaptive concurrency limit"
+    )
+    concurrency_max_limit: int = Field(
+        default=200, description="Upper bound for the adaptive concurrency limit"
+    )
+    concurrency_max_wait: float = Field(
+        default=5.0, description="Seconds a request may queue for a concurrency slot"
+    )
+    concurrency_max_queue: int = Field(
+        default=1000, description="Maximum requests queued per service area"
+    )
     enable_logging: bool = Field(
         default=True, description="Enable detailed logging for Supabase integration"
     )
+    max_connections: int = Field(
+        default=100, description="Maximum number of pooled HTTP connections"
+    )
+    max_keepalive_connections: int = Field(
+        default=20, description="Maximum number of idle keep-alive connections"
+    )
+    keepalive_expiry: float = Field(
+        default=30.0, description="Seconds an idle keep-alive connection is kept open"
+    )
+    http2: bool = Field(
+        default=False, description="Enable HTTP/2 for the pooled client (requires h2)"
+    )
+    json_codec: str = Field(
+        default="auto",
+        description="JSON backend for bodies: auto, msgspec, orjson or json (stdlib)",
+    )
+    fanout_max_concurrency: int = Field(
+        default=8, description="Default concurrency for fan-out helpers such as fetch_many"
+    )
+    bulk_chunk_rows: int = Field(
+        default=500, description="Maximum rows per request for bulk inserts/upserts"
+    )
+    bulk_chunk_bytes: int = Field(
+        default=1024 * 1024,
+        description="Maximum encoded request body size for bulk inserts/upserts",
+    )
+    write_buffer_max_rows: int = Field(
+        default=500, description="Rows that trigger a write-behind flush for a table"
+    )
+    write_buffer_max_bytes: int = Field(
+        default=512 * 1024, description="Encoded bytes that trigger a write-behind flush"
+    )
+    write_buffer_flush_interval: float = Field(
+        default=1.0, description="Maximum seconds a row waits in the write-behind buffer"
+    )
+    write_buffer_max_pending_rows: int = Field(
+        default=10_000,
+        description="Queued plus in-flight rows per table before add() waits",
+    )
+    enable_query_cache: bool = Field(
+        default=False, description="Cache fetch_data results for tables with a TTL"
+    )
+    query_cache_max_bytes: int = Field(
+        default=32 * 1024 * 1024, description="Maximum size of the database query cache"
+    )
+    query_cache_default_ttl: float = Field(
+        default=0.0,
+        description="Seconds query results stay fresh; 0 caches only tables in query_cache_table_ttls",
+    )
+    query_cache_table_ttls: dict[str, float] = Field(
+        default_factory=dict, description="Per-table query cache TTLs in seconds"
+    )
+    query_cache_stale_ttl: float = Field(
+        default=30.0,
+        description="Seconds an expired result is still served while it is refreshed",
+    )
+    query_cache_live_ttl: float = Field(
+        default=3600.0,
+        description="Query cache TTL for tables kept current by realtime change events",
+    )
+    loader_max_url_length: int = Field(
+        default=8000,
+        description="URL length budget for batched in.(...) key lookups",
+    )
+    schema_cache_ttl: float = Field(
+        default=300.0,
+        description="Seconds the table schema from the PostgREST OpenAPI document is reused",
+    )
+    schema_cache_path: str | None = Field(
+        default=None,
+        description="File that keeps the OpenAPI schema across restarts (None: memory only)",
+    )
+    validate_columns: bool = Field(
+        default=False,
+        description="Check selected, filtered and ordered columns against the cached schema before querying",
+    )
+    enable_single_flight: bool = Field(
+        default=False,
+        description="Coalesce concurrent identical GET requests into one upstream call",
+    )
+    enable_hedging: bool = Field(
+        default=False,
+        description="Send a duplicate request when an idempotent read is slower than usual",
+    )
+    hedge_percentile: float = Field(
+        default=0.95, description="Observed latency percentile after which to hedge"
+    )
+    hedge_min_delay: float = Field(
+        default=0.01, description="Minimum delay before sending a hedge (seconds)"
+    )
+    hedge_max_delay: float = Field(
+        default=2.0, description="Maximum delay before sending a hedge (seconds)"
+    )
+    hedge_max_ratio: float = Field(
+        default=0.1, description="Maximum extra load from hedges, as a fraction of reads"
+    )
+    enable_http_cache: bool = Field(
+        default=False,
+        description="Cache GET responses and revalidate them with ETag/Last-Modified",
+    )
+    http_cache_max_bytes: int = Field(
+        default=64 * 1024 * 1024, description="Maximum size of the HTTP response cache"
+    )
+    http_cache_default_ttl: float = Field(
+        default=0.0,
+        description="Seconds a cached response is served without revalidation",
+    )
+    http_cache_route_ttls: dict[str, float] = Field(
+        default_factory=dict,
+        description="Per-route TTL overrides keyed by endpoint prefix, e.g. {'/storage/v1/bucket': 60}",
+    )
+    log_sample_rates: dict[str, float] = Field(
+        default_factory=lambda: {"2xx": 1.0, "3xx": 1.0, "4xx": 1.0, "5xx": 1.0},
+        description="Fraction of requests logged per status class",
+    )
+    log_redact_fields: list[str] = Field(
+        default_factory=list,
+        description="Extra header/body field names to redact from request logs",
+    )
     # * Add more advanced or project-specific options as needed
 
     model_config = {"arbitrary_types_allowed": True}
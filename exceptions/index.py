@@ -17,3 +17,36 @@ class SupabaseAPIError(SupabaseError):
         self.status_code = status_code
         self.details = details or {}
         super().__init__(message)
+
+
+class SupabaseCircuitOpenError(SupabaseError):
+    """Exception raised when a circuit breaker rejects a request without sending it"""
+
+    def __init__(self, area: str, retry_in: float = 0.0):
+        self.area = area
+        self.retry_in = retry_in
+        super().__init__(
+            f"Supabase {area} circuit is open; retry in {retry_in:.1f}s"
+        )
+
+
+class SupabaseConcurrencyLimitError(SupabaseError):
+    """Exception raised when a request waits too long for a concurrency slot"""
+
+    def __init__(self, area: str, waited: float):
+        self.area = area
+        self.waited = waited
+        super().__init__(
+            f"Supabase {area} concurrency limit reached; gave up after {waited:.2f}s"
+        )
+
+
+class SupabaseDeadlineExceededError(SupabaseError):
+    """Exception raised when the request deadline leaves no time for a Supabase call"""
+
+    def __init__(self, operation: str, remaining: float):
+        self.operation = operation
+        self.remaining = remaining
+        super().__init__(
+            f"Deadline exceeded before {operation} ({remaining * 1000:.0f}ms remaining)"
+        )
@@ -1,8 +1,10 @@
 from typing import Any
 
 from ..client import get_supabase_client  # ! Use the unified client
+from ..transport.instrumentation import instrument_class
 
 
+@instrument_class("auth")
 class SupabaseAuthService:
     def get_current_user(self) -> dict[str, Any] | None:
         """
@@ -44,6 +46,7 @@ class SupabaseAuthService:
         client = await get_supabase_client()
         return cls(client)
 
+    @instrument_class("auth.admin")
     class Admin:
         def __init__(self, auth):
             self.admin = getattr(auth, "admin", None)
@@ -93,6 +96,7 @@ class SupabaseAuthService:
                 raise NotImplementedError("Admin MFA management not available in SDK")
             return self.admin.mfa.delete_factor({"id": factor_id, "user_id": user_id})
 
+    @instrument_class("auth.mfa")
     class MFA:
         def __init__(self, auth):
             self.mfa = getattr(auth, "mfa", None)
@@ -127,6 +131,7 @@ class SupabaseAuthService:
                 raise NotImplementedError("MFA is not available in this SDK version")
             return self.mfa.get_authenticator_assurance_level()
 
+    @instrument_class("auth.session")
     class Session:
         def __init__(self, auth):
             self.auth = auth
@@ -143,6 +148,7 @@ class SupabaseAuthService:
         def set_session(self, data: dict[str, Any]) -> Any:
             return self.auth.set_session(data)
 
+    @instrument_class("auth.user")
     class User:
         def __init__(self, auth):
             self.auth = auth
@@ -0,0 +1,174 @@
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable, Iterable, Iterator
+from typing import Any
+
+import httpx
+from postgrest.exceptions import APIError
+
+logger = logging.getLogger("apps.supabase_home")
+
+# * Postgres errors worth retrying: serialization failure, deadlock, query
+# * cancelled by statement_timeout, too many connections, cannot connect now
+RETRYABLE_PG_CODES = frozenset({"40001", "40P01", "57014", "53300", "57P03"})
+
+
+def is_retryable_write_error(error: BaseException, idempotent: bool = False) -> bool:
+    """
+    Whether a failed write chunk may be sent again.
+
+    Transient Postgres errors rolled the write back and are always retryable;
+    constraint violations, bad columns and other data errors are not. Transport
+    errors follow `RetryPolicy.is_retryable_error`: connect and pool failures
+    never reached the server, while a read timeout or dropped connection may
+    have committed the rows, so it is only retried when `idempotent`.
+
+    Args:
+        idempotent: The write can be replayed safely (an upsert on `on_conflict`)
+    """
+    if isinstance(error, APIError):
+        return error.code is None or error.code in RETRYABLE_PG_CODES
+    if isinstance(error, (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)):
+        return True
+    return idempotent and isinstance(error, (httpx.TransportError, asyncio.TimeoutError))
+
+
+def chunk_records(
+    records: Iterable[dict[str, Any]],
+    max_rows: int,
+    max_bytes: int | None = None,
+    encode: Callable[[Any], bytes] | None = None,
+) -> Iterator[list[dict[str, Any]]]:
+    """
+    Split records into chunks of at most `max_rows` rows and about `max_bytes`
+    encoded bytes. A single row larger than `max_bytes` is sent on its own.
+
+    Records are consumed lazily, so generators are not materialized.
+    """
+    if max_rows < 1:
+        raise ValueError("max_rows must be at least 1")
+    chunk: list[dict[str, Any]] = []
+    size = 2  # * the surrounding "[]"
+    for record in records:
+        row_size = len(encode(record)) + 1 if max_bytes and encode else 0
+        if chunk and (len(chunk) >= max_rows or (max_bytes and size + row_size > max_bytes)):
+            yield chunk
+            chunk, size = [], 2
+        chunk.append(record)
+        size += row_size
+    if chunk:
+        yield chunk
+
+
+class ChunkResult:
+    """
+    Outcome of one chunk: its position, rows, attempts and either the returned
+    data or the error that made it fail.
+    """
+
+    __slots__ = ("index", "rows", "attempts", "data", "error")
+
+    def __init__(self, index: int, rows: list[dict[str, Any]]):
+        self.index = index
+        self.rows = rows
+        self.attempts = 0
+        self.data: list[dict[str, Any]] | None = None
+        self.error: BaseException | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def __repr__(self) -> str:
+        status = "ok" if self.ok else f"failed: {self.error!r}"
+        return f"ChunkResult(index={self.index}, rows={len(self.rows)}, attempts={self.attempts}, {status})"
+
+
+class BulkWriteResult:
+    """
+    Per-chunk results of a bulk write, in input order.
+    """
+
+    def __init__(self, chunks: list[ChunkResult]):
+        self.chunks = chunks
+
+    @property
+    def ok(self) -> bool:
+        return all(chunk.ok for chunk in self.chunks)
+
+    @property
+    def written(self) -> int:
+        return sum(len(chunk.rows) for chunk in self.chunks if chunk.ok)
+
+    @property
+    def failed(self) -> list[ChunkResult]:
+        return [chunk for chunk in self.chunks if not chunk.ok]
+
+    @property
+    def failed_rows(self) -> list[dict[str, Any]]:
+        return [row for chunk in self.failed for row in chunk.rows]
+
+    @property
+    def data(self) -> list[dict[str, Any]]:
+        """Rows returned by the server (empty with `returning="minimal"`)."""
+        return [row for chunk in self.chunks if chunk.data for row in chunk.data]
+
+    def raise_for_failures(self) -> None:
+        failed = self.failed
+        if failed:
+            raise failed[0].error
+
+    def __repr__(self) -> str:
+        return f"BulkWriteResult(chunks={len(self.chunks)}, written={self.written}, failed={len(self.failed)})"
+
+
+async def write_chunks(
+    chunks: Iterable[list[dict[str, Any]]],
+    send: Callable[[list[dict[str, Any]]], Awaitable[Any]],
+    max_concurrency: int = 4,
+    retries: int = 2,
+    backoff: Callable[[int], float] = lambda attempt: 0.5 * attempt,
+    is_retryable: Callable[[BaseException], bool] = is_retryable_write_error,
+) -> BulkWriteResult:
+    """
+    Send chunks through a bounded pipeline: at most `max_concurrency` requests
+    are in flight and the next chunk is only built once a slot frees up.
+
+    Failures never abort the other chunks; they are recorded on the chunk's
+    `ChunkResult` after `retries` extra attempts (or immediately when the error
+    is not retryable).
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def run(result: ChunkResult) -> ChunkResult:
+        try:
+            while True:
+                result.attempts += 1
+                try:
+                    result.data = await send(result.rows)
+                    result.error = None
+                    return result
+                except Exception as e:
+                    result.error = e
+                    if result.attempts > retries or not is_retryable(e):
+                        logger.warning(
+                            "Bulk write chunk %d (%d rows) failed after %d attempt(s): %s",
+                            result.index,
+                            len(result.rows),
+                            result.attempts,
+                            e,
+                        )
+                        return result
+                    await asyncio.sleep(backoff(result.attempts))
+        finally:
+            semaphore.release()
+
+    tasks = []
+    try:
+        for index, rows in enumerate(chunks):
+            await semaphore.acquire()
+            tasks.append(asyncio.ensure_future(run(ChunkResult(index, rows))))
+        return BulkWriteResult(list(await asyncio.gather(*tasks)))
+    finally:
+        for task in tasks:
+            task.cancel()
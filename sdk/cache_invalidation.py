@@ -0,0 +1,93 @@
+import inspect
+import logging
+from collections.abc import Iterable
+from typing import Any
+
+from app.core.third_party_integrations.supabase_home.sdk.query_cache import QueryCache
+
+logger = logging.getLogger("apps.supabase_home")
+
+SUBSCRIBED = "SUBSCRIBED"
+
+
+class RealtimeCacheInvalidator:
+    """
+    Keeps `QueryCache` entries current from Realtime `postgres_changes` events.
+
+    While the channel is subscribed, watched tables are marked live: their
+    queries stay cached for `live_ttl` and every INSERT/UPDATE/DELETE evicts
+    the queries that read the table (a change can add rows to or remove rows
+    from any filtered result, so whole-table eviction is the only safe patch).
+    When the channel closes, errors or times out, the tables drop back to
+    TTL-only caching and their entries are evicted, since events may have been
+    missed. A later successful (re)subscribe marks them live again.
+    """
+
+    def __init__(
+        self,
+        realtime: Any,
+        cache: QueryCache,
+        tables: Iterable[str],
+        schema: str = "public",
+        channel_name: str = "query-cache-invalidation",
+    ):
+        self.realtime = realtime
+        self.cache = cache
+        self.tables = list(tables)
+        self.schema = schema
+        self.channel_name = channel_name
+        self.events = 0
+        self.connected = False
+
+    async def start(self) -> None:
+        """Subscribe to change events for the watched tables."""
+        await self.realtime.subscribe_to_postgres_changes(
+            self.channel_name,
+            self.tables,
+            self._on_change,
+            schema=self.schema,
+            on_subscribe=self._on_status,
+        )
+
+    async def stop(self) -> None:
+        """Unsubscribe and fall back to TTL-only caching."""
+        self._set_connected(False)
+        result = self.realtime.remove_channel(self.channel_name)
+        if inspect.isawaitable(result):
+            await result
+
+    async def __aenter__(self) -> "RealtimeCacheInvalidator":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.stop()
+
+    def mark_disconnected(self) -> None:
+        """Call when the socket is known to be down before the channel reports it."""
+        self._set_connected(False)
+
+    def _on_status(self, status: Any, error: Exception | None = None) -> None:
+        status = getattr(status, "value", status)
+        if status == SUBSCRIBED:
+            logger.info("Realtime cache invalidation live for %s", ", ".join(self.tables))
+            self._set_connected(True)
+        else:
+            logger.warning(
+                "Realtime cache invalidation %s (%s); falling back to TTL caching",
+                status,
+                error,
+            )
+            self._set_connected(False)
+
+    def _on_change(self, table: str, payload: Any) -> None:
+        self.events += 1
+        self.cache.invalidate_table(table)
+
+    def _set_connected(self, connected: bool) -> None:
+        self.connected = connected
+        for table in self.tables:
+            self.cache.set_live(table, connected)
+
+    def stats(self) -> dict[str, Any]:
+        return {"connected": self.connected, "events": self.events, "tables": list(self.tables)}
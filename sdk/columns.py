@@ -0,0 +1,89 @@
+import dataclasses
+import decimal
+import math
+import sys
+import types
+import typing
+from array import array
+from collections.abc import Sequence
+from typing import Any
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover - optional dependency
+    numpy = None
+
+_NUMERIC = (int, float, decimal.Decimal)
+
+
+def _base_type(type_: Any) -> tuple[Any, bool]:
+    """`(type, nullable)` for `T` or `T | None`."""
+    if isinstance(type_, types.UnionType) or typing.get_origin(type_) is typing.Union:
+        args = [arg for arg in typing.get_args(type_) if arg is not type(None)]
+        return (args[0] if len(args) == 1 else Any), True
+    return type_, False
+
+
+def build_column(values: list[Any], type_: Any, use_numpy: bool = False) -> Any:
+    """
+    Pack one column's values by type: `array("q")`/`array("d")` (or NumPy
+    int64/float64) for numbers, `array("b")` (or NumPy bool) for booleans
+    without NULLs, interned strings in a list, anything else as a list.
+
+    NULLs in numeric columns become NaN, so integer columns with NULLs are
+    returned as floats. `Decimal` columns are packed as floats as well; read
+    them with `fetch_data` where exact values matter.
+    """
+    base, _ = _base_type(type_)
+    if base in _NUMERIC:
+        has_null = None in values
+        if has_null:
+            values = [math.nan if value is None else value for value in values]
+        if base is int and not has_null:
+            return numpy.array(values, dtype=numpy.int64) if use_numpy else array("q", values)
+        return numpy.array(values, dtype=numpy.float64) if use_numpy else array("d", values)
+    if base is bool and None not in values:
+        return numpy.array(values, dtype=numpy.bool_) if use_numpy else array("b", values)
+    if base is str:
+        # * Repeated values (statuses, categories) then share one string object
+        intern = sys.intern
+        return [value if value is None else intern(value) for value in values]
+    return values
+
+
+def _attributes(row_type: type) -> Sequence[str]:
+    names = getattr(row_type, "__struct_fields__", None)
+    if names is None:
+        names = [field.name for field in dataclasses.fields(row_type)]
+    return names
+
+
+def rows_to_columns(
+    rows: list[Any],
+    row_type: type,
+    fields: Sequence[tuple[str, Any]],
+    use_numpy: bool = False,
+) -> dict[str, Any]:
+    """
+    Transpose decoded records (msgspec Structs or dataclasses of `row_type`)
+    into packed columns keyed by `fields` names.
+    """
+    columns = {}
+    for (name, type_), attribute in zip(fields, _attributes(row_type)):
+        values = [getattr(row, attribute) for row in rows]
+        columns[name] = build_column(values, type_, use_numpy)
+    return columns
+
+
+def dicts_to_columns(rows: list[dict[str, Any]], use_numpy: bool = False) -> dict[str, Any]:
+    """Transpose dict rows, packing columns by the Python types of their values."""
+    names = list(rows[0]) if rows else []
+    columns = {}
+    for name in names:
+        values = [row.get(name) for row in rows]
+        kinds = {type(value) for value in values if value is not None}
+        if kinds == {int, float}:
+            kinds = {float}
+        type_ = kinds.pop() if len(kinds) == 1 else Any
+        columns[name] = build_column(values, type_, use_numpy)
+    return columns
@@ -1,37 +1,175 @@
+import asyncio
+import functools
+import hashlib
+import inspect
+import logging
+from collections.abc import (
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterable,
+    Iterator,
+    Mapping,
+    Sequence,
+)
 from typing import Any
 
+import httpx
+from postgrest.exceptions import APIError
+from postgrest.types import ReturnMethod
+
 from app.core.third_party_integrations.supabase_home.client import get_supabase_client
+from app.core.third_party_integrations.supabase_home.config import supabase_config
+from app.core.third_party_integrations.supabase_home.sdk.bulk import (
+    BulkWriteResult,
+    chunk_records,
+    is_retryable_write_error,
+    write_chunks,
+)
+from app.core.third_party_integrations.supabase_home.sdk.cache_invalidation import (
+    RealtimeCacheInvalidator,
+)
+from app.core.third_party_integrations.supabase_home.sdk.columns import (
+    dicts_to_columns,
+    numpy,
+    rows_to_columns,
+)
+from app.core.third_party_integrations.supabase_home.sdk.embed import (
+    Embed,
+    apply_embeds,
+    render_select,
+    validate_embeds,
+)
+from app.core.third_party_integrations.supabase_home.sdk.filters import (
+    FilterLike,
+    apply_filter,
+    as_filter,
+    compile_filter,
+)
+from app.core.third_party_integrations.supabase_home.sdk.loader import (
+    KeyLoader,
+    LoaderRegistry,
+)
+from app.core.third_party_integrations.supabase_home.sdk.pagination import (
+    KeysetCursor,
+    apply_keyset,
+    ensure_selected,
+)
+from app.core.third_party_integrations.supabase_home.sdk.query_cache import (
+    QueryCache,
+    embedded_tables,
+)
+from app.core.third_party_integrations.supabase_home.sdk.rows import (
+    DEFAULT_ROW_KIND,
+    make_row_type,
+    rows_decoder,
+    select_fields,
+)
+from app.core.third_party_integrations.supabase_home.sdk.scan import (
+    Partition,
+    ScanProgress,
+    compute_split_points,
+    partitions_from_points,
+    scan_partitions,
+)
+from app.core.third_party_integrations.supabase_home.sdk.schema import (
+    SchemaCache,
+    SchemaCatalog,
+    fetch_openapi,
+)
+from app.core.third_party_integrations.supabase_home.sdk.write_buffer import (
+    WriteBehindBuffer,
+)
+from app.core.third_party_integrations.supabase_home.transport.codec import get_codec
+from app.core.third_party_integrations.supabase_home.transport.fanout import (
+    gather_bounded,
+    gather_mapping,
+)
+from app.core.third_party_integrations.supabase_home.transport.hedging import hedger
+from app.core.third_party_integrations.supabase_home.transport.http_cache import (
+    HTTPCache,
+)
+from app.core.third_party_integrations.supabase_home.transport.instrumentation import (
+    instrument_class,
+)
+from app.core.third_party_integrations.supabase_home.transport.retry import (
+    RetryPolicy,
+)
+from app.core.third_party_integrations.supabase_home.transport.singleflight import (
+    request_key,
+)
+from app.core.third_party_integrations.supabase_home.transport.tracing import (
+    set_span_attribute,
+)
+
+logger = logging.getLogger("apps.supabase_home")
 
 
+@instrument_class("database")
 class SupabaseDatabaseService:
     """
     Service for interacting with Supabase Database (PostgreSQL) using supabase-py SDK.
     Provides methods for table, row, and function operations.
+    All operations are coroutines; use `gather`/`fetch_many` to run several at once.
     """
 
     def __init__(self, client):
         self.client = client
+        self.codec = get_codec(supabase_config.json_codec)
+        self.query_cache = QueryCache.from_config(supabase_config)
+        self.http_cache = HTTPCache.from_config(supabase_config)
+        self.schema_cache = SchemaCache.from_config(
+            supabase_config, lambda: fetch_openapi(self.client)
+        )
 
-async def get_database_service():
-    client = await get_supabase_client()
-    return SupabaseDatabaseService(client)
-
-    def fetch_data(
+    async def fetch_data(
         self,
         table: str,
         select: str = "*",
-        filters: dict[str, Any] | None = None,
+        filters: FilterLike | None = None,
         order: str | None = None,
         limit: int | None = None,
         offset: int | None = None,
-    ) -> list[dict[str, Any]]:
+        hedge: bool = False,
+        cache: bool | None = None,
+        embed: Sequence[Embed] = (),
+        as_type: Any = None,
+        revalidate: bool | None = None,
+    ) -> list[Any]:
         """
         Fetch data from a table with optional filtering, ordering, and pagination.
+        `filters` is an equality dict or a `sdk.filters` expression, evaluated by
+        PostgREST. With `hedge=True` a slow read is duplicated after the observed
+        p95 latency and the first response wins.
+
+        `embed` loads related rows in the same request, nested under each row
+        (see `sdk.embed.Embed`), instead of one query per parent. Embedded
+        queries, and every query when `SupabaseConfig.validate_columns` is set,
+        are checked against the cached schema before the request is sent.
+
+        `as_type` decodes the response body straight into typed records instead
+        of dicts, validating every field: a msgspec Struct, dataclass, named
+        tuple or pydantic model, or "struct"/"dataclass"/"namedtuple" for a type
+        generated from the table schema (see `row_type`).
+
+        With `cache` (default: `SupabaseConfig.enable_query_cache` for tables that
+        have a TTL) results are served from `query_cache`, keyed by the query and
+        the caller's auth scope, and evicted by writes through this service.
+        Cached results are shared, so callers must not mutate them.
+
+        With `revalidate` (default: `SupabaseConfig.enable_http_cache`) the read
+        goes through `http_cache`: fresh entries are served per the route TTL and
+        stale ones are revalidated with If-None-Match/If-Modified-Since, so an
+        unchanged reference table answers 304 without a body or decode.
         """
-        query = self.client.table(table).select(select)
-        if filters:
-            for k, v in filters.items():
-                query = query.eq(k, v)
+        await self._validate_query(table, select, filters, order, embed)
+        if isinstance(as_type, str):
+            # ? Rendering the embeds into the select makes the generated type reject them
+            as_type = await self.row_type(table, render_select(select, embed), as_type)
+        if embed:
+            select = render_select(select, embed)
+        query = apply_filter(self.client.table(table).select(select), filters)
+        query = apply_embeds(query, embed)
         if order:
             query = query.order(order)
         if limit is not None:
@@ -42,9 +180,92 @@ async def get_database_service():
                 if limit
                 else query.range(offset, 999999)
             )
-        return query.execute().data
+        if revalidate is None:
+            revalidate = supabase_config.enable_http_cache
+        if as_type is not None or revalidate:
+            decode = rows_decoder(as_type) if as_type is not None else self.codec.decode
+
+            async def send() -> list[Any]:
+                if revalidate:
+                    return await self._fetch_revalidated(query, decode, as_type)
+                return decode(await self._fetch_body(query))
+
+            if hedge:
+                load = lambda: hedger.run(("database.fetch_data", table), send, service="database")  # noqa: E731
+            else:
+                load = send
+        elif hedge:
+            load = lambda: self._execute_hedged(("database.fetch_data", table), query)  # noqa: E731
+        else:
+            load = lambda: self._execute(query)  # noqa: E731
+        if cache is None:
+            cache = supabase_config.enable_query_cache and self.query_cache.caches(table)
+        if not cache:
+            return await load()
+        expression = as_filter(filters)
+        key = (
+            table,
+            select,
+            tuple(compile_filter(expression)) if expression is not None else (),
+            order,
+            limit,
+            offset,
+            tuple(child.key() for child in embed),
+            as_type,
+            self._cache_scope(),
+        )
+        return await self.query_cache.get_or_load(
+            key,
+            table,
+            frozenset({table, *embedded_tables(select)}),
+            load,
+            lambda rows: len(self.codec.encode(rows)),
+        )
+
+    async def fetch_columns(
+        self,
+        table: str,
+        select: str = "*",
+        filters: FilterLike | None = None,
+        order: str | None = None,
+        limit: int | None = None,
+        offset: int | None = None,
+        use_numpy: bool | None = None,
+    ) -> dict[str, Any]:
+        """
+        Fetch rows as columns for aggregation: column name -> packed values.
 
-    def insert_data(
+        Numbers come back as `array("q")`/`array("d")`, or NumPy int64/float64
+        arrays when NumPy is installed (`use_numpy`, default: when available).
+        Booleans without NULLs are packed the same way, strings are interned,
+        and other types stay lists. NULLs in numeric columns become NaN.
+
+        Column types come from the schema catalog. The response body is decoded
+        into compact records (see `fetch_data(as_type=...)`), one per row, which
+        are transposed and then released; peak memory therefore still grows with
+        the row count (`benchmarks/bench_rows.py` reports it). `Decimal` values
+        are packed as floats. When the schema is unavailable the rows are
+        decoded as dicts and packed by value type.
+        """
+        if use_numpy is None:
+            use_numpy = numpy is not None
+        elif use_numpy and numpy is None:
+            logger.warning("NumPy is not installed; returning Python arrays")
+            use_numpy = False
+        try:
+            schema = await self.schema_cache.get()
+        except Exception as e:
+            logger.warning("Schema unavailable, columns of '%s' packed by value type: %s", table, e)
+            rows = await self.fetch_data(table, select, filters, order, limit, offset, cache=False)
+            return dicts_to_columns(rows, use_numpy)
+        table_schema = schema.table(table)
+        row_type = make_row_type(table_schema, select, DEFAULT_ROW_KIND)
+        rows = await self.fetch_data(
+            table, select, filters, order, limit, offset, cache=False, as_type=row_type
+        )
+        return rows_to_columns(rows, row_type, select_fields(table_schema, select), use_numpy)
+
+    async def insert_data(
         self,
         table: str,
         data: dict[str, Any] | list[dict[str, Any]],
@@ -54,25 +275,30 @@ async def get_database_service():
         Insert data into a table.
         """
         query = self.client.table(table)
-        if upsert:
-            return query.upsert(data).execute().data
-        return query.insert(data).execute().data
+        try:
+            if upsert:
+                return await self._execute(query.upsert(data))
+            return await self._execute(query.insert(data))
+        finally:
+            self._invalidate(table)
 
-    def update_data(
+    async def update_data(
         self,
         table: str,
         data: dict[str, Any],
-        filters: dict[str, Any],
+        filters: FilterLike,
     ) -> list[dict[str, Any]]:
         """
         Update data in a table.
         """
-        query = self.client.table(table)
-        for k, v in filters.items():
-            query = query.eq(k, v)
-        return query.update(data).execute().data
+        # ! Filters apply to the update builder, not to the bare table
+        query = apply_filter(self.client.table(table).update(data), filters)
+        try:
+            return await self._execute(query)
+        finally:
+            self._invalidate(table)
 
-    def upsert_data(
+    async def upsert_data(
         self,
         table: str,
         data: dict[str, Any] | list[dict[str, Any]],
@@ -80,18 +306,131 @@ async def get_database_service():
         """
         Upsert data in a table (insert or update).
         """
-        return self.insert_data(table, data, upsert=True)
+        return await self.insert_data(table, data, upsert=True)
 
-    def delete_data(self, table: str, filters: dict[str, Any]) -> list[dict[str, Any]]:
+    async def delete_data(self, table: str, filters: FilterLike) -> list[dict[str, Any]]:
         """
         Delete data from a table.
         """
-        query = self.client.table(table)
-        for k, v in filters.items():
-            query = query.eq(k, v)
-        return query.delete().execute().data
+        query = apply_filter(self.client.table(table).delete(), filters)
+        try:
+            return await self._execute(query)
+        finally:
+            self._invalidate(table)
+
+    async def bulk_insert(
+        self,
+        table: str,
+        records: Iterable[dict[str, Any]],
+        upsert: bool = False,
+        on_conflict: str = "",
+        ignore_duplicates: bool = False,
+        returning: str = "minimal",
+        chunk_rows: int | None = None,
+        chunk_bytes: int | None = None,
+        max_concurrency: int | None = None,
+        retries: int = 2,
+    ) -> BulkWriteResult:
+        """
+        Insert (or upsert) many records as concurrent, size-bounded chunks.
+
+        Chunks are capped at `chunk_rows` rows and `chunk_bytes` encoded bytes so
+        requests stay under PostgREST body limits. Transient failures are retried
+        per chunk; the result reports each chunk's outcome and the rows of the
+        chunks that failed, so callers can fix and resend only those.
+
+        Args:
+            records: Rows to write; iterables are consumed lazily
+            upsert: Merge on `on_conflict` (or the primary key) instead of inserting
+            ignore_duplicates: With `upsert`, skip conflicting rows instead of updating
+            returning: "minimal" (default, nothing is sent back) or "representation"
+            chunk_rows: Rows per request (defaults to `SupabaseConfig.bulk_chunk_rows`)
+            chunk_bytes: Encoded bytes per request (defaults to
+                `SupabaseConfig.bulk_chunk_bytes`)
+            max_concurrency: Chunks in flight at once (defaults to
+                `SupabaseConfig.fanout_max_concurrency`)
+            retries: Extra attempts for a chunk that fails with a transient error
+        """
+        returning_method = ReturnMethod(returning)
+
+        async def send(rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
+            query = self.client.table(table)
+            if upsert:
+                query = query.upsert(
+                    rows,
+                    returning=returning_method,
+                    on_conflict=on_conflict,
+                    ignore_duplicates=ignore_duplicates,
+                )
+            else:
+                query = query.insert(rows, returning=returning_method)
+            return await self._execute(query)
+
+        chunks = chunk_records(
+            records,
+            chunk_rows or supabase_config.bulk_chunk_rows,
+            chunk_bytes or supabase_config.bulk_chunk_bytes,
+            self.codec.encode,
+        )
+        try:
+            return await write_chunks(
+                chunks,
+                send,
+                max_concurrency=max_concurrency or supabase_config.fanout_max_concurrency,
+                retries=retries,
+                backoff=RetryPolicy.from_config(supabase_config).backoff,
+                is_retryable=functools.partial(
+                    is_retryable_write_error, idempotent=upsert and bool(on_conflict)
+                ),
+            )
+        finally:
+            self._invalidate(table)
+
+    async def bulk_upsert(
+        self, table: str, records: Iterable[dict[str, Any]], **kwargs: Any
+    ) -> BulkWriteResult:
+        """
+        `bulk_insert` with `upsert=True`.
+        """
+        return await self.bulk_insert(table, records, upsert=True, **kwargs)
+
+    async def watch_tables(
+        self, realtime: Any, tables: Sequence[str], schema: str = "public"
+    ) -> RealtimeCacheInvalidator:
+        """
+        Keep cached queries on `tables` current from Realtime change events, so they
+        can use `SupabaseConfig.query_cache_live_ttl` instead of a short TTL.
+
+        Args:
+            realtime: A `SupabaseRealtimeService`
+        Returns:
+            The started invalidator; call `stop()` on shutdown
+        """
+        invalidator = RealtimeCacheInvalidator(realtime, self.query_cache, tables, schema)
+        await invalidator.start()
+        return invalidator
+
+    def loader(self, table: str, key: str = "id", **options: Any) -> KeyLoader:
+        """
+        Create a `KeyLoader` that batches `load(key)` calls on `table` into
+        `in.(...)` queries. Create one per request; see `KeyLoader` for options.
+        """
+        return KeyLoader(self, table, key, **options)
+
+    def loaders(self) -> LoaderRegistry:
+        """
+        Per-request registry handing out one `KeyLoader` per table and key.
+        """
+        return LoaderRegistry(self)
+
+    def write_behind(self, **options: Any) -> WriteBehindBuffer:
+        """
+        Create a `WriteBehindBuffer` that batches `add(table, row)` calls into
+        bulk inserts through this service. See `WriteBehindBuffer` for options.
+        """
+        return WriteBehindBuffer(self, **options)
 
-    def call_function(
+    async def call_function(
         self,
         function_name: str,
         params: dict[str, Any] | None,
@@ -99,9 +438,342 @@ async def get_database_service():
         """
         Call a PostgreSQL function (RPC).
         """
-        return self.client.rpc(function_name, params or {}).execute().data
+        return await self._execute(self.client.rpc(function_name, params or {}))
+
+    async def aiter_rows(
+        self,
+        table: str,
+        select: str = "*",
+        filters: FilterLike | None = None,
+        key: Sequence[str] | None = None,
+        page_size: int = 1000,
+        descending: bool = False,
+        cursor: KeysetCursor | str | None = None,
+        pages: bool = False,
+    ) -> AsyncIterator[Any]:
+        """
+        Stream a table in key order without offsets, holding one page in memory.
+
+        Each page is fetched with `WHERE key > last_key ORDER BY key LIMIT page_size`,
+        so deep pages cost the same as the first. Pass a `KeysetCursor` to observe
+        progress: after each page has been consumed it points past that page, and
+        `cursor.encode()` gives a token that resumes the scan when passed back
+        as `cursor` (at most the page in progress is delivered again).
+
+        Args:
+            key: Unique, non-null ordering columns, e.g. ("created_at", "id")
+                (default: the table's primary key from the schema, else "id")
+            page_size: Rows per request
+            cursor: Cursor or encoded token to resume from; overrides `key` and `descending`
+            pages: Yield lists of rows instead of single rows
+        """
+        if isinstance(cursor, str):
+            cursor = KeysetCursor.decode(cursor)
+        elif cursor is None:
+            cursor = KeysetCursor(key or await self._primary_key(table), descending=descending)
+        select = ensure_selected(select, cursor.columns)
+        async for page in self._keyset_pages(
+            lambda: self._filtered(table, select, filters), cursor, page_size
+        ):
+            if pages:
+                yield page
+            else:
+                for row in page:
+                    yield row
+
+    async def scan_table(
+        self,
+        table: str,
+        column: str,
+        partitions: int = 8,
+        split_points: Sequence[Any] | None = None,
+        select: str = "*",
+        filters: FilterLike | None = None,
+        tiebreaker: str | None = "id",
+        page_size: int = 1000,
+        max_concurrency: int | None = None,
+        ordered: bool = False,
+        retries: int = 2,
+        on_progress: Callable[[ScanProgress], Any] | None = None,
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """
+        Read a whole table as pages, fetching key ranges in parallel.
+
+        The table is split on `column` (numeric or timestamp) into `partitions`
+        ranges between its current min and max, or at the given `split_points`.
+        Each range is keyset-paged on `(column, tiebreaker)` and retried from its
+        last page on failure. Pages stream out as they arrive, or in key order
+        with `ordered=True`.
+
+        Args:
+            split_points: Sorted interior boundaries; skips the min/max lookup
+            tiebreaker: Unique column that orders rows sharing a `column` value
+                (None when `column` is itself unique)
+            max_concurrency: Ranges fetched at once (defaults to
+                `SupabaseConfig.fanout_max_concurrency`)
+            on_progress: Called after every page with a `ScanProgress`
+        """
+        key = (column,) if tiebreaker in (None, column) else (column, tiebreaker)
+        if split_points is None:
+            bounds = await self._column_bounds(table, column, filters)
+            if bounds is None:
+                return
+            split_points = compute_split_points(*bounds, partitions)
+        select = ensure_selected(select, key)
+        policy = RetryPolicy.from_config(supabase_config)
+
+        def partition_pages(partition: Partition, cursor: KeysetCursor):
+            low, high = partition
+
+            def base() -> Any:
+                query = self._filtered(table, select, filters)
+                if low is not None:
+                    query = query.gte(column, low)
+                if high is not None:
+                    query = query.lt(column, high)
+                return query
+
+            return self._keyset_pages(base, cursor, page_size)
+
+        async for page in scan_partitions(
+            partitions_from_points(split_points),
+            partition_pages,
+            key,
+            max_concurrency=max_concurrency or supabase_config.fanout_max_concurrency,
+            ordered=ordered,
+            retries=retries,
+            backoff=policy.backoff,
+            on_progress=on_progress,
+        ):
+            yield page
+
+    def iter_rows(self, *args: Any, **kwargs: Any) -> Iterator[Any]:
+        """
+        Synchronous `aiter_rows` for scripts and jobs that do not run an event loop.
+
+        Drives the scan on a private event loop, so the client must not already be
+        bound to another loop. Accepts the same arguments as `aiter_rows`.
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+        else:
+            raise RuntimeError("iter_rows cannot run inside an event loop; use aiter_rows")
+        loop = asyncio.new_event_loop()
+        rows = self.aiter_rows(*args, **kwargs)
+        try:
+            while True:
+                try:
+                    yield loop.run_until_complete(rows.__anext__())
+                except StopAsyncIteration:
+                    return
+        finally:
+            loop.run_until_complete(rows.aclose())
+            loop.close()
+
+    async def gather(
+        self, *calls: Awaitable[Any], max_concurrency: int | None = None
+    ) -> list[Any]:
+        """
+        Run several database calls concurrently and return their results in order.
+
+        Example:
+            users, orders = await db.gather(
+                db.fetch_data("users"), db.fetch_data("orders", limit=50)
+            )
+
+        Args:
+            max_concurrency: Calls in flight at once (defaults to
+                `SupabaseConfig.fanout_max_concurrency`)
+        """
+        return await gather_bounded(
+            calls, max_concurrency or supabase_config.fanout_max_concurrency
+        )
+
+    async def fetch_many(
+        self,
+        queries: Mapping[str, dict[str, Any]],
+        max_concurrency: int | None = None,
+    ) -> dict[str, list[dict[str, Any]]]:
+        """
+        Fetch several tables concurrently.
+
+        Args:
+            queries: Result name -> `fetch_data` keyword arguments (must include `table`)
+            max_concurrency: Calls in flight at once (defaults to
+                `SupabaseConfig.fanout_max_concurrency`)
+
+        Returns:
+            Result name -> rows
+        """
+        return await gather_mapping(
+            {name: self.fetch_data(**kwargs) for name, kwargs in queries.items()},
+            max_concurrency or supabase_config.fanout_max_concurrency,
+        )
+
+    async def schema(self, refresh: bool = False) -> SchemaCatalog:
+        """
+        Tables, columns, primary keys and relationships from the PostgREST
+        OpenAPI document. Cached for `SupabaseConfig.schema_cache_ttl` seconds,
+        and on disk at `SupabaseConfig.schema_cache_path` when set.
+        """
+        return await self.schema_cache.get(refresh)
+
+    async def row_type(self, table: str, select: str = "*", kind: str = DEFAULT_ROW_KIND) -> type:
+        """
+        A compact record type for the rows `select` returns from `table`,
+        generated from the schema with typed (and, unless required, optional)
+        fields. Built once per table, select and kind.
+
+        Args:
+            kind: "struct" (msgspec; the default when installed), "dataclass"
+                (slotted) or "namedtuple"
+        """
+        return make_row_type((await self.schema_cache.get()).table(table), select, kind)
+
+    async def projection(
+        self, table: str, include: Iterable[str] | None = None, exclude: Iterable[str] = ()
+    ) -> str:
+        """
+        An explicit select list for `table` built from the schema, e.g. every
+        column except `exclude`. Built once per combination and reused.
+        """
+        return (await self.schema_cache.get()).projection(table, include, exclude)
+
+    async def _validate_query(
+        self,
+        table: str,
+        select: str,
+        filters: FilterLike | None,
+        order: str | None,
+        embed: Sequence[Embed],
+    ) -> None:
+        if not embed and not supabase_config.validate_columns:
+            return
+        try:
+            schema = await self.schema_cache.get()
+        except Exception as e:
+            # ? Without the schema PostgREST still runs the query, just without local checks
+            logger.warning("Schema unavailable, query on '%s' not validated: %s", table, e)
+            return
+        schema.validate_query(table, select, filters, order)
+        validate_embeds(schema, table, embed)
+
+    async def _primary_key(self, table: str) -> tuple[str, ...]:
+        try:
+            key = (await self.schema_cache.get()).primary_key(table)
+        except Exception as e:
+            logger.warning("Schema unavailable, paging '%s' on id: %s", table, e)
+            return ("id",)
+        if not key:
+            raise ValueError(f"'{table}' has no primary key; pass key= explicitly")
+        return key
+
+    def _cache_scope(self) -> str:
+        # ? Results depend on RLS, so the caller's token is part of the cache key
+        headers = getattr(getattr(self.client, "options", None), "headers", None) or {}
+        token = headers.get("Authorization") or headers.get("authorization") or ""
+        return hashlib.sha256(token.encode()).hexdigest()[:16]
+
+    def _filtered(self, table: str, select: str, filters: FilterLike | None) -> Any:
+        return apply_filter(self.client.table(table).select(select), filters)
 
-    def create_test_table(self, table: str) -> Any:
+    async def _keyset_pages(
+        self, base: Callable[[], Any], cursor: KeysetCursor, page_size: int
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        # * The cursor advances only once the consumer asks for the next page
+        while True:
+            rows = await self._execute(apply_keyset(base(), cursor, page_size))
+            if not rows:
+                return
+            yield rows
+            cursor.advance(rows[-1])
+            if len(rows) < page_size:
+                return
+
+    async def _column_bounds(
+        self, table: str, column: str, filters: FilterLike | None
+    ) -> tuple[Any, Any] | None:
+        async def edge(desc: bool) -> list[dict[str, Any]]:
+            query = self._filtered(table, column, filters).not_.is_(column, "null")
+            return await self._execute(query.order(column, desc=desc).limit(1))
+
+        low, high = await asyncio.gather(edge(False), edge(True))
+        if not low:
+            return None
+        return low[0][column], high[0][column]
+
+    @staticmethod
+    async def _execute(query: Any) -> Any:
+        # * The async client returns a coroutine; the sync client returns the response
+        response = query.execute()
+        if inspect.isawaitable(response):
+            response = await response
+        return response.data
+
+    @staticmethod
+    async def _send(query: Any, headers: Mapping[str, str] | None = None) -> httpx.Response:
+        # * Send the built request directly so callers can read the raw body and headers
+        request = getattr(query, "request", query)  # ? postgrest < 1.0 keeps it on the builder
+        request_headers = request.headers
+        if headers:
+            request_headers = httpx.Headers(request.headers)
+            request_headers.update(headers)
+        response = request.session.request(
+            request.http_method,
+            str(request.path),
+            params=request.params,
+            headers=request_headers,
+            json=request.json,
+            auth=getattr(request, "auth", None),
+        )
+        if inspect.isawaitable(response):
+            response = await response
+        if not response.is_success and response.status_code != 304:
+            try:
+                error = response.json()
+            except ValueError:
+                error = None
+            if not isinstance(error, dict):
+                error = {"message": response.text, "code": str(response.status_code)}
+            raise APIError(error)
+        return response
+
+    async def _fetch_body(self, query: Any) -> bytes:
+        return (await self._send(query)).content
+
+    async def _fetch_revalidated(
+        self, query: Any, decode: Callable[[bytes], Any], as_type: Any
+    ) -> Any:
+        request = getattr(query, "request", query)
+        url = httpx.URL(str(request.path))
+        headers = httpx.Headers(getattr(request.session, "headers", None) or {})
+        headers.update(request.headers)
+        key = request_key("GET", f"{url}?{request.params}", None, headers) + (as_type,)
+        cached, fresh = self.http_cache.lookup(key)
+        set_span_attribute("cache.hit", fresh)
+        if fresh:
+            return cached.value
+        conditional = self.http_cache.conditional_headers(cached) if cached is not None else None
+        response = await self._send(query, conditional)
+        if response.status_code == 304 and cached is not None:
+            # * Not modified: reuse the decoded rows, skipping transfer and decode
+            return self.http_cache.revalidate(key, cached, response, url.path)
+        value = decode(response.content)
+        self.http_cache.store(key, response, value, url.path)
+        return value
+
+    def _invalidate(self, table: str) -> None:
+        self.query_cache.invalidate_table(table)
+        if len(self.http_cache):
+            self.http_cache.invalidate_prefix(str(self.client.table(table).path))
+
+    async def _execute_hedged(self, key: tuple, query: Any) -> list[dict[str, Any]]:
+        response = await hedger.run(key, query.execute, service="database")
+        return response.data
+
+    async def create_test_table(self, table: str) -> Any:
         """
         Create a simple test table for integration tests (via SQL RPC).
         """
@@ -124,14 +796,19 @@ async def get_database_service():
         USING (true)
         WITH CHECK (true);
         """
-        return self.client.rpc("exec_sql", {"query": sql}).execute().data
+        return await self._execute(self.client.rpc("exec_sql", {"query": sql}))
 
-    def delete_table(self, table: str) -> Any:
+    async def delete_table(self, table: str) -> Any:
         """
         Delete a table from the database (via SQL RPC).
         """
         sql = f"DROP TABLE IF EXISTS {table};"
-        return self.client.rpc("exec_sql", {"query": sql}).execute().data
+        return await self._execute(self.client.rpc("exec_sql", {"query": sql}))
+
+
+async def get_database_service():
+    client = await get_supabase_client()
+    return SupabaseDatabaseService(client)
 
 
 # ! All logic now uses the official SDK, removing manual HTTP calls and custom base service logic.
@@ -3,8 +3,12 @@ from typing import Any
 from supafunc.errors import FunctionsHttpError, FunctionsRelayError
 
 from app.core.third_party_integrations.supabase_home.client import get_supabase_client
+from app.core.third_party_integrations.supabase_home.transport.instrumentation import (
+    instrument_class,
+)
 
 
+@instrument_class("edge_functions")
 class SupabaseEdgeFunctionsService:
     """
     Service for invoking Supabase Edge Functions using the unified SDK client.
@@ -15,10 +19,6 @@ class SupabaseEdgeFunctionsService:
         self.client = client
         self.functions = getattr(self.client, "functions", None)
 
-async def get_edge_functions_service():
-    client = await get_supabase_client()
-    return SupabaseEdgeFunctionsService(client)
-
     def invoke_function(
         self,
         function_name: str,
@@ -68,3 +68,8 @@ async def get_edge_functions_service():
             err = exception.to_dict()
             # ! Relay (Supabase infra) error
             raise RuntimeError(f'Relay error: {err.get("message")}', err)
+
+
+async def get_edge_functions_service():
+    client = await get_supabase_client()
+    return SupabaseEdgeFunctionsService(client)
@@ -0,0 +1,152 @@
+from collections.abc import Iterable, Sequence
+from typing import Any
+
+from app.core.third_party_integrations.supabase_home.sdk.filters import (
+    FilterLike,
+    Group,
+    apply_filter,
+    as_filter,
+    compile_filter,
+)
+from app.core.third_party_integrations.supabase_home.sdk.schema import SchemaCatalog
+
+
+def parse_order(order: str) -> list[tuple[str, bool, bool | None]]:
+    """
+    Parse "created_at.desc,id" into `(column, desc, nullsfirst)` terms.
+    """
+    terms = []
+    for term in order.split(","):
+        column, *modifiers = term.strip().split(".")
+        if not column:
+            raise ValueError(f"Invalid order '{order}'")
+        desc, nullsfirst = False, None
+        for modifier in modifiers:
+            if modifier in ("asc", "desc"):
+                desc = modifier == "desc"
+            elif modifier in ("nullsfirst", "nullslast"):
+                nullsfirst = modifier == "nullsfirst"
+            else:
+                raise ValueError(f"Invalid order modifier '{modifier}' in '{order}'")
+        terms.append((column, desc, nullsfirst))
+    return terms
+
+
+class Embed:
+    """
+    An embedded resource in a select: rows of a related table returned nested
+    inside each parent row, with their own filters, ordering and limit.
+
+    To-many relations come back as a list per parent, to-one relations as an
+    object (or None). Embeds nest, so one request can load a whole tree.
+
+    Args:
+        resource: Related table name
+        select: Columns of the related table
+        filters: Equality dict or `sdk.filters` expression on the related table
+        order: Ordering of the embedded rows, e.g. "created_at.desc"
+        limit: Maximum embedded rows per parent
+        alias: Key the embedded rows appear under (default: `resource`)
+        via: Foreign key column that picks one of several relationships
+        inner: Drop parent rows without a matching embedded row (inner join)
+        embed: Resources embedded inside this one
+    """
+
+    __slots__ = ("resource", "select", "filters", "order", "limit", "alias", "via", "inner", "embed")
+
+    def __init__(
+        self,
+        resource: str,
+        select: str = "*",
+        filters: FilterLike | None = None,
+        order: str | None = None,
+        limit: int | None = None,
+        alias: str | None = None,
+        via: str | None = None,
+        inner: bool = False,
+        embed: Iterable["Embed"] = (),
+    ):
+        self.resource = resource
+        self.select = select
+        self.filters = as_filter(filters)
+        self.order = parse_order(order) if order else []
+        self.limit = limit
+        self.alias = alias
+        self.via = via
+        self.inner = inner
+        self.embed = tuple(embed)
+
+    @property
+    def name(self) -> str:
+        """Key the embedded rows appear under, and the prefix of their query parameters."""
+        return self.alias or self.resource
+
+    def render(self) -> str:
+        target = self.resource
+        if self.via:
+            target += f"!{self.via}"
+        if self.inner:
+            target += "!inner"
+        prefix = f"{self.alias}:" if self.alias else ""
+        return f"{prefix}{target}({render_select(self.select, self.embed)})"
+
+    def key(self) -> tuple:
+        """Hashable description of the embed, for cache keys."""
+        return (
+            self.render(),
+            tuple(compile_filter(self.filters)) if self.filters is not None else (),
+            tuple(self.order),
+            self.limit,
+            tuple(child.key() for child in self.embed),
+        )
+
+    def __repr__(self) -> str:
+        return f"Embed({self.render()!r})"
+
+
+def render_select(select: str, embeds: Sequence[Embed]) -> str:
+    """Append embedded resources to a column list: "id,name,orders(id,total)"."""
+    parts = [select] if select else []
+    parts.extend(embed.render() for embed in embeds)
+    return ",".join(parts)
+
+
+def apply_embeds(query: Any, embeds: Sequence[Embed], parent: str = "") -> Any:
+    """
+    Apply each embed's filters, ordering and limit to a postgrest builder,
+    scoped to the embedded resource's path (e.g. "orders.items").
+    """
+    for embed in embeds:
+        path = f"{parent}.{embed.name}" if parent else embed.name
+        if embed.filters is not None:
+            query = apply_filter(query, Group("and", (embed.filters,), on=path))
+        for column, desc, nullsfirst in embed.order:
+            query = query.order(column, desc=desc, nullsfirst=nullsfirst, foreign_table=path)
+        if embed.limit is not None:
+            query = query.limit(embed.limit, foreign_table=path)
+        query = apply_embeds(query, embed.embed, path)
+    return query
+
+
+def validate_embeds(schema: SchemaCatalog, table: str, embeds: Sequence[Embed]) -> None:
+    """
+    Check every embed against the foreign keys and columns in `schema` before
+    the request is sent.
+
+    Raises:
+        ValueError: If a resource is not related to its parent, is related more
+            than once without `via`, is to-one but ordered or limited, or names
+            a column it does not have
+    """
+    for embed in embeds:
+        schema.validate_query(
+            embed.resource,
+            embed.select,
+            embed.filters,
+            ",".join(column for column, _, _ in embed.order) or None,
+        )
+        if schema.cardinality(table, embed.resource, embed.via) == "one" and (embed.order or embed.limit is not None):
+            raise ValueError(
+                f"'{embed.resource}' is a to-one relation of '{table}'; order and limit do not apply"
+            )
+        validate_embeds(schema, embed.resource, embed.embed)
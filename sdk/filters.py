@@ -0,0 +1,361 @@
+import json
+from abc import ABC, abstractmethod
+from collections.abc import Iterable, Mapping
+from datetime import date, datetime
+from functools import lru_cache
+from typing import Any
+
+# * Characters that must be quoted inside PostgREST logic trees and in.(...) lists
+_RESERVED = frozenset(',.:()"\\ ')
+
+_TEXT_SEARCH_MODES = {"fts": "fts", "plain": "plfts", "phrase": "phfts", "websearch": "wfts"}
+
+
+def _scalar(value: Any) -> str:
+    if value is None:
+        return "null"
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return str(value)
+
+
+def _quote(value: Any, nested: bool) -> str:
+    text = _scalar(value)
+    if nested and (not text or any(char in _RESERVED for char in text)):
+        return '"' + text.replace("\\", "\\\\").replace('"', '\\"') + '"'
+    return text
+
+
+class Filter(ABC):
+    """
+    A server-side filter expression. Combine with `&`, `|` and `~`, then pass to
+    `fetch_data`, `update_data` or `delete_data` as `filters`.
+    """
+
+    __slots__ = ()
+
+    def __and__(self, other: "Filter") -> "Filter":
+        return Group("and", (self, as_filter(other)))
+
+    def __or__(self, other: "Filter") -> "Filter":
+        return Group("or", (self, as_filter(other)))
+
+    @abstractmethod
+    def __invert__(self) -> "Filter": ...
+
+    @abstractmethod
+    def shape(self) -> tuple:
+        """Hashable structure of the expression with values left out."""
+
+    @abstractmethod
+    def conditions(self) -> Iterable["Condition"]:
+        """Conditions in depth-first order."""
+
+
+class Condition(Filter):
+    """One `column <op> value` predicate."""
+
+    __slots__ = ("column", "op", "value", "negate")
+
+    def __init__(self, column: str, op: str, value: Any, negate: bool = False):
+        self.column = column
+        self.op = op
+        self.value = value
+        self.negate = negate
+
+    def __invert__(self) -> "Condition":
+        return Condition(self.column, self.op, self.value, not self.negate)
+
+    def shape(self) -> tuple:
+        return ("c", self.column, self.op, self.negate)
+
+    def conditions(self) -> Iterable["Condition"]:
+        yield self
+
+    def format_value(self, nested: bool) -> str:
+        op, value = self.op, self.value
+        if op == "in":
+            return "(" + ",".join(_quote(item, True) for item in value) + ")"
+        if op in ("cs", "cd", "ov"):
+            if isinstance(value, Mapping):
+                return json.dumps(value, separators=(",", ":"))
+            if isinstance(value, (list, tuple, set, frozenset)):
+                return "{" + ",".join(_quote(item, True) for item in value) + "}"
+            return _quote(value, nested)
+        if op in ("like", "ilike"):
+            # * PostgREST accepts * as the wildcard; % would need URL escaping
+            return _quote(str(value).replace("%", "*"), nested)
+        return _quote(value, nested)
+
+    def __repr__(self) -> str:
+        prefix = "not " if self.negate else ""
+        return f"{prefix}{self.column}.{self.op}.{self.value!r}"
+
+
+class Group(Filter):
+    """
+    An `and`/`or` group. `on` applies the group to an embedded resource
+    (its conditions then name that resource's columns).
+    """
+
+    __slots__ = ("kind", "items", "negate", "on")
+
+    def __init__(
+        self,
+        kind: str,
+        items: Iterable[Filter],
+        negate: bool = False,
+        on: str | None = None,
+    ):
+        if kind not in ("and", "or"):
+            raise ValueError(f"Unknown filter group '{kind}'")
+        self.kind = kind
+        self.items = tuple(items)
+        self.negate = negate
+        self.on = on
+        if not self.items:
+            raise ValueError("A filter group needs at least one condition")
+
+    def __invert__(self) -> "Group":
+        return Group(self.kind, self.items, not self.negate, self.on)
+
+    def shape(self) -> tuple:
+        return ("g", self.kind, self.negate, self.on, tuple(item.shape() for item in self.items))
+
+    def conditions(self) -> Iterable[Condition]:
+        for item in self.items:
+            yield from item.conditions()
+
+    def __repr__(self) -> str:
+        prefix = "not " if self.negate else ""
+        on = f" on {self.on}" if self.on else ""
+        return f"{prefix}{self.kind}{on}{list(self.items)!r}"
+
+
+class Column:
+    """
+    Builds conditions for one column. Use a dotted name (`"orders.total"`) to
+    filter an embedded resource.
+    """
+
+    __slots__ = ("name",)
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def eq(self, value: Any) -> Condition:
+        return Condition(self.name, "eq", value)
+
+    def neq(self, value: Any) -> Condition:
+        return Condition(self.name, "neq", value)
+
+    def gt(self, value: Any) -> Condition:
+        return Condition(self.name, "gt", value)
+
+    def gte(self, value: Any) -> Condition:
+        return Condition(self.name, "gte", value)
+
+    def lt(self, value: Any) -> Condition:
+        return Condition(self.name, "lt", value)
+
+    def lte(self, value: Any) -> Condition:
+        return Condition(self.name, "lte", value)
+
+    def in_(self, values: Iterable[Any]) -> Condition:
+        return Condition(self.name, "in", tuple(values))
+
+    def is_(self, value: bool | None) -> Condition:
+        """`IS NULL` / `IS TRUE` / `IS FALSE`."""
+        return Condition(self.name, "is", value)
+
+    def like(self, pattern: str) -> Condition:
+        return Condition(self.name, "like", pattern)
+
+    def ilike(self, pattern: str) -> Condition:
+        return Condition(self.name, "ilike", pattern)
+
+    def contains(self, value: Any) -> Condition:
+        """Array, range or JSON containment (`@>`)."""
+        return Condition(self.name, "cs", value)
+
+    def contained_by(self, value: Any) -> Condition:
+        return Condition(self.name, "cd", value)
+
+    def overlaps(self, value: Any) -> Condition:
+        return Condition(self.name, "ov", value)
+
+    def text_search(self, query: str, config: str | None = None, mode: str = "fts") -> Condition:
+        """
+        Full-text search on a tsvector column.
+
+        Args:
+            config: Text search configuration, e.g. "english"
+            mode: "fts" (to_tsquery), "plain", "phrase" or "websearch"
+        """
+        op = _TEXT_SEARCH_MODES[mode]
+        if config:
+            op = f"{op}({config})"
+        return Condition(self.name, op, query)
+
+
+def col(name: str) -> Column:
+    return Column(name)
+
+
+def and_(*filters: Filter, on: str | None = None) -> Group:
+    return Group("and", (as_filter(f) for f in filters), on=on)
+
+
+def or_(*filters: Filter, on: str | None = None) -> Group:
+    return Group("or", (as_filter(f) for f in filters), on=on)
+
+
+def not_(filter: Filter) -> Filter:
+    return ~as_filter(filter)
+
+
+FilterLike = Filter | Mapping[str, Any]
+
+
+def as_filter(filters: FilterLike | None) -> Filter | None:
+    """Accept a Filter or the legacy `{column: value}` equality dict."""
+    if filters is None or isinstance(filters, Filter):
+        return filters
+    conditions = [Condition(column, "eq", value) for column, value in filters.items()]
+    if not conditions:
+        return None
+    return conditions[0] if len(conditions) == 1 else Group("and", conditions)
+
+
+def filter_columns(expression: Filter) -> set[str]:
+    """
+    Columns of the queried table that `expression` filters on. Embedded
+    resources (dotted names, `on=` groups) are left out and JSON paths are
+    reduced to their column.
+    """
+    if isinstance(expression, Group):
+        if expression.on:
+            return set()
+        return set().union(*(filter_columns(item) for item in expression.items))
+    column = expression.column.split("->", 1)[0]
+    return set() if "." in column else {column}
+
+
+def _tree(shape: tuple, negate: bool, slots: list[bool]) -> list:
+    """Render a shape inside a logic tree as segments (str, or int value slots)."""
+    if shape[0] == "c":
+        _, column, op, cond_negate = shape
+        slots.append(True)
+        prefix = "not." if cond_negate != negate else ""
+        return [f"{column}.{prefix}{op}.", len(slots) - 1]
+    _, kind, group_negate, on, items = shape
+    segments: list = [("not." if group_negate != negate else "") + f"{kind}("]
+    for index, item in enumerate(items):
+        if item[0] == "g" and item[3] not in (None, on):
+            raise ValueError("Nested groups cannot target a different embedded resource")
+        if index:
+            segments.append(",")
+        segments.extend(_tree(item, False, slots))
+    segments.append(")")
+    return segments
+
+
+def _flatten(shape: tuple, on: str | None, negate: bool, entries: list, slots: list[bool]) -> None:
+    if shape[0] == "c":
+        _, column, op, cond_negate = shape
+        key = f"{on}.{column}" if on else column
+        slots.append(False)
+        prefix = "not." if cond_negate != negate else ""
+        entries.append(("filter", key, prefix + op, len(slots) - 1))
+        return
+    _, kind, group_negate, group_on, items = shape
+    on = group_on or on
+    negate = negate != group_negate
+    if kind == "and" and not negate:
+        for item in items:
+            _flatten(item, on, False, entries, slots)
+        return
+    # * Top-level logic is always sent as or=(...): NOT (a AND b) == (NOT a) OR (NOT b)
+    if kind == "and":
+        body: list = []
+        for index, item in enumerate(items):
+            if index:
+                body.append(",")
+            body.extend(_tree(item, True, slots))
+        entries.append(("or", on, False, tuple(body)))
+        return
+    body = []
+    for index, item in enumerate(items):
+        if index:
+            body.append(",")
+        body.extend(_tree(item, False, slots))
+    entries.append(("or", on, negate, tuple(body)))
+
+
+@lru_cache(maxsize=1024)
+def compile_shape(shape: tuple) -> tuple[tuple, tuple[bool, ...]]:
+    """
+    Compile an expression shape to parameter templates, cached per shape.
+
+    Returns:
+        (entries, nested): `("filter", key, operator, slot)` and
+        `("or", embedded_resource, negate, segments)` entries, plus whether each
+        value slot sits inside a logic tree (and so needs quoting)
+    """
+    entries: list = []
+    slots: list[bool] = []
+    _flatten(shape, None, False, entries, slots)
+    return tuple(entries), tuple(slots)
+
+
+def compile_filter(expression: Filter) -> list[tuple[str, str]]:
+    """
+    Compile an expression to PostgREST query parameters, e.g.
+    `[("age", "gte.18"), ("or", "(status.eq.active,vip.is.true)")]`.
+    """
+    params = []
+    for entry in _render(expression):
+        if entry[0] == "filter":
+            _, key, op, value = entry
+            params.append((key, f"{op}.{value}"))
+        else:
+            _, on, negate, body = entry
+            key = ("not." if negate else "") + "or"
+            params.append((f"{on}.{key}" if on else key, f"({body})"))
+    return params
+
+
+def apply_filter(query: Any, filters: FilterLike | None) -> Any:
+    """Apply a filter expression (or legacy equality dict) to a postgrest builder."""
+    expression = as_filter(filters)
+    if expression is None:
+        return query
+    for entry in _render(expression):
+        if entry[0] == "filter":
+            _, key, op, value = entry
+            query = query.filter(key, op, value)
+        else:
+            _, on, negate, body = entry
+            if negate:
+                query = query.not_
+            query = query.or_(body, reference_table=on)
+    return query
+
+
+def _render(expression: Filter) -> list[tuple]:
+    entries, nested = compile_shape(expression.shape())
+    values = [
+        condition.format_value(nested[index])
+        for index, condition in enumerate(expression.conditions())
+    ]
+    rendered = []
+    for entry in entries:
+        if entry[0] == "filter":
+            rendered.append((*entry[:3], values[entry[3]]))
+        else:
+            segments = entry[3]
+            body = "".join(s if isinstance(s, str) else values[s] for s in segments)
+            rendered.append((*entry[:3], body))
+    return rendered
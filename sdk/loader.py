@@ -0,0 +1,180 @@
+import asyncio
+from collections.abc import Hashable, Iterable
+from typing import Any
+from urllib.parse import quote
+
+from app.core.third_party_integrations.supabase_home.config import supabase_config
+from app.core.third_party_integrations.supabase_home.sdk.filters import (
+    FilterLike,
+    as_filter,
+    col,
+)
+from app.core.third_party_integrations.supabase_home.sdk.pagination import (
+    ensure_selected,
+)
+from app.core.third_party_integrations.supabase_home.transport.fanout import (
+    gather_bounded,
+)
+
+# * Room left in the URL for the base path, select and other filters
+_URL_OVERHEAD = 256
+
+
+def chunk_keys(keys: list[Any], column: str, budget: int) -> list[list[Any]]:
+    """
+    Split keys so each `column=in.(...)` parameter stays within `budget` URL bytes.
+    """
+    chunks: list[list[Any]] = []
+    chunk: list[Any] = []
+    size = len(column) + len("=in.()")
+    for key in keys:
+        key_size = len(quote(str(key), safe="")) + 3  # * separator, possible quotes
+        if chunk and size + key_size > budget:
+            chunks.append(chunk)
+            chunk, size = [], len(column) + len("=in.()")
+        chunk.append(key)
+        size += key_size
+    if chunk:
+        chunks.append(chunk)
+    return chunks
+
+
+class KeyLoader:
+    """
+    Batches key lookups on one table into `in.(...)` queries (DataLoader pattern).
+
+    `load()` calls made in the same event-loop tick are collected and sent
+    together, split into as many queries as the URL length limit requires, and
+    each caller gets the row for its key (or None). Results are memoized for
+    the loader's lifetime, so create one loader per request: repeated keys are
+    then free and a request always sees a consistent value for a key.
+    """
+
+    def __init__(
+        self,
+        db: Any,
+        table: str,
+        key: str = "id",
+        select: str = "*",
+        filters: FilterLike | None = None,
+        many: bool = False,
+        max_url_length: int | None = None,
+        max_concurrency: int | None = None,
+    ):
+        """
+        Args:
+            db: A `SupabaseDatabaseService`
+            key: Column the keys are matched against
+            filters: Extra conditions applied to every batch
+            many: Return every matching row per key (e.g. children by foreign key)
+            max_url_length: Defaults to `SupabaseConfig.loader_max_url_length`
+        """
+        self.db = db
+        self.table = table
+        self.key = key
+        self.select = ensure_selected(select, [key])
+        self.filters = as_filter(filters)
+        self.many = many
+        self.max_url_length = max_url_length or supabase_config.loader_max_url_length
+        self.max_concurrency = max_concurrency or supabase_config.fanout_max_concurrency
+        self._memo: dict[Hashable, asyncio.Future] = {}
+        self._pending: list[tuple[Hashable, asyncio.Future]] = []
+        self._scheduled = False
+        self._tasks: set[asyncio.Task] = set()
+        self.batches = 0
+
+    async def load(self, key: Hashable) -> Any:
+        future = self._memo.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = self._memo[key] = loop.create_future()
+            self._pending.append((key, future))
+            if not self._scheduled:
+                self._scheduled = True
+                # * Dispatch after everything queued in this tick has called load()
+                loop.call_soon(self._dispatch)
+        return await asyncio.shield(future)
+
+    async def load_many(self, keys: Iterable[Hashable]) -> list[Any]:
+        """Load several keys; results follow the order of `keys`."""
+        return list(await asyncio.gather(*(self.load(key) for key in keys)))
+
+    def prime(self, key: Hashable, value: Any) -> None:
+        """Seed the memo, e.g. with rows already fetched by another query."""
+        if key not in self._memo:
+            future = asyncio.get_running_loop().create_future()
+            future.set_result(value)
+            self._memo[key] = future
+
+    def clear(self, key: Hashable | None = None) -> None:
+        """Forget one memoized key, or all of them."""
+        if key is None:
+            self._memo.clear()
+        else:
+            self._memo.pop(key, None)
+
+    def _dispatch(self) -> None:
+        pending, self._pending, self._scheduled = self._pending, [], False
+        budget = self.max_url_length - len(self.select) - _URL_OVERHEAD
+        chunks = chunk_keys([key for key, _ in pending], self.key, budget)
+        self.batches += len(chunks)
+        # ? Each batch keeps its own futures, so clear() during the fetch cannot strand a caller
+        batches, start = [], 0
+        for chunk in chunks:
+            batches.append(pending[start:start + len(chunk)])
+            start += len(chunk)
+        task = asyncio.ensure_future(
+            gather_bounded((self._fetch(batch) for batch in batches), self.max_concurrency)
+        )
+        # ? Hold a reference so the batch is not garbage-collected mid-flight
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _fetch(self, batch: list[tuple[Hashable, asyncio.Future]]) -> None:
+        condition = col(self.key).in_([key for key, _ in batch])
+        if self.filters is not None:
+            condition = condition & self.filters
+        try:
+            rows = await self.db.fetch_data(self.table, self.select, filters=condition, cache=False)
+        except Exception as e:
+            for key, future in batch:
+                # * Failures are not memoized
+                if self._memo.get(key) is future:
+                    del self._memo[key]
+                if not future.done():
+                    future.set_exception(e)
+            return
+        found: dict[Any, Any] = {}
+        for row in rows:
+            value = row.get(self.key)
+            if self.many:
+                found.setdefault(value, []).append(row)
+                if not isinstance(value, str):
+                    found.setdefault(str(value), found[value])
+            else:
+                found.setdefault(value, row)
+                found.setdefault(str(value), row)
+        for key, future in batch:
+            if future.done():
+                continue
+            result = found.get(key, found.get(str(key)))
+            if result is None and self.many:
+                result = []
+            future.set_result(result)
+
+
+class LoaderRegistry:
+    """
+    Per-request set of `KeyLoader`s, one per (table, key, select, many).
+    """
+
+    def __init__(self, db: Any):
+        self.db = db
+        self._loaders: dict[tuple, KeyLoader] = {}
+
+    def get(self, table: str, key: str = "id", select: str = "*", many: bool = False) -> KeyLoader:
+        slot = (table, key, select, many)
+        loader = self._loaders.get(slot)
+        if loader is None:
+            loader = self._loaders[slot] = KeyLoader(self.db, table, key, select, many=many)
+        return loader
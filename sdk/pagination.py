@@ -0,0 +1,114 @@
+import base64
+import json
+from collections.abc import Mapping, Sequence
+from typing import Any
+
+
+class KeysetCursor:
+    """
+    Position of a keyset scan: the ordering columns and the key of the last row read.
+
+    The columns must be unique together and non-null (e.g. `("created_at", "id")`),
+    and should be backed by an index in that order. `encode()` produces an opaque
+    token that can be stored and passed back to resume the scan.
+    """
+
+    __slots__ = ("columns", "values", "descending")
+
+    def __init__(
+        self,
+        columns: Sequence[str],
+        values: Sequence[Any] | None = None,
+        descending: bool = False,
+    ):
+        if not columns:
+            raise ValueError("A keyset cursor needs at least one column")
+        self.columns = tuple(columns)
+        self.values = tuple(values) if values is not None else None
+        self.descending = descending
+
+    def advance(self, row: Mapping[str, Any]) -> None:
+        """Move the cursor past `row`."""
+        try:
+            self.values = tuple(row[column] for column in self.columns)
+        except KeyError as e:
+            raise ValueError(f"Keyset column {e} is missing from the selected row") from e
+
+    def encode(self) -> str:
+        payload = {"c": self.columns, "v": self.values, "d": self.descending}
+        raw = json.dumps(payload, separators=(",", ":"), default=str).encode()
+        return base64.urlsafe_b64encode(raw).decode()
+
+    @classmethod
+    def decode(cls, token: str) -> "KeysetCursor":
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(token.encode()))
+            return cls(payload["c"], payload["v"], payload["d"])
+        except (ValueError, KeyError, TypeError) as e:
+            raise ValueError("Invalid keyset cursor token") from e
+
+    def __repr__(self) -> str:
+        return f"KeysetCursor(columns={self.columns!r}, values={self.values!r}, descending={self.descending!r})"
+
+
+def quote_value(value: Any) -> str:
+    """
+    Render a value for a PostgREST logical filter, quoting it so commas, dots,
+    colons and parentheses (timestamps, text) are not read as syntax.
+    """
+    if value is None:
+        raise ValueError("Keyset columns must not contain NULL values")
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (int, float)):
+        return repr(value)
+    text = str(value).replace("\\", "\\\\").replace('"', '\\"')
+    return f'"{text}"'
+
+
+def keyset_filter(cursor: KeysetCursor) -> str | None:
+    """
+    Build the PostgREST `or` filter selecting rows after the cursor, e.g.
+    `created_at.gt."t",and(created_at.eq."t",id.gt.7)` for `(created_at, id)`.
+
+    Returns:
+        The filter body (without the surrounding parentheses), or None at the start
+    """
+    if cursor.values is None:
+        return None
+    op = "lt" if cursor.descending else "gt"
+    quoted = [quote_value(value) for value in cursor.values]
+    clauses = []
+    for i, column in enumerate(cursor.columns):
+        parts = [f"{c}.eq.{v}" for c, v in zip(cursor.columns[:i], quoted[:i])]
+        parts.append(f"{column}.{op}.{quoted[i]}")
+        clauses.append(parts[0] if len(parts) == 1 else f"and({','.join(parts)})")
+    return ",".join(clauses)
+
+
+def apply_keyset(query: Any, cursor: KeysetCursor, page_size: int) -> Any:
+    """
+    Order `query` by the cursor columns, restrict it to rows after the cursor and
+    limit it to one page.
+    """
+    for column in cursor.columns:
+        query = query.order(column, desc=cursor.descending)
+    if cursor.values is None:
+        return query.limit(page_size)
+    leading, first = cursor.columns[0], cursor.values[0]
+    if len(cursor.columns) == 1:
+        query = query.filter(leading, "lt" if cursor.descending else "gt", first)
+    else:
+        # * Redundant bound on the leading column keeps this an index range scan
+        query = query.filter(leading, "lte" if cursor.descending else "gte", first)
+        query = query.or_(keyset_filter(cursor))
+    return query.limit(page_size)
+
+
+def ensure_selected(select: str, columns: Sequence[str]) -> str:
+    """Append keyset columns missing from an explicit column list."""
+    if select.strip() == "*":
+        return select
+    selected = {part.strip() for part in select.split(",")}
+    missing = [column for column in columns if column not in selected]
+    return ",".join([select, *missing]) if missing else select
@@ -0,0 +1,226 @@
+import asyncio
+import logging
+import re
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable, Mapping
+from typing import Any
+
+from app.core.third_party_integrations.supabase_home.transport.metrics import metrics
+from app.core.third_party_integrations.supabase_home.transport.tracing import (
+    activate,
+    set_span_attribute,
+)
+
+logger = logging.getLogger("apps.supabase_home")
+
+QUERY_CACHE_EVENTS = metrics.counter(
+    "supabase_query_cache_events_total",
+    "Database query cache lookups by table and outcome (hit, stale, miss)",
+    ("table", "outcome"),
+)
+
+# * Embedded resources in a select: "author:users(name)" or "orders!fk!inner(total)"
+_EMBEDDED = re.compile(r"(?:\w+:)?(\w+)(?:!\w+)*\s*\(")
+
+
+def embedded_tables(select: str) -> set[str]:
+    """Tables embedded in a PostgREST select string."""
+    return set(_EMBEDDED.findall(select))
+
+
+class _Entry:
+    __slots__ = ("value", "tables", "stored_at", "ttl", "size")
+
+    def __init__(self, value: Any, tables: frozenset[str], stored_at: float, ttl: float, size: int):
+        self.value = value
+        self.tables = tables
+        self.stored_at = stored_at
+        self.ttl = ttl
+        self.size = size
+
+
+class QueryCache:
+    """
+    Read-through cache of query results, bounded by bytes with LRU eviction.
+
+    Entries are fresh for their table's TTL. For another `stale_ttl` seconds
+    they are still served while one background refresh runs
+    (stale-while-revalidate). Writes invalidate every entry that reads the
+    written table, including queries that embed it. Tables marked live (kept
+    current by change events, see `RealtimeCacheInvalidator`) use `live_ttl`
+    instead of their TTL. Cached results are shared, so callers must not mutate them.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = 32 * 1024 * 1024,
+        default_ttl: float = 0.0,
+        table_ttls: Mapping[str, float] | None = None,
+        stale_ttl: float = 0.0,
+        live_ttl: float = 3600.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self.table_ttls = dict(table_ttls or {})
+        self.stale_ttl = stale_ttl
+        self.live_ttl = live_ttl
+        self._live: set[str] = set()
+        self._clock = clock
+        self._entries: OrderedDict[Hashable, _Entry] = OrderedDict()
+        self._by_table: dict[str, set[Hashable]] = {}
+        self._generations: dict[str, int] = {}
+        self._refreshing: dict[Hashable, asyncio.Task] = {}
+        self._bytes = 0
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+
+    @classmethod
+    def from_config(cls, config: Any) -> "QueryCache":
+        return cls(
+            max_bytes=config.query_cache_max_bytes,
+            default_ttl=config.query_cache_default_ttl,
+            table_ttls=config.query_cache_table_ttls,
+            stale_ttl=config.query_cache_stale_ttl,
+            live_ttl=config.query_cache_live_ttl,
+        )
+
+    @property
+    def size_bytes(self) -> int:
+        return self._bytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def ttl_for(self, table: str) -> float:
+        if table in self._live:
+            return self.live_ttl
+        return self.table_ttls.get(table, self.default_ttl)
+
+    def set_live(self, table: str, live: bool) -> None:
+        """
+        Mark `table` as kept current by change events. Losing the event stream
+        evicts its entries, since changes may have been missed, and falls back
+        to the TTL.
+        """
+        if live:
+            self._live.add(table)
+        elif table in self._live:
+            self._live.discard(table)
+            self.invalidate_table(table)
+
+    def is_live(self, table: str) -> bool:
+        return table in self._live
+
+    def caches(self, table: str) -> bool:
+        return self.ttl_for(table) > 0
+
+    def generation(self, table: str) -> int:
+        return self._generations.get(table, 0)
+
+    async def get_or_load(
+        self,
+        key: Hashable,
+        table: str,
+        tables: frozenset[str],
+        load: Callable[[], Awaitable[Any]],
+        size_of: Callable[[Any], int],
+    ) -> Any:
+        """
+        Return the cached result for `key`, loading (and storing) it on a miss.
+
+        Args:
+            table: Table whose TTL applies
+            tables: Every table the query reads; a write to any of them evicts it
+            load: Fetches the result from the database
+            size_of: Approximate size of a result in bytes
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            age = self._clock() - entry.stored_at
+            if age < entry.ttl:
+                self.hits += 1
+                QUERY_CACHE_EVENTS.inc(table, "hit")
+                set_span_attribute("cache.hit", True)
+                return entry.value
+            if age < entry.ttl + self.stale_ttl:
+                self.stale_hits += 1
+                QUERY_CACHE_EVENTS.inc(table, "stale")
+                set_span_attribute("cache.hit", True)
+                set_span_attribute("cache.stale", True)
+                if key not in self._refreshing:
+                    self._refreshing[key] = asyncio.ensure_future(
+                        self._refresh(key, table, tables, load, size_of)
+                    )
+                return entry.value
+        self.misses += 1
+        QUERY_CACHE_EVENTS.inc(table, "miss")
+        set_span_attribute("cache.hit", False)
+        return await self._load(key, table, tables, load, size_of)
+
+    async def _load(self, key, table, tables, load, size_of) -> Any:
+        # * A write during the load bumps the generation, so the result is not stored
+        generations = {name: self.generation(name) for name in tables}
+        value = await load()
+        if all(self.generation(name) == generation for name, generation in generations.items()):
+            self.put(key, table, tables, value, size_of(value))
+        return value
+
+    async def _refresh(self, key, table, tables, load, size_of) -> None:
+        # ? The caller's span has already finished; keep the refresh off it
+        activate(None)
+        try:
+            await self._load(key, table, tables, load, size_of)
+        except Exception as e:
+            logger.warning("Background refresh of cached %s query failed: %s", table, e)
+        finally:
+            self._refreshing.pop(key, None)
+
+    def put(self, key: Hashable, table: str, tables: frozenset[str], value: Any, size: int) -> None:
+        ttl = self.ttl_for(table)
+        if ttl <= 0 or size > self.max_bytes:
+            return
+        self.invalidate(key)
+        self._entries[key] = _Entry(value, tables, self._clock(), ttl, size)
+        self._bytes += size
+        for name in tables:
+            self._by_table.setdefault(name, set()).add(key)
+        while self._bytes > self.max_bytes:
+            oldest = next(iter(self._entries))
+            self.invalidate(oldest)
+
+    def invalidate(self, key: Hashable) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        self._bytes -= entry.size
+        for name in entry.tables:
+            keys = self._by_table.get(name)
+            if keys is not None:
+                keys.discard(key)
+
+    def invalidate_table(self, table: str) -> int:
+        """Evict every cached query that reads `table`."""
+        self._generations[table] = self.generation(table) + 1
+        keys = self._by_table.pop(table, set())
+        for key in keys:
+            self.invalidate(key)
+        return len(keys)
+
+    def clear(self) -> None:
+        for table in list(self._by_table):
+            self.invalidate_table(table)
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "refreshing": len(self._refreshing),
+            "live_tables": len(self._live),
+        }
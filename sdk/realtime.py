@@ -1,3 +1,4 @@
+import inspect
 import logging
 import random
 from collections.abc import Callable
@@ -6,9 +7,13 @@ from typing import Any
 from fastapi import HTTPException
 
 from app.core.third_party_integrations.supabase_home.client import get_supabase_client
+from app.core.third_party_integrations.supabase_home.transport.instrumentation import (
+    instrument_class,
+)
 
 logger = logging.getLogger(__name__)
 
+@instrument_class("realtime")
 class SupabaseRealtimeService:
     """
     Service for managing Supabase Realtime subscriptions using the official SDK patterns.
@@ -19,10 +24,6 @@ class SupabaseRealtimeService:
         self.client = client
         self.active_channels = {}
 
-async def get_realtime_service():
-    client = await get_supabase_client()
-    return SupabaseRealtimeService(client)
-
     def subscribe_to_channel(
         self,
         channel_name: str,
@@ -50,6 +51,41 @@ async def get_realtime_service():
         self.active_channels[channel_name] = channel
         return channel
 
+    async def subscribe_to_postgres_changes(
+        self,
+        channel_name: str,
+        tables: list[str],
+        on_change: Callable[[str, Any], None],
+        schema: str = "public",
+        event: str = "*",
+        on_subscribe: Callable = None,
+    ) -> Any:
+        """
+        Subscribe to row changes (postgres_changes) for one or more tables on a channel.
+        Args:
+            channel_name: Channel name
+            tables: Tables to watch (must be in the supabase_realtime publication)
+            on_change: Called with (table, payload) for every change event
+            schema: Schema of the tables
+            event: "INSERT", "UPDATE", "DELETE" or "*"
+            on_subscribe: Callback for subscribe status (optional)
+        Returns:
+            The channel object
+        """
+        channel = self.client.channel(channel_name)
+        for table in tables:
+            channel.on_postgres_changes(
+                event,
+                callback=lambda payload, table=table: on_change(table, payload),
+                table=table,
+                schema=schema,
+            )
+        subscribed = channel.subscribe(on_subscribe) if on_subscribe else channel.subscribe()
+        if inspect.isawaitable(subscribed):
+            await subscribed
+        self.active_channels[channel_name] = channel
+        return channel
+
     def send_broadcast(self, channel_name: str, event: str, payload: dict[str, Any]) -> None:
         """
         Broadcast a message to all connected clients to a channel.
@@ -63,15 +99,17 @@ async def get_realtime_service():
             raise ValueError(f"Channel '{channel_name}' is not active.")
         channel.send_broadcast(event, payload)
 
-    def remove_channel(self, channel_name: str) -> None:
+    def remove_channel(self, channel_name: str) -> Any:
         """
         Remove/unsubscribe from a channel and clean up.
         Args:
             channel_name: Channel name
+        Returns:
+            The client's result, awaitable with the async client
         """
         channel = self.active_channels.pop(channel_name, None)
         if channel:
-            self.client.remove_channel(channel)
+            return self.client.remove_channel(channel)
 
     def remove_all_channels(self) -> None:
         """
@@ -89,6 +127,11 @@ async def get_realtime_service():
         """
         return list(self.active_channels.values())
 
+
+async def get_realtime_service():
+    client = await get_supabase_client()
+    return SupabaseRealtimeService(client)
+
 # Example usage:
 # def handle_broadcast(payload):
 #     print("Cursor position received!", payload)
@@ -0,0 +1,162 @@
+import dataclasses
+import datetime
+import decimal
+import keyword
+import re
+import typing
+from collections.abc import Callable
+from functools import lru_cache
+from typing import Any
+
+from pydantic import TypeAdapter
+
+from app.core.third_party_integrations.supabase_home.sdk.schema import (
+    Column,
+    TableSchema,
+    split_select,
+)
+from app.core.third_party_integrations.supabase_home.transport.codec import msgspec
+
+# * Python types for PostgREST column formats; anything else decodes as-is
+_FORMAT_TYPES: dict[str, Any] = {
+    "smallint": int,
+    "integer": int,
+    "bigint": int,
+    "real": float,
+    "double precision": float,
+    "numeric": decimal.Decimal,
+    "boolean": bool,
+    "text": str,
+    "character varying": str,
+    "character": str,
+    "citext": str,
+    "uuid": str,
+    "date": datetime.date,
+    "time without time zone": datetime.time,
+    "timestamp without time zone": datetime.datetime,
+    "timestamp with time zone": datetime.datetime,
+}
+_JSON_TYPES: dict[str, Any] = {"integer": int, "number": float, "boolean": bool, "string": str}
+
+ROW_KINDS = ("struct", "dataclass", "namedtuple")
+DEFAULT_ROW_KIND = "struct" if msgspec is not None else "dataclass"
+
+
+def python_type(column: Column) -> Any:
+    """Python type a column's JSON value decodes to (`| None` unless the column is required)."""
+    format = column.format or ""
+    if format.endswith("[]"):
+        element = _FORMAT_TYPES.get(format[:-2], Any)
+        type_ = list[element]
+    elif format in _FORMAT_TYPES:
+        type_ = _FORMAT_TYPES[format]
+    elif column.type == "array":
+        type_ = list
+    else:
+        type_ = _JSON_TYPES.get(column.type or "", Any)
+    return type_ if column.required or type_ is Any else type_ | None
+
+
+def select_fields(table: TableSchema, select: str = "*") -> list[tuple[str, Any]]:
+    """`(key, python type)` for each value a row of `select` carries."""
+    fields = []
+    for term in split_select(select):
+        if "(" in term:
+            raise ValueError(
+                f"Generated row types cover the columns of '{table.name}' only; "
+                "pass a model to decode embedded resources or aggregates"
+            )
+        if term == "*":
+            fields.extend((name, python_type(column)) for name, column in table.columns.items())
+            continue
+        expression, _, cast = term.partition("::")
+        alias, _, expression = expression.rpartition(":")
+        column, _, path = (part.strip() for part in expression.partition("->"))
+        table.check_columns([column])
+        # * PostgREST names a JSON path by its last key
+        name = alias or re.split(r"->>?", expression)[-1].strip("'\" ")
+        fields.append((name, Any if cast or path else python_type(table.columns[column])))
+    return list(dict(fields).items())
+
+
+@lru_cache(maxsize=256)
+def make_row_type(table: TableSchema, select: str = "*", kind: str = "struct") -> type:
+    """
+    A compact record type for the rows `select` returns from `table`, built
+    from the schema and reused for identical requests.
+
+    Args:
+        kind: "struct" (msgspec Struct without GC tracking; needs msgspec),
+            "dataclass" (slotted dataclass) or "namedtuple"
+
+    Raises:
+        ValueError: For an unknown kind or column, or a select with embeds
+    """
+    if kind not in ROW_KINDS:
+        raise ValueError(f"Unknown row kind '{kind}'; expected one of {ROW_KINDS}")
+    fields = select_fields(table, select)
+    name = "".join(part.title() for part in re.split(r"\W+|_", table.name) if part) + "Row"
+    if kind == "struct":
+        if msgspec is None:
+            raise ValueError("Row kind 'struct' needs msgspec; use 'dataclass' or 'namedtuple'")
+        # ? Struct fields must be identifiers; rename maps them back to the JSON keys
+        renamed = [(_identifier(field), type_) for field, type_ in fields]
+        return msgspec.defstruct(
+            name,
+            renamed,
+            rename={new: old for (new, _), (old, _) in zip(renamed, fields) if new != old},
+            gc=False,
+        )
+    invalid = [field for field, _ in fields if _identifier(field) != field]
+    if invalid:
+        raise ValueError(f"Columns {invalid} are not valid {kind} field names; use kind='struct'")
+    if kind == "dataclass":
+        return dataclasses.make_dataclass(name, fields, slots=True)
+    return typing.NamedTuple(name, fields)
+
+
+def _identifier(name: str) -> str:
+    identifier = re.sub(r"\W", "_", name)
+    if not identifier or identifier[0].isdigit() or keyword.iskeyword(identifier):
+        identifier = f"f_{identifier}"
+    return identifier
+
+
+@lru_cache(maxsize=256)
+def rows_decoder(type_: Any) -> Callable[[bytes], list[Any]]:
+    """
+    Decode a JSON array of rows straight into `list[type_]`, validating each
+    field, without building per-row dicts first.
+
+    msgspec Structs and dataclasses use msgspec when it is installed; other
+    types (named tuples, pydantic models, TypedDicts) use pydantic; named
+    tuples then reject keys they have no field for. Types with `Decimal`
+    fields are parsed by msgspec before pydantic validates them, so numeric
+    values keep their precision. Invalid rows raise a `ValueError` subclass
+    naming the offending field.
+    """
+    if msgspec is not None and (
+        isinstance(type_, type) and issubclass(type_, msgspec.Struct)
+        or dataclasses.is_dataclass(type_)
+    ):
+        return msgspec.json.Decoder(list[type_]).decode
+    adapter = TypeAdapter(list[type_])
+    if msgspec is not None and _has_decimal(type_):
+        # ! pydantic parses JSON numbers as floats first; msgspec keeps numeric values exact
+        parse = msgspec.json.Decoder(float_hook=decimal.Decimal).decode
+        return lambda body: adapter.validate_python(parse(body))
+    return adapter.validate_json
+
+
+def _has_decimal(type_: Any) -> bool:
+    try:
+        hints = typing.get_type_hints(type_)
+    except Exception:
+        return False
+    pending = list(hints.values())
+    while pending:
+        hint = pending.pop()
+        if hint is decimal.Decimal:
+            return True
+        pending.extend(typing.get_args(hint))
+    return False
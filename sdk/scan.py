@@ -0,0 +1,179 @@
+import asyncio
+import logging
+from collections.abc import AsyncIterator, Callable, Sequence
+from datetime import datetime
+from typing import Any
+
+from app.core.third_party_integrations.supabase_home.sdk.pagination import KeysetCursor
+
+logger = logging.getLogger("apps.supabase_home")
+
+# * A partition is a half-open key range [low, high); None leaves that side unbounded
+Partition = tuple[Any, Any]
+PageSource = Callable[[Partition, KeysetCursor], AsyncIterator[list[dict[str, Any]]]]
+
+_DONE = object()
+
+
+class ScanProgress:
+    """
+    Running totals for a partitioned scan, passed to the `on_progress` callback.
+    """
+
+    __slots__ = ("partitions", "completed", "rows", "pages", "retries")
+
+    def __init__(self, partitions: int):
+        self.partitions = partitions
+        self.completed = 0
+        self.rows = 0
+        self.pages = 0
+        self.retries = 0
+
+    def as_dict(self) -> dict[str, int]:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+class _PartitionFailed:
+    __slots__ = ("error",)
+
+    def __init__(self, error: BaseException):
+        self.error = error
+
+
+def _parse_bound(value: Any) -> float | int | datetime:
+    if isinstance(value, (int, float, datetime)) and not isinstance(value, bool):
+        return value
+    if isinstance(value, str):
+        try:
+            return datetime.fromisoformat(value)
+        except ValueError:
+            pass
+        try:
+            return float(value)
+        except ValueError:
+            pass
+    raise ValueError(f"Cannot split on non-numeric, non-timestamp value {value!r}")
+
+
+def compute_split_points(low: Any, high: Any, partitions: int) -> list[Any]:
+    """
+    Evenly spaced interior split points between `low` and `high`.
+
+    Integers stay integers and ISO timestamps come back as ISO strings, so the
+    points can be used directly in filters. Duplicate points (narrow ranges)
+    are dropped.
+    """
+    if partitions < 2:
+        return []
+    start, end = _parse_bound(low), _parse_bound(high)
+    step = (end - start) / partitions
+    points = []
+    for i in range(1, partitions):
+        point = start + step * i
+        if isinstance(start, int) and isinstance(end, int):
+            point = int(point)
+        elif isinstance(point, datetime):
+            point = point.isoformat()
+        if point not in points and point != low:
+            points.append(point)
+    return points
+
+
+def partitions_from_points(points: Sequence[Any]) -> list[Partition]:
+    """Turn sorted interior split points into ranges covering the whole key space."""
+    bounds = [None, *points, None]
+    return list(zip(bounds[:-1], bounds[1:]))
+
+
+async def scan_partitions(
+    partitions: Sequence[Partition],
+    pages: PageSource,
+    key: Sequence[str],
+    max_concurrency: int = 4,
+    ordered: bool = False,
+    retries: int = 2,
+    backoff: Callable[[int], float] = lambda attempt: 0.5 * attempt,
+    on_progress: Callable[[ScanProgress], Any] | None = None,
+) -> AsyncIterator[list[dict[str, Any]]]:
+    """
+    Fetch partitions concurrently and stream their pages.
+
+    Each partition is read with keyset paging; when it fails, it is retried from
+    its last delivered page, so no rows are repeated or skipped. With `ordered`
+    pages are yielded in partition order (later partitions buffer at most two pages
+    each), otherwise as soon as they arrive.
+
+    Args:
+        partitions: Key ranges in ascending key order
+        pages: Yields the pages of one partition starting after the cursor
+        key: Ordering columns for keyset paging inside a partition
+        max_concurrency: Partitions fetched at once
+        retries: Extra attempts per partition before the scan fails
+        backoff: Seconds to wait before the given retry (1-based)
+        on_progress: Called after every page with the running `ScanProgress`
+    """
+    progress = ScanProgress(len(partitions))
+    semaphore = asyncio.Semaphore(max_concurrency)
+    if ordered:
+        queues = [asyncio.Queue(maxsize=2) for _ in partitions]
+    else:
+        shared = asyncio.Queue(maxsize=2 * max_concurrency)
+        queues = [shared] * len(partitions)
+
+    async def run(index: int, partition: Partition) -> None:
+        queue = queues[index]
+        cursor = KeysetCursor(key)
+        attempt = 0
+        async with semaphore:
+            while True:
+                try:
+                    async for page in pages(partition, cursor):
+                        await queue.put(page)
+                        progress.pages += 1
+                        progress.rows += len(page)
+                        if on_progress is not None:
+                            on_progress(progress)
+                    break
+                except Exception as e:
+                    attempt += 1
+                    if attempt > retries:
+                        await queue.put(_PartitionFailed(e))
+                        return
+                    progress.retries += 1
+                    logger.warning(
+                        "Scan partition %s failed (attempt %d), retrying: %s",
+                        partition,
+                        attempt,
+                        e,
+                    )
+                    await asyncio.sleep(backoff(attempt))
+        progress.completed += 1
+        if on_progress is not None:
+            on_progress(progress)
+        await queue.put(_DONE)
+
+    tasks = [
+        asyncio.ensure_future(run(index, partition))
+        for index, partition in enumerate(partitions)
+    ]
+    try:
+        if ordered:
+            for queue in queues:
+                while (item := await queue.get()) is not _DONE:
+                    if isinstance(item, _PartitionFailed):
+                        raise item.error
+                    yield item
+        else:
+            remaining = len(partitions)
+            while remaining:
+                item = await shared.get()
+                if item is _DONE:
+                    remaining -= 1
+                elif isinstance(item, _PartitionFailed):
+                    raise item.error
+                else:
+                    yield item
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
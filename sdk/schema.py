@@ -0,0 +1,402 @@
+import asyncio
+import json
+import logging
+import os
+import re
+import time
+from collections.abc import Callable, Iterable, Mapping
+from typing import Any
+
+import httpx
+
+from app.core.third_party_integrations.supabase_home.sdk.filters import (
+    FilterLike,
+    as_filter,
+    filter_columns,
+)
+
+logger = logging.getLogger("apps.supabase_home")
+
+# * PostgREST annotates foreign keys in column descriptions: <fk table='users' column='id'/>
+_FOREIGN_KEY = re.compile(r"<fk table='([^']+)' column='([^']+)'/>")
+_PRIMARY_KEY = "<pk/>"
+
+
+def split_select(select: str) -> list[str]:
+    """Top-level terms of a select string; embedded resources stay whole."""
+    terms, depth, start = [], 0, 0
+    for index, char in enumerate(select + ","):
+        if char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+        elif char == "," and depth == 0:
+            term = select[start:index].strip()
+            start = index + 1
+            if term:
+                terms.append(term)
+    return terms
+
+
+def select_columns(select: str) -> list[str]:
+    """
+    Columns of the queried table named in a select string. Aliases, casts and
+    JSON paths are reduced to the column; `*`, embeds and aggregates are skipped.
+    """
+    columns = []
+    for term in split_select(select):
+        if term == "*" or "(" in term:
+            continue
+        term = term.split("::", 1)[0]
+        term = term.split(":", 1)[-1]
+        columns.append(term.split("->", 1)[0].strip())
+    return columns
+
+
+class Column:
+    """One column of a table as described by PostgREST."""
+
+    __slots__ = ("name", "type", "format", "required", "primary_key", "default")
+
+    def __init__(
+        self,
+        name: str,
+        type: str | None = None,
+        format: str | None = None,
+        required: bool = False,
+        primary_key: bool = False,
+        default: Any = None,
+    ):
+        self.name = name
+        self.type = type
+        self.format = format
+        self.required = required
+        self.primary_key = primary_key
+        self.default = default
+
+    def __repr__(self) -> str:
+        return f"Column({self.name!r}, {self.format or self.type!r})"
+
+
+class TableSchema:
+    """
+    Columns and primary key of a table or view. Column projections are built
+    once per include/exclude combination and reused.
+    """
+
+    __slots__ = ("name", "columns", "primary_key", "_projections")
+
+    def __init__(self, name: str, columns: Iterable[Column]):
+        self.name = name
+        self.columns = {column.name: column for column in columns}
+        self.primary_key = tuple(
+            column.name for column in self.columns.values() if column.primary_key
+        )
+        self._projections: dict[tuple, str] = {}
+
+    def check_columns(self, columns: Iterable[str]) -> None:
+        """
+        Raises:
+            ValueError: If any of `columns` is not a column of this table
+        """
+        unknown = sorted(set(columns) - self.columns.keys())
+        if unknown:
+            raise ValueError(
+                f"Unknown column(s) {', '.join(unknown)} on '{self.name}'"
+            )
+
+    def projection(self, include: Iterable[str] | None = None, exclude: Iterable[str] = ()) -> str:
+        """
+        An explicit select list: `include` (default: every column, in table
+        order) without `exclude`.
+        """
+        key = (tuple(include) if include is not None else None, frozenset(exclude))
+        projection = self._projections.get(key)
+        if projection is None:
+            names = list(self.columns) if key[0] is None else list(key[0])
+            self.check_columns(names)
+            self.check_columns(key[1])
+            projection = ",".join(name for name in names if name not in key[1])
+            self._projections[key] = projection
+        return projection
+
+
+class Relationship:
+    """
+    A foreign key `table.column -> foreign_table.foreign_column`.
+    """
+
+    __slots__ = ("table", "column", "foreign_table", "foreign_column")
+
+    def __init__(self, table: str, column: str, foreign_table: str, foreign_column: str):
+        self.table = table
+        self.column = column
+        self.foreign_table = foreign_table
+        self.foreign_column = foreign_column
+
+    def __repr__(self) -> str:
+        return f"{self.table}.{self.column} -> {self.foreign_table}.{self.foreign_column}"
+
+
+class SchemaCatalog:
+    """
+    Tables, columns, primary keys and foreign-key relationships exposed by
+    PostgREST, parsed from its OpenAPI document.
+    """
+
+    def __init__(
+        self,
+        tables: Mapping[str, TableSchema],
+        relationships: list[Relationship],
+        loaded_at: float | None = None,
+    ):
+        self.tables = dict(tables)
+        self.relationships = relationships
+        self.loaded_at = time.monotonic() if loaded_at is None else loaded_at
+        self._by_table: dict[str, list[Relationship]] = {}
+        for relationship in relationships:
+            self._by_table.setdefault(relationship.table, []).append(relationship)
+            if relationship.foreign_table != relationship.table:
+                self._by_table.setdefault(relationship.foreign_table, []).append(relationship)
+
+    @classmethod
+    def from_openapi(cls, document: Mapping[str, Any]) -> "SchemaCatalog":
+        tables, relationships = {}, []
+        for table, definition in (document.get("definitions") or {}).items():
+            required = set(definition.get("required") or ())
+            columns = []
+            for column, spec in (definition.get("properties") or {}).items():
+                description = spec.get("description") or ""
+                columns.append(
+                    Column(
+                        column,
+                        type=spec.get("type"),
+                        format=spec.get("format"),
+                        required=column in required,
+                        primary_key=_PRIMARY_KEY in description,
+                        default=spec.get("default"),
+                    )
+                )
+                for foreign_table, foreign_column in _FOREIGN_KEY.findall(description):
+                    relationships.append(
+                        Relationship(table, column, foreign_table, foreign_column)
+                    )
+            tables[table] = TableSchema(table, columns)
+        return cls(tables, relationships)
+
+    def table(self, name: str) -> TableSchema:
+        """
+        Raises:
+            ValueError: If PostgREST does not expose `name`
+        """
+        try:
+            return self.tables[name]
+        except KeyError:
+            raise ValueError(f"Unknown table '{name}'") from None
+
+    def primary_key(self, table: str) -> tuple[str, ...]:
+        """Primary key columns of `table` (empty for views without one)."""
+        return self.table(table).primary_key
+
+    def projection(
+        self, table: str, include: Iterable[str] | None = None, exclude: Iterable[str] = ()
+    ) -> str:
+        return self.table(table).projection(include, exclude)
+
+    def validate_query(
+        self,
+        table: str,
+        select: str = "*",
+        filters: FilterLike | None = None,
+        order: str | None = None,
+    ) -> None:
+        """
+        Check the columns a query names against the table, so a typo fails
+        here instead of as an upstream 400.
+
+        Raises:
+            ValueError: If the table or any selected, filtered or ordered column
+                does not exist
+        """
+        schema = self.table(table)
+        columns = set(select_columns(select))
+        expression = as_filter(filters)
+        if expression is not None:
+            columns |= filter_columns(expression)
+        if order:
+            columns |= {term.strip().split(".", 1)[0] for term in order.split(",")}
+        schema.check_columns(columns)
+
+    def relationships_between(self, table: str, other: str) -> list[Relationship]:
+        """Foreign keys linking `table` and `other`, in either direction."""
+        return [
+            relationship
+            for relationship in self._by_table.get(table, [])
+            if {relationship.table, relationship.foreign_table} == {table, other}
+        ]
+
+    def junctions(self, table: str, other: str) -> list[str]:
+        """Tables holding foreign keys to both `table` and `other` (many-to-many)."""
+        referencing = lambda target: {  # noqa: E731
+            relationship.table
+            for relationship in self._by_table.get(target, [])
+            if relationship.foreign_table == target and relationship.table != target
+        }
+        return sorted(referencing(table) & referencing(other) - {table, other})
+
+    def is_to_many(self, table: str, relationship: Relationship) -> bool:
+        """Whether embedding across `relationship` from `table` returns a list."""
+        return relationship.foreign_table == table and relationship.table != table
+
+    def cardinality(self, table: str, resource: str, via: str | None = None) -> str:
+        """
+        "one" or "many": whether embedding `resource` from `table` returns an
+        object or a list. Tables linked only through a junction table are "many".
+        """
+        if via is None and not self.relationships_between(table, resource):
+            if self.junctions(table, resource):
+                return "many"
+        relationship = self.resolve(table, resource, via)
+        return "many" if self.is_to_many(table, relationship) else "one"
+
+    def resolve(self, table: str, resource: str, via: str | None = None) -> Relationship:
+        """
+        Find the relationship used to embed `resource` from `table`.
+
+        Args:
+            via: Foreign key column that disambiguates several relationships
+
+        Raises:
+            ValueError: If the tables are not related, or related more than once
+                without `via`
+        """
+        candidates = self.relationships_between(table, resource)
+        if via is not None:
+            candidates = [relationship for relationship in candidates if relationship.column == via]
+        if not candidates:
+            raise ValueError(f"No relationship between '{table}' and '{resource}'")
+        if len(candidates) > 1:
+            columns = ", ".join(sorted({relationship.column for relationship in candidates}))
+            raise ValueError(
+                f"'{table}' and '{resource}' are related more than once; pass via= one of {columns}"
+            )
+        return candidates[0]
+
+
+async def fetch_openapi(client: Any) -> dict[str, Any]:
+    """
+    Fetch the PostgREST OpenAPI document through the client's REST session.
+    """
+    postgrest = client.postgrest
+    session = postgrest.session
+    base_url = str(getattr(postgrest, "base_url", None) or session.base_url).rstrip("/")
+    headers = httpx.Headers(getattr(postgrest, "headers", None) or session.headers)
+    headers["Accept"] = "application/openapi+json"
+    response = await session.get(f"{base_url}/", headers=headers)
+    response.raise_for_status()
+    return response.json()
+
+
+class SchemaCache:
+    """
+    Loads the schema catalog on first use and reloads it after `ttl` seconds.
+    Concurrent callers share one load. A failed load is re-raised without
+    another request for `retry_after` seconds.
+
+    With a `path` the OpenAPI document is also kept on disk, so restarted
+    workers reuse it until it is `ttl` seconds old instead of fetching it again.
+    """
+
+    def __init__(
+        self,
+        loader: Callable[[], Any],
+        ttl: float = 300.0,
+        path: str | None = None,
+        retry_after: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.loader = loader
+        self.ttl = ttl
+        self.path = path
+        self.retry_after = retry_after
+        self._clock = clock
+        self._catalog: SchemaCatalog | None = None
+        self._loading: asyncio.Future | None = None
+        self._failure: tuple[float, BaseException] | None = None
+
+    @classmethod
+    def from_config(cls, config: Any, loader: Callable[[], Any]) -> "SchemaCache":
+        return cls(loader, ttl=config.schema_cache_ttl, path=config.schema_cache_path)
+
+    async def get(self, refresh: bool = False) -> SchemaCatalog:
+        catalog = self._catalog
+        if catalog is not None and not refresh and self._clock() - catalog.loaded_at < self.ttl:
+            return catalog
+        failure = self._failure
+        if failure is not None and not refresh and self._clock() - failure[0] < self.retry_after:
+            raise failure[1]
+        if self._loading is None:
+            self._loading = asyncio.ensure_future(self._load(refresh))
+        loading = self._loading
+        try:
+            return await asyncio.shield(loading)
+        finally:
+            if self._loading is loading and loading.done():
+                self._loading = None
+
+    async def _load(self, refresh: bool) -> SchemaCatalog:
+        cached = None
+        if self.path and not refresh:
+            cached = await asyncio.to_thread(self._read_disk)
+        if cached is not None:
+            document, age = cached
+            catalog = SchemaCatalog.from_openapi(document)
+        else:
+            try:
+                document = await self.loader()
+                catalog = SchemaCatalog.from_openapi(document)
+            except Exception as e:
+                self._failure = (self._clock(), e)
+                raise
+            age = 0.0
+            if self.path:
+                await asyncio.to_thread(self._write_disk, document)
+        self._failure = None
+        # * A document read from disk expires when its original fetch does
+        catalog.loaded_at = self._clock() - age
+        self._catalog = catalog
+        logger.debug(
+            "Loaded schema catalog with %d tables and %d relationships",
+            len(catalog.tables),
+            len(catalog.relationships),
+        )
+        return catalog
+
+    def _read_disk(self) -> tuple[dict[str, Any], float] | None:
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                cached = json.load(f)
+            age = time.time() - cached["fetched_at"]
+            document = cached["document"]
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning("Ignoring unreadable schema cache %s: %s", self.path, e)
+            return None
+        if not isinstance(document, dict) or not 0 <= age < self.ttl:
+            return None
+        return document, age
+
+    def _write_disk(self, document: dict[str, Any]) -> None:
+        # ? Write then rename so concurrent workers never read a partial file
+        temporary = f"{self.path}.{os.getpid()}.tmp"
+        try:
+            with open(temporary, "w", encoding="utf-8") as f:
+                json.dump({"fetched_at": time.time(), "document": document}, f)
+            os.replace(temporary, self.path)
+        except OSError as e:
+            logger.warning("Could not write schema cache %s: %s", self.path, e)
+
+    def invalidate(self) -> None:
+        self._catalog = None
+        self._failure = None
@@ -1,6 +1,29 @@
+from collections.abc import Awaitable
 from typing import Any, BinaryIO, List
 
+from storage3 import AsyncBucket
+
 from app.core.third_party_integrations.supabase_home.client import get_supabase_client
+from app.core.third_party_integrations.supabase_home.config import supabase_config
+from app.core.third_party_integrations.supabase_home.transport.hedging import hedger
+from app.core.third_party_integrations.supabase_home.transport.instrumentation import (
+    instrument_class,
+)
+
+
+def _session_headers(storage: Any) -> dict[str, str]:
+    # ? storage3 keeps the session's apikey/Authorization on the client; forwarding them
+    # ? keeps RLS and the cache key tied to the SDK session
+    headers = getattr(storage, "_headers", None) or {}
+    return {name: headers[name] for name in ("apikey", "Authorization") if name in headers}
+
+
+async def _then_invalidate(http: Any, awaitable: Awaitable[Any], *endpoints: str) -> Any:
+    try:
+        return await awaitable
+    finally:
+        for endpoint in endpoints:
+            http.http_cache.invalidate_prefix(f"{http.base_url}{endpoint}")
 
 
 class SupabaseStorageService:
@@ -8,63 +31,146 @@ class SupabaseStorageService:
     Service for interacting with Supabase Storage API using the official SDK patterns.
     Provides methods for bucket and file operations, matching the supabase-py API.
     Grouped into logical nested classes: Bucket and File.
+
+    Given `http` (a `SupabaseUnsecureService`), bucket reads and downloads go
+    through its ETag-aware response cache when `cache=True` is passed or
+    `SupabaseConfig.enable_http_cache` is set, and writes through this service
+    drop the affected cached entries.
     """
-    def __init__(self, client):
+    def __init__(self, client, http: Any = None):
         self.client = client
         self.storage = self.client.storage
-        self.bucket = self.Bucket(self.storage)
-        self.file = self.File(self.storage)
-
-async def get_storage_service():
-    client = await get_supabase_client()
-    return SupabaseStorageService(client)
+        self.bucket = self.Bucket(self.storage, http)
+        self.file = self.File(self.storage, http)
 
+    @instrument_class("storage.bucket")
     class Bucket:
-        def __init__(self, storage):
+        def __init__(self, storage, http: Any = None):
             self.storage = storage
+            self.http = http
+
+        def _cached(self, cache: bool | None) -> bool:
+            return self.http is not None and (
+                supabase_config.enable_http_cache if cache is None else cache
+            )
+
+        def _invalidating(self, awaitable: Any) -> Any:
+            if self.http is None or not len(self.http.http_cache):
+                return awaitable
+            return _then_invalidate(self.http, awaitable, "/storage/v1/bucket")
 
         def create(self, bucket_id: str, options: dict[str, Any]) -> Any:
-            return self.storage.create_bucket(bucket_id, options=options)
+            return self._invalidating(self.storage.create_bucket(bucket_id, options=options))
 
-        def get(self, bucket_id: str) -> Any:
+        def get(self, bucket_id: str, cache: bool | None = None) -> Any:
+            if self._cached(cache):
+                return self._get_cached(bucket_id)
             return self.storage.get_bucket(bucket_id)
 
-        def list(self) -> Any:
+        def list(self, cache: bool | None = None) -> Any:
+            if self._cached(cache):
+                return self._list_cached()
             return self.storage.list_buckets()
 
         def update(self, bucket_id: str, options: dict[str, Any]) -> Any:
-            return self.storage.update_bucket(bucket_id, options=options)
+            return self._invalidating(self.storage.update_bucket(bucket_id, options=options))
 
         def delete(self, bucket_id: str) -> Any:
-            return self.storage.delete_bucket(bucket_id)
+            return self._invalidating(self.storage.delete_bucket(bucket_id))
 
         def empty(self, bucket_id: str) -> Any:
             return self.storage.empty_bucket(bucket_id)
 
+        async def _get_cached(self, bucket_id: str) -> AsyncBucket:
+            data = await self.http.get_bucket(
+                bucket_id, headers=_session_headers(self.storage), cache=True
+            )
+            return AsyncBucket(**data)
+
+        async def _list_cached(self) -> List[AsyncBucket]:
+            data = await self.http.list_buckets(headers=_session_headers(self.storage), cache=True)
+            return [AsyncBucket(**bucket) for bucket in data]
+
+    @instrument_class("storage.file")
     class File:
-        def __init__(self, storage):
+        def __init__(self, storage, http: Any = None):
             self.storage = storage
+            self.http = http
+
+        def _cached(self, cache: bool | None) -> bool:
+            return self.http is not None and (
+                supabase_config.enable_http_cache if cache is None else cache
+            )
+
+        def _invalidating(self, awaitable: Any, bucket_id: str, *paths: str) -> Any:
+            if self.http is None or not len(self.http.http_cache):
+                return awaitable
+            endpoints = [
+                f"{prefix}/{bucket_id}/{path.lstrip('/')}"
+                for path in paths
+                for prefix in ("/storage/v1/object", "/storage/v1/object/public")
+            ]
+            return _then_invalidate(self.http, awaitable, *endpoints)
 
         def upload(self, bucket_id: str, path: str, file: BinaryIO | bytes | str, file_options: dict[str, Any]) -> Any:
-            return self.storage.from_(bucket_id).upload(file=file, path=path, file_options=file_options)
-
-        def download(self, bucket_id: str, path: str) -> bytes:
+            return self._invalidating(
+                self.storage.from_(bucket_id).upload(file=file, path=path, file_options=file_options),
+                bucket_id,
+                path,
+            )
+
+        def download(
+            self,
+            bucket_id: str,
+            path: str,
+            hedge: bool = False,
+            public: bool = False,
+            cache: bool | None = None,
+        ) -> bytes:
+            """
+            Args:
+                public: Read through the public object route (needs `http` for caching)
+                cache: Revalidate repeat downloads with If-None-Match (see class docstring)
+            """
+            if self._cached(cache):
+                return self.http.download_object(
+                    bucket_id,
+                    path,
+                    public=public,
+                    headers=_session_headers(self.storage),
+                    cache=True,
+                )
+            if hedge:
+                # * Duplicate slow downloads after the observed p95; first response wins
+                return hedger.run(
+                    ("storage.file.download", bucket_id),
+                    lambda: self.storage.from_(bucket_id).download(path),
+                    service="storage",
+                )
             return self.storage.from_(bucket_id).download(path)
 
         def list(self, bucket_id: str, folder: str = "", options: dict[str, Any] | None = None) -> Any:
             return self.storage.from_(bucket_id).list(folder, options or {})
 
         def update(self, bucket_id: str, path: str, file: BinaryIO | bytes | str, file_options: dict[str, Any]) -> Any:
-            return self.storage.from_(bucket_id).update(file=file, path=path, file_options=file_options)
+            return self._invalidating(
+                self.storage.from_(bucket_id).update(file=file, path=path, file_options=file_options),
+                bucket_id,
+                path,
+            )
 
         def move(self, bucket_id: str, from_path: str, to_path: str) -> Any:
-            return self.storage.from_(bucket_id).move(from_path, to_path)
+            return self._invalidating(
+                self.storage.from_(bucket_id).move(from_path, to_path), bucket_id, from_path, to_path
+            )
 
         def copy(self, bucket_id: str, from_path: str, to_path: str) -> Any:
-            return self.storage.from_(bucket_id).copy(from_path, to_path)
+            return self._invalidating(
+                self.storage.from_(bucket_id).copy(from_path, to_path), bucket_id, to_path
+            )
 
         def remove(self, bucket_id: str, paths: List[str]) -> Any:
-            return self.storage.from_(bucket_id).remove(paths)
+            return self._invalidating(self.storage.from_(bucket_id).remove(paths), bucket_id, *paths)
 
         def create_signed_url(self, bucket_id: str, path: str, expires_in: int, options: dict[str, Any] | None) -> Any:
             return self.storage.from_(bucket_id).create_signed_url(path, expires_in, options or {})
@@ -80,3 +186,8 @@ async def get_storage_service():
 
         def get_public_url(self, bucket_id: str, path: str, options: dict[str, Any] | None) -> Any:
             return self.storage.from_(bucket_id).get_public_url(path, options or {})
+
+
+async def get_storage_service():
+    client = await get_supabase_client()
+    return SupabaseStorageService(client)
@@ -0,0 +1,188 @@
+import asyncio
+import inspect
+import logging
+import time
+from collections.abc import Callable, Iterable
+from typing import Any
+
+from app.core.third_party_integrations.supabase_home.config import supabase_config
+
+logger = logging.getLogger("apps.supabase_home")
+
+FailureHook = Callable[[str, list[dict[str, Any]], BaseException], Any]
+
+
+class _TableQueue:
+    __slots__ = ("rows", "bytes", "pending", "oldest", "task")
+
+    def __init__(self):
+        self.rows: list[dict[str, Any]] = []
+        self.bytes = 0
+        # * Queued plus in-flight rows; bounded by max_pending_rows for backpressure
+        self.pending = 0
+        self.oldest = 0.0
+        self.task: asyncio.Task | None = None
+
+
+class WriteBehindBuffer:
+    """
+    Coalesces single-row inserts into batched bulk inserts per table.
+
+    A table's queue is flushed when it holds `max_rows` rows or `max_bytes`
+    encoded bytes, or when its oldest row has waited `flush_interval` seconds.
+    `add` blocks once `max_pending_rows` rows are queued or in flight for a
+    table, so a slow database pushes back on producers instead of growing memory.
+    Rows that still fail after retries are passed to `on_failure`.
+
+    Use as an async context manager, or call `aclose()` on shutdown to flush
+    everything that is still buffered.
+    """
+
+    def __init__(
+        self,
+        db: Any,
+        max_rows: int | None = None,
+        max_bytes: int | None = None,
+        flush_interval: float | None = None,
+        max_pending_rows: int | None = None,
+        on_failure: FailureHook | None = None,
+        retries: int = 2,
+    ):
+        self.db = db
+        self.max_rows = max_rows or supabase_config.write_buffer_max_rows
+        self.max_bytes = max_bytes or supabase_config.write_buffer_max_bytes
+        self.flush_interval = flush_interval or supabase_config.write_buffer_flush_interval
+        self.max_pending_rows = max(
+            max_pending_rows or supabase_config.write_buffer_max_pending_rows, self.max_rows
+        )
+        self.on_failure = on_failure
+        self.retries = retries
+        self._queues: dict[str, _TableQueue] = {}
+        self._space = asyncio.Condition()
+        self._timer: asyncio.Task | None = None
+        self._closed = False
+        self.flushed_rows = 0
+        self.failed_rows = 0
+
+    async def add(self, table: str, record: dict[str, Any]) -> None:
+        """
+        Queue one row for `table`, waiting while the table's backlog is full.
+        """
+        if self._closed:
+            raise RuntimeError("WriteBehindBuffer is closed")
+        queue = self._queues.get(table)
+        if queue is None:
+            queue = self._queues[table] = _TableQueue()
+        if queue.pending >= self.max_pending_rows:
+            self._schedule(table, queue)
+            async with self._space:
+                await self._space.wait_for(lambda: queue.pending < self.max_pending_rows)
+        if not queue.rows:
+            queue.oldest = time.monotonic()
+        queue.rows.append(record)
+        queue.pending += 1
+        queue.bytes += len(self.db.codec.encode(record)) + 1
+        if len(queue.rows) >= self.max_rows or queue.bytes >= self.max_bytes:
+            self._schedule(table, queue)
+        self._ensure_timer()
+
+    async def add_many(self, table: str, records: Iterable[dict[str, Any]]) -> None:
+        for record in records:
+            await self.add(table, record)
+
+    async def flush(self, table: str | None = None) -> None:
+        """
+        Flush buffered rows now (one table or all) and wait for the writes.
+        """
+        tables = [table] if table is not None else list(self._queues)
+        tasks = []
+        for name in tables:
+            queue = self._queues.get(name)
+            if queue is None:
+                continue
+            if queue.rows:
+                self._schedule(name, queue)
+            if queue.task is not None:
+                tasks.append(queue.task)
+        if tasks:
+            await asyncio.gather(*tasks)
+
+    async def aclose(self) -> None:
+        """
+        Stop accepting rows, flush everything buffered and stop the timer.
+        """
+        self._closed = True
+        if self._timer is not None:
+            self._timer.cancel()
+            await asyncio.gather(self._timer, return_exceptions=True)
+            self._timer = None
+        await self.flush()
+
+    async def __aenter__(self) -> "WriteBehindBuffer":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "pending": {name: queue.pending for name, queue in self._queues.items()},
+            "flushed_rows": self.flushed_rows,
+            "failed_rows": self.failed_rows,
+        }
+
+    def _schedule(self, table: str, queue: _TableQueue) -> None:
+        if queue.task is None or queue.task.done():
+            queue.task = asyncio.ensure_future(self._flush_table(table, queue))
+
+    def _ensure_timer(self) -> None:
+        if self._timer is None or self._timer.done():
+            self._timer = asyncio.ensure_future(self._run_timer())
+
+    async def _run_timer(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval / 2)
+            deadline = time.monotonic() - self.flush_interval
+            for table, queue in list(self._queues.items()):
+                if queue.rows and queue.oldest <= deadline:
+                    self._schedule(table, queue)
+
+    async def _flush_table(self, table: str, queue: _TableQueue) -> None:
+        # * One flush task per table at a time keeps each table's rows in order
+        while queue.rows:
+            rows, queue.rows, queue.bytes = queue.rows, [], 0
+            try:
+                result = await self.db.bulk_insert(
+                    table,
+                    rows,
+                    returning="minimal",
+                    chunk_rows=self.max_rows,
+                    chunk_bytes=self.max_bytes,
+                    retries=self.retries,
+                )
+                failures = [(chunk.rows, chunk.error) for chunk in result.failed]
+            except Exception as e:
+                failures = [(rows, e)]
+            failed = sum(len(chunk_rows) for chunk_rows, _ in failures)
+            self.flushed_rows += len(rows) - failed
+            self.failed_rows += failed
+            for chunk_rows, error in failures:
+                await self._report_failure(table, chunk_rows, error)
+            queue.pending -= len(rows)
+            async with self._space:
+                self._space.notify_all()
+
+    async def _report_failure(
+        self, table: str, rows: list[dict[str, Any]], error: BaseException
+    ) -> None:
+        logger.error(
+            "Write-behind flush of %d row(s) to %s failed: %s", len(rows), table, error
+        )
+        if self.on_failure is None:
+            return
+        try:
+            outcome = self.on_failure(table, rows, error)
+            if inspect.isawaitable(outcome):
+                await outcome
+        except Exception:
+            logger.exception("Write-behind failure hook raised for table %s", table)
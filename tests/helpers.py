@@ -0,0 +1,111 @@
+"""Fakes shared by the service tests: Supabase clients over mock transports."""
+
+import functools
+import json
+
+import httpx
+from postgrest import AsyncPostgrestClient
+
+from app.core.third_party_integrations.supabase_home import _service
+from app.core.third_party_integrations.supabase_home.config import supabase_config
+
+
+def make_service(monkeypatch, handler, **config):
+    """
+    A `SupabaseUnsecureService` whose pooled HTTP client sends every request
+    to `handler` through `httpx.MockTransport`. Keyword arguments override
+    `SupabaseConfig` fields for the test.
+    """
+    overrides = {
+        "url": "https://example.supabase.co",
+        "anon_key": "anon-key",
+        "service_role_key": "service-key",
+        **config,
+    }
+    for name, value in overrides.items():
+        monkeypatch.setattr(supabase_config, name, value)
+    monkeypatch.setattr(_service, "create_client", lambda url, key: None)
+    monkeypatch.setattr(
+        _service.SupabaseUnsecureService, "_configure_service", lambda self: None, raising=False
+    )
+    monkeypatch.setattr(
+        _service.httpx,
+        "AsyncClient",
+        functools.partial(httpx.AsyncClient, transport=httpx.MockTransport(handler)),
+    )
+    return _service.SupabaseUnsecureService()
+
+
+class FakeSupabaseClient:
+    """Exposes the PostgREST half of the async supabase client over a mock transport."""
+
+    def __init__(self, handler):
+        self.requests: list[httpx.Request] = []
+
+        def record(request: httpx.Request) -> httpx.Response:
+            self.requests.append(request)
+            return handler(request)
+
+        self.postgrest = AsyncPostgrestClient(
+            "https://example.supabase.co/rest/v1",
+            http_client=httpx.AsyncClient(transport=httpx.MockTransport(record)),
+        )
+
+    def table(self, name):
+        return self.postgrest.from_(name)
+
+    def rpc(self, name, params):
+        return self.postgrest.rpc(name, params)
+
+
+def echo_table(request: httpx.Request) -> httpx.Response:
+    table = request.url.path.rsplit("/", 1)[-1]
+    if request.method in ("POST", "PATCH"):
+        body = json.loads(request.content)
+        return httpx.Response(201, json=body if isinstance(body, list) else [body])
+    return httpx.Response(200, json=[{"table": table}])
+
+
+OPERATORS = {
+    "eq": lambda a, b: a == b,
+    "neq": lambda a, b: a != b,
+    "gt": lambda a, b: a > b,
+    "gte": lambda a, b: a >= b,
+    "lt": lambda a, b: a < b,
+    "lte": lambda a, b: a <= b,
+}
+
+
+def _coerce(raw: str, like: object) -> object:
+    return type(like)(raw) if isinstance(like, (int, float)) else raw.strip('"')
+
+
+def postgrest_table(rows: list[dict]):
+    """
+    Handler that serves `rows` honouring simple column filters
+    (eq/neq/gt/gte/lt/lte, `not.is.null`), `order` and `limit` like PostgREST.
+    """
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        result = list(rows)
+        for column, expression in request.url.params.multi_items():
+            if column in ("select", "order", "limit", "offset"):
+                continue
+            if expression == "not.is.null":
+                result = [row for row in result if row.get(column) is not None]
+                continue
+            op, raw = expression.split(".", 1)
+            result = [
+                row
+                for row in result
+                if OPERATORS[op](row[column], _coerce(raw, row[column]))
+            ]
+        for term in reversed(request.url.params.get("order", "").split(",")):
+            if term:
+                column, direction = term.split(".")[:2]
+                result.sort(key=lambda row: row[column], reverse=direction == "desc")
+        if "limit" in request.url.params:
+            result = result[: int(request.url.params["limit"])]
+        return httpx.Response(200, json=result)
+
+    return handler
@@ -0,0 +1,128 @@
+import asyncio
+import json
+
+import httpx
+from postgrest.exceptions import APIError
+
+from app.core.third_party_integrations.supabase_home.sdk.bulk import (
+    chunk_records,
+    is_retryable_write_error,
+    write_chunks,
+)
+from app.core.third_party_integrations.supabase_home.sdk.database import (
+    SupabaseDatabaseService,
+)
+from app.core.third_party_integrations.supabase_home.tests.helpers import (
+    FakeSupabaseClient,
+)
+
+
+def encode(row):
+    return json.dumps(row).encode()
+
+
+class TestChunking:
+    """Unit tests for row- and byte-bounded chunking"""
+
+    def test_row_limit(self):
+        chunks = list(chunk_records(({"id": i} for i in range(10)), max_rows=4))
+        assert [len(chunk) for chunk in chunks] == [4, 4, 2]
+
+    def test_byte_limit_and_oversized_rows(self):
+        rows = [{"blob": "x" * 40}, {"blob": "x" * 40}, {"blob": "x" * 500}, {"id": 1}]
+        chunks = list(chunk_records(rows, max_rows=100, max_bytes=120, encode=encode))
+        assert [len(chunk) for chunk in chunks] == [2, 1, 1]
+
+
+class TestWriteChunks:
+    """Unit tests for the bounded bulk write pipeline"""
+
+    def test_transient_failures_are_retried(self):
+        attempts = []
+
+        async def send(rows):
+            attempts.append(rows[0]["id"])
+            if attempts.count(rows[0]["id"]) == 1 and rows[0]["id"] == 0:
+                raise httpx.ConnectError("reset")
+            return []
+
+        chunks = chunk_records(({"id": i} for i in range(6)), max_rows=2)
+        result = asyncio.run(write_chunks(chunks, send, backoff=lambda attempt: 0))
+        assert result.ok and result.written == 6
+        assert result.chunks[0].attempts == 2
+
+    def test_permanent_failures_report_offending_rows(self):
+        async def send(rows):
+            if any(row["id"] == 3 for row in rows):
+                raise APIError({"code": "23505", "message": "duplicate key"})
+            return rows
+
+        chunks = chunk_records(({"id": i} for i in range(6)), max_rows=2)
+        result = asyncio.run(write_chunks(chunks, send, backoff=lambda attempt: 0))
+        assert not result.ok
+        assert result.written == 4
+        assert result.failed_rows == [{"id": 2}, {"id": 3}]
+        assert result.failed[0].attempts == 1
+        assert len(result.data) == 4
+
+    def test_pipeline_bounds_in_flight_chunks(self):
+        in_flight = []
+        peak = []
+
+        async def send(rows):
+            in_flight.append(1)
+            peak.append(len(in_flight))
+            await asyncio.sleep(0.005)
+            in_flight.pop()
+
+        chunks = chunk_records(({"id": i} for i in range(40)), max_rows=2)
+        asyncio.run(write_chunks(chunks, send, max_concurrency=3))
+        assert max(peak) == 3
+
+    def test_retryable_classification(self):
+        assert is_retryable_write_error(APIError({"code": "40P01"}))
+        assert is_retryable_write_error(APIError({"message": "bad gateway"}))
+        assert not is_retryable_write_error(APIError({"code": "23502"}))
+        assert not is_retryable_write_error(ValueError())
+        assert is_retryable_write_error(httpx.ConnectError("refused"))
+        assert is_retryable_write_error(httpx.PoolTimeout("pool"))
+        assert not is_retryable_write_error(httpx.ReadTimeout("read"))
+        assert not is_retryable_write_error(httpx.RemoteProtocolError("dropped"))
+        assert not is_retryable_write_error(asyncio.TimeoutError())
+        assert is_retryable_write_error(httpx.ReadTimeout("read"), idempotent=True)
+        assert is_retryable_write_error(asyncio.TimeoutError(), idempotent=True)
+
+
+class TestBulkInsert:
+    """Unit tests for SupabaseDatabaseService.bulk_insert"""
+
+    def test_sends_minimal_chunks(self):
+        def handler(request):
+            return httpx.Response(201, content=b"")
+
+        client = FakeSupabaseClient(handler)
+        db = SupabaseDatabaseService(client)
+        result = asyncio.run(
+            db.bulk_upsert("items", [{"id": i} for i in range(5)], chunk_rows=2, on_conflict="id")
+        )
+        assert result.ok and result.written == 5 and result.data == []
+        assert len(client.requests) == 3
+        prefer = client.requests[0].headers["prefer"]
+        assert "return=minimal" in prefer and "resolution=merge-duplicates" in prefer
+        assert client.requests[0].url.params["on_conflict"] == "id"
+
+    def test_read_timeouts_only_retry_idempotent_upserts(self):
+        def handler(request):
+            if len(client.requests) == 1:
+                raise httpx.ReadTimeout("stalled", request=request)
+            return httpx.Response(201, content=b"")
+
+        client = FakeSupabaseClient(handler)
+        db = SupabaseDatabaseService(client)
+        inserted = asyncio.run(db.bulk_insert("items", [{"id": 1}]))
+        assert not inserted.ok and len(client.requests) == 1
+
+        client = FakeSupabaseClient(handler)
+        db = SupabaseDatabaseService(client)
+        upserted = asyncio.run(db.bulk_upsert("items", [{"id": 1}], on_conflict="id"))
+        assert upserted.ok and len(client.requests) == 2
@@ -0,0 +1,78 @@
+import asyncio
+
+from app.core.third_party_integrations.supabase_home.sdk.cache_invalidation import (
+    RealtimeCacheInvalidator,
+)
+from app.core.third_party_integrations.supabase_home.sdk.query_cache import QueryCache
+from app.core.third_party_integrations.supabase_home.sdk.realtime import (
+    SupabaseRealtimeService,
+)
+
+
+class FakeChannel:
+    def __init__(self):
+        self.listeners = {}
+        self.on_subscribe = None
+
+    def on_postgres_changes(self, event, callback, table=None, schema=None):
+        self.listeners[table] = callback
+        return self
+
+    async def subscribe(self, callback=None):
+        self.on_subscribe = callback
+        return self
+
+
+class FakeRealtimeClient:
+    def __init__(self):
+        self.channels = {}
+        self.removed = []
+
+    def channel(self, name):
+        return self.channels.setdefault(name, FakeChannel())
+
+    async def remove_channel(self, channel):
+        self.removed.append(channel)
+
+
+def start(tables):
+    client = FakeRealtimeClient()
+    cache = QueryCache(table_ttls={"plans": 5}, live_ttl=3600)
+    invalidator = RealtimeCacheInvalidator(SupabaseRealtimeService(client), cache, tables)
+    asyncio.run(invalidator.start())
+    return client.channels[invalidator.channel_name], cache, invalidator, client
+
+
+class TestRealtimeCacheInvalidator:
+    """Unit tests for change-event driven query cache invalidation"""
+
+    def test_subscribed_tables_are_live(self):
+        channel, cache, invalidator, _ = start(["plans", "countries"])
+        assert set(channel.listeners) == {"plans", "countries"}
+        assert not cache.caches("countries")
+
+        channel.on_subscribe("SUBSCRIBED", None)
+        assert cache.ttl_for("countries") == 3600 and cache.ttl_for("plans") == 3600
+        assert invalidator.stats()["connected"]
+
+    def test_change_events_evict_table_queries(self):
+        channel, cache, invalidator, _ = start(["plans"])
+        channel.on_subscribe("SUBSCRIBED", None)
+        cache.put("all-plans", "plans", frozenset({"plans"}), [], 10)
+        cache.put("users+plans", "users", frozenset({"users", "plans"}), [], 10)
+
+        channel.listeners["plans"]({"data": {"type": "UPDATE", "table": "plans"}})
+        assert len(cache) == 0 and invalidator.events == 1
+
+    def test_socket_drop_falls_back_to_ttl(self):
+        channel, cache, invalidator, client = start(["plans"])
+        channel.on_subscribe("SUBSCRIBED", None)
+        cache.put("all-plans", "plans", frozenset({"plans"}), [], 10)
+
+        channel.on_subscribe("CHANNEL_ERROR", Exception("socket closed"))
+        assert cache.ttl_for("plans") == 5
+        assert len(cache) == 0  # events may have been missed
+
+        channel.on_subscribe("SUBSCRIBED", None)
+        asyncio.run(invalidator.stop())
+        assert not cache.is_live("plans") and client.removed == [channel]
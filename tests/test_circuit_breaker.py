@@ -0,0 +1,102 @@
+import asyncio
+
+import httpx
+import pytest
+
+from app.core.third_party_integrations.supabase_home.exceptions.index import (
+    SupabaseCircuitOpenError,
+)
+from app.core.third_party_integrations.supabase_home.transport.circuit_breaker import (
+    CircuitBreaker,
+    CircuitBreakerRegistry,
+    CircuitState,
+    service_area,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestCircuitBreaker:
+    """Unit tests for the per-service-area circuit breaker"""
+
+    @pytest.fixture
+    def clock(self):
+        return FakeClock()
+
+    @pytest.fixture
+    def breaker(self, clock):
+        return CircuitBreaker(
+            "rest", failure_threshold=2, recovery_timeout=10.0, clock=clock
+        )
+
+    def test_service_area(self):
+        assert service_area("/rest/v1/items") == "rest"
+        assert service_area("/storage/v1/object/list") == "storage"
+        assert service_area("/auth/v1/settings") == "auth"
+        assert service_area("/functions/v1/hello") == "functions"
+        assert service_area("/unknown") == "other"
+
+    def test_opens_after_threshold(self, breaker):
+        breaker.record_failure()
+        assert breaker.state is CircuitState.CLOSED
+        breaker.record_failure()
+        assert breaker.state is CircuitState.OPEN
+        assert not breaker.allow_request()
+        assert breaker.snapshot()["total_rejected"] == 1
+
+    def test_success_resets_failure_count(self, breaker):
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+        assert breaker.state is CircuitState.CLOSED
+
+    def test_half_open_probe_closes_on_success(self, breaker, clock):
+        breaker.record_failure()
+        breaker.record_failure()
+        clock.now = 10.0
+        assert breaker.state is CircuitState.HALF_OPEN
+        assert breaker.allow_request()
+        assert not breaker.allow_request()
+        breaker.record_success()
+        assert breaker.state is CircuitState.CLOSED
+
+    def test_half_open_probe_reopens_on_failure(self, breaker, clock):
+        breaker.record_failure()
+        breaker.record_failure()
+        clock.now = 10.0
+        assert breaker.allow_request()
+        breaker.record_failure()
+        assert breaker.state is CircuitState.OPEN
+        assert breaker.retry_in() == 10.0
+
+    def test_call_fails_fast_when_open(self, breaker):
+        async def failing():
+            raise httpx.ConnectError("down")
+
+        for _ in range(2):
+            with pytest.raises(httpx.ConnectError):
+                asyncio.run(breaker.call(failing))
+
+        with pytest.raises(SupabaseCircuitOpenError):
+            asyncio.run(breaker.call(failing))
+
+    def test_call_classifies_results(self, breaker):
+        async def server_error():
+            return httpx.Response(503)
+
+        for _ in range(2):
+            asyncio.run(breaker.call(server_error, is_failure=lambda r: r.status_code >= 500))
+        assert breaker.state is CircuitState.OPEN
+
+    def test_registry_snapshot(self):
+        registry = CircuitBreakerRegistry(failure_threshold=1)
+        registry.get("storage").record_failure()
+        snapshot = registry.snapshot()
+        assert snapshot["storage"]["state"] == "open"
+        assert registry.get("storage") is registry.get("storage")
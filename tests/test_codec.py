@@ -0,0 +1,51 @@
+import dataclasses
+import datetime
+import uuid
+
+import pytest
+
+from app.core.third_party_integrations.supabase_home.transport.codec import (
+    JSONCodec,
+    available_codecs,
+    get_codec,
+)
+
+
+@dataclasses.dataclass
+class Item:
+    id: int
+    name: str
+
+
+class TestJSONCodec:
+    """Round-trip tests run against every installed codec backend"""
+
+    @pytest.fixture(params=available_codecs())
+    def codec(self, request):
+        return get_codec(request.param)
+
+    def test_round_trip(self, codec):
+        value = {"id": 1, "name": "x", "tags": ["a"], "nested": {"ok": True}, "none": None}
+        assert codec.decode(codec.encode(value)) == value
+
+    def test_encodes_common_python_types(self, codec):
+        ident = uuid.uuid4()
+        moment = datetime.datetime(2024, 1, 2, 3, 4, 5)
+        decoded = codec.decode(codec.encode({"id": ident, "at": moment}))
+        assert decoded["id"] == str(ident)
+        assert decoded["at"].startswith("2024-01-02T03:04:05")
+
+    def test_decode_as_typed_rows(self, codec):
+        rows = codec.decode_as(b'[{"id": 1, "name": "a"}, {"id": 2, "name": "b"}]', list[Item])
+        assert rows == [Item(1, "a"), Item(2, "b")]
+
+    def test_auto_prefers_fast_backend(self):
+        codec = get_codec("auto")
+        if len(available_codecs()) > 1:
+            assert codec.name != "json"
+        else:
+            assert isinstance(codec, JSONCodec)
+
+    def test_unknown_backend(self):
+        with pytest.raises(ValueError):
+            get_codec("yaml")
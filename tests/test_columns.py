@@ -0,0 +1,109 @@
+import asyncio
+import math
+from array import array
+
+import httpx
+import pytest
+
+from app.core.third_party_integrations.supabase_home.sdk.columns import (
+    build_column,
+    dicts_to_columns,
+)
+from app.core.third_party_integrations.supabase_home.sdk.database import (
+    SupabaseDatabaseService,
+)
+from app.core.third_party_integrations.supabase_home.tests.helpers import (
+    FakeSupabaseClient,
+)
+
+OPENAPI = {
+    "definitions": {
+        "sales": {
+            "required": ["id", "region", "amount"],
+            "properties": {
+                "id": {"type": "integer", "format": "bigint"},
+                "region": {"type": "string", "format": "text"},
+                "amount": {"type": "number", "format": "numeric"},
+                "units": {"type": "integer", "format": "integer"},
+                "paid": {"type": "boolean", "format": "boolean"},
+                "sold_at": {"type": "string", "format": "timestamp with time zone"},
+            },
+        }
+    }
+}
+
+SALES = [
+    {"id": 1, "region": "eu", "amount": 10, "units": 2, "paid": True, "sold_at": "2024-05-01T00:00:00Z"},
+    {"id": 2, "region": "us", "amount": 2.5, "units": None, "paid": False, "sold_at": None},
+    {"id": 3, "region": "eu", "amount": 4.0, "units": 1, "paid": True, "sold_at": None},
+]
+
+
+def rest_api(request: httpx.Request) -> httpx.Response:
+    if request.url.path.endswith("/rest/v1/"):
+        return httpx.Response(200, json=OPENAPI)
+    select = request.url.params.get("select", "*")
+    if select == "*":
+        return httpx.Response(200, json=SALES)
+    return httpx.Response(200, json=[{c: row[c] for c in select.split(",")} for row in SALES])
+
+
+class TestBuildColumn:
+    """Unit tests for packing one column by type"""
+
+    def test_numbers_pack_into_arrays(self):
+        assert build_column([1, 2, 3], int) == array("q", [1, 2, 3])
+        assert build_column([1.5, None], float | None).typecode == "d"
+        ints_with_null = build_column([1, None], int | None)
+        assert ints_with_null.typecode == "d" and math.isnan(ints_with_null[1])
+
+    def test_booleans_and_strings(self):
+        assert build_column([True, False], bool) == array("b", [1, 0])
+        assert build_column([True, None], bool | None) == [True, None]
+        region = build_column(["".join(["e", "u"]), "".join(["e", "u"])], str)
+        assert region[0] is region[1]
+
+    def test_numpy_arrays(self):
+        numpy = pytest.importorskip("numpy")
+        assert build_column([1, 2], int, use_numpy=True).dtype == numpy.int64
+        assert numpy.isnan(build_column([1.0, None], float | None, use_numpy=True)).sum() == 1
+
+    def test_dicts_to_columns_infers_types(self):
+        columns = dicts_to_columns([{"a": 1, "b": "x"}, {"a": 2.5, "b": None}])
+        assert columns["a"] == array("d", [1.0, 2.5])
+        assert columns["b"] == ["x", None]
+
+
+class TestFetchColumns:
+    """fetch_columns returns packed columns typed by the schema"""
+
+    def test_columns_follow_the_schema(self):
+        client = FakeSupabaseClient(rest_api)
+        db = SupabaseDatabaseService(client)
+
+        columns = asyncio.run(db.fetch_columns("sales", use_numpy=False))
+        assert list(columns) == ["id", "region", "amount", "units", "paid", "sold_at"]
+        assert columns["id"] == array("q", [1, 2, 3])
+        assert columns["amount"] == array("d", [10.0, 2.5, 4.0])
+        assert sum(columns["amount"]) == 16.5
+        assert columns["units"].typecode == "d" and math.isnan(columns["units"][1])
+        assert columns["paid"] == array("b", [1, 0, 1])
+        assert columns["region"][0] is columns["region"][2]
+        assert columns["sold_at"][0].year == 2024 and columns["sold_at"][1] is None
+
+    def test_selected_subset(self):
+        db = SupabaseDatabaseService(FakeSupabaseClient(rest_api))
+
+        columns = asyncio.run(db.fetch_columns("sales", select="region,amount", use_numpy=False))
+        assert list(columns) == ["region", "amount"]
+
+    def test_without_schema_packs_by_value_type(self):
+        def no_openapi(request: httpx.Request) -> httpx.Response:
+            if request.url.path.endswith("/rest/v1/"):
+                return httpx.Response(404)
+            return httpx.Response(200, json=SALES)
+
+        db = SupabaseDatabaseService(FakeSupabaseClient(no_openapi))
+        columns = asyncio.run(db.fetch_columns("sales", use_numpy=False))
+        assert columns["id"] == array("q", [1, 2, 3])
+        assert columns["amount"] == array("d", [10.0, 2.5, 4.0])
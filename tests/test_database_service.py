@@ -0,0 +1,61 @@
+import asyncio
+
+from app.core.third_party_integrations.supabase_home.sdk.database import (
+    SupabaseDatabaseService,
+)
+from app.core.third_party_integrations.supabase_home.tests.helpers import (
+    FakeSupabaseClient,
+    echo_table,
+)
+
+
+class TestAsyncDatabaseService:
+    """Unit tests for the coroutine-based database service"""
+
+    def test_methods_are_awaitable(self):
+        db = SupabaseDatabaseService(FakeSupabaseClient(echo_table))
+
+        async def main():
+            rows = await db.fetch_data("users", filters={"id": 1}, limit=5)
+            inserted = await db.insert_data("users", {"name": "a"})
+            updated = await db.update_data("users", {"name": "b"}, {"id": 1})
+            return rows, inserted, updated
+
+        rows, inserted, updated = asyncio.run(main())
+        assert rows == [{"table": "users"}]
+        assert inserted == [{"name": "a"}]
+        assert updated == [{"name": "b"}]
+        assert db.client.requests[0].url.params["id"] == "eq.1"
+        assert db.client.requests[2].method == "PATCH"
+        assert db.client.requests[2].url.params["id"] == "eq.1"
+
+    def test_fetch_many_runs_tables_concurrently(self):
+        in_flight = []
+        peak = []
+
+        async def slow(request):
+            in_flight.append(1)
+            peak.append(len(in_flight))
+            await asyncio.sleep(0.02)
+            in_flight.pop()
+            return echo_table(request)
+
+        db = SupabaseDatabaseService(FakeSupabaseClient(slow))
+        tables = ["users", "orders", "items", "prices", "regions"]
+
+        results = asyncio.run(
+            db.fetch_many({name: {"table": name} for name in tables}, max_concurrency=3)
+        )
+        assert {name: rows[0]["table"] for name, rows in results.items()} == {
+            name: name for name in tables
+        }
+        assert max(peak) == 3
+
+    def test_gather_preserves_call_order(self):
+        db = SupabaseDatabaseService(FakeSupabaseClient(echo_table))
+
+        async def main():
+            return await db.gather(db.fetch_data("a"), db.fetch_data("b"))
+
+        a, b = asyncio.run(main())
+        assert a == [{"table": "a"}] and b == [{"table": "b"}]
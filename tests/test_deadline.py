@@ -0,0 +1,154 @@
+import asyncio
+import time
+
+import httpx
+import pytest
+from fastapi import HTTPException
+
+from app.core.third_party_integrations.supabase_home.exceptions.index import (
+    SupabaseDeadlineExceededError,
+)
+from app.core.third_party_integrations.supabase_home.transport.deadline import (
+    TimeoutBudget,
+    check_deadline,
+    deadline,
+    deadline_middleware,
+    remaining,
+    with_deadline,
+)
+from app.core.third_party_integrations.supabase_home.transport.instrumentation import (
+    instrument,
+)
+from app.core.third_party_integrations.supabase_home.tests.helpers import make_service
+
+
+class TestDeadline:
+    """Unit tests for deadline propagation and timeout budgets"""
+
+    def test_no_deadline_by_default(self):
+        assert remaining() is None
+        assert check_deadline("op", 30.0) == 30.0
+
+    def test_nested_deadlines_only_shorten(self):
+        with deadline(1.0):
+            with deadline(10.0):
+                assert remaining() <= 1.0
+            with deadline(0.5):
+                assert remaining() <= 0.5
+        assert remaining() is None
+
+    def test_spent_deadline_fails_fast(self):
+        with deadline(0.0):
+            with pytest.raises(SupabaseDeadlineExceededError):
+                check_deadline("database.fetch_data")
+
+    def test_budget_clips_httpx_timeouts(self):
+        budget = TimeoutBudget(total=30.0, connect=5.0, pool=5.0)
+        with deadline(2.0):
+            timeout = budget.httpx_timeout("rest.get")
+        assert timeout.connect <= 2.0
+        assert timeout.read <= 2.0
+        assert timeout.pool <= 2.0
+        unbounded = budget.httpx_timeout("rest.get")
+        assert unbounded.connect == 5.0
+        assert unbounded.read == 30.0
+
+    def test_with_deadline_cancels_slow_calls(self):
+        async def main():
+            with deadline(0.05):
+                await with_deadline("storage.file.download", asyncio.sleep(1))
+
+        with pytest.raises(SupabaseDeadlineExceededError):
+            asyncio.run(main())
+
+    def test_instrumented_calls_respect_deadline(self):
+        calls = []
+
+        @instrument("tests.deadline_op")
+        def op():
+            calls.append(1)
+
+        with deadline(0.0):
+            with pytest.raises(SupabaseDeadlineExceededError):
+                op()
+        assert calls == []
+
+
+class TestDeadlineMiddleware:
+    """X-Request-Timeout can shorten the budget only within bounds"""
+
+    @staticmethod
+    def budget_for(header: str | None) -> float:
+        class Request:
+            headers = {"x-request-timeout": header} if header is not None else {}
+
+        async def call_next(request):
+            return remaining()
+
+        return asyncio.run(deadline_middleware(10.0, min_seconds=1.0)(Request(), call_next))
+
+    def test_header_is_clamped(self):
+        assert 4.0 < self.budget_for("5") <= 5.0
+        assert 0.9 < self.budget_for("0.001") <= 1.0
+        assert 9.0 < self.budget_for("60") <= 10.0
+        assert 9.0 < self.budget_for("nan") <= 10.0
+        assert 9.0 < self.budget_for(None) <= 10.0
+
+
+class TestDeadlineInRequestPath:
+    """A caller's spent deadline is not an upstream failure"""
+
+    def test_expired_deadline_spares_breaker_and_limiter(self, monkeypatch):
+        slow = [True]
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            if slow[0]:
+                # * MockTransport ignores timeouts: stall for the read budget, then time out
+                await asyncio.sleep(request.extensions["timeout"]["read"] or 1.0)
+                raise httpx.ReadTimeout("stalled", request=request)
+            return httpx.Response(200, json={"ok": True})
+
+        svc = make_service(monkeypatch, handler)
+
+        async def main():
+            statuses = []
+            for _ in range(5):
+                with deadline(0.1):
+                    try:
+                        await svc._make_request("GET", "/rest/v1/items")
+                    except HTTPException as e:
+                        statuses.append(e.status_code)
+            slow[0] = False
+            result = await svc._make_request("GET", "/rest/v1/items")
+            await svc.aclose()
+            return statuses, result
+
+        statuses, result = asyncio.run(main())
+        assert statuses == [504] * 5
+        assert result == {"ok": True}
+        assert svc.circuit_breakers.get("rest").snapshot()["consecutive_failures"] == 0
+        limiter = svc.limiters.get("rest").snapshot()
+        assert limiter["total_throttled"] == 0 and limiter["in_flight"] == 0
+
+    def test_slow_drip_body_cannot_outlive_the_deadline(self, monkeypatch):
+        async def drip():
+            for _ in range(20):
+                await asyncio.sleep(0.05)
+                yield b" "
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, content=drip())
+
+        svc = make_service(monkeypatch, handler)
+
+        async def main():
+            started = time.monotonic()
+            with deadline(0.2):
+                with pytest.raises(HTTPException) as info:
+                    await svc._make_request("GET", "/rest/v1/items")
+            await svc.aclose()
+            return info.value.status_code, time.monotonic() - started
+
+        status, elapsed = asyncio.run(main())
+        assert status == 504
+        assert elapsed < 0.5
@@ -0,0 +1,202 @@
+import asyncio
+
+import httpx
+import pytest
+
+from app.core.third_party_integrations.supabase_home.sdk.database import (
+    SupabaseDatabaseService,
+)
+from app.core.third_party_integrations.supabase_home.sdk.embed import (
+    Embed,
+    parse_order,
+    render_select,
+    validate_embeds,
+)
+from app.core.third_party_integrations.supabase_home.sdk.filters import col
+from app.core.third_party_integrations.supabase_home.sdk.schema import (
+    SchemaCache,
+    SchemaCatalog,
+)
+from app.core.third_party_integrations.supabase_home.tests.helpers import (
+    FakeSupabaseClient,
+)
+
+
+def _fk(table: str, column: str = "id") -> dict:
+    return {
+        "type": "integer",
+        "description": f"Note:\nThis is a Foreign Key to `{table}.{column}`.<fk table='{table}' column='{column}'/>",
+    }
+
+
+OPENAPI = {
+    "swagger": "2.0",
+    "definitions": {
+        "customers": {"properties": {"id": {"type": "integer"}, "name": {"type": "string"}}},
+        "orders": {
+            "properties": {
+                "id": {"type": "integer"},
+                "customer_id": _fk("customers"),
+                "status": {"type": "string"},
+            }
+        },
+        "order_items": {"properties": {"order_id": _fk("orders"), "product_id": _fk("products")}},
+        "products": {"properties": {"id": {"type": "integer"}}},
+        "messages": {"properties": {"sender_id": _fk("customers"), "recipient_id": _fk("customers")}},
+    },
+}
+
+CUSTOMERS = [
+    {"id": 1, "name": "Ada", "orders": [{"id": 10, "order_items": [{"product_id": 7}]}]},
+    {"id": 2, "name": "Bob", "orders": []},
+]
+
+
+def rest_api(request: httpx.Request) -> httpx.Response:
+    if request.url.path.endswith("/rest/v1/"):
+        return httpx.Response(200, json=OPENAPI)
+    return httpx.Response(200, json=CUSTOMERS)
+
+
+class TestSchemaCatalog:
+    """Unit tests for foreign keys parsed from the PostgREST OpenAPI document"""
+
+    def test_parses_foreign_keys_in_both_directions(self):
+        schema = SchemaCatalog.from_openapi(OPENAPI)
+        assert schema.cardinality("customers", "orders") == "many"
+        assert schema.cardinality("orders", "customers") == "one"
+        assert schema.cardinality("orders", "products") == "many"  # * through order_items
+
+    def test_ambiguous_relationship_needs_via(self):
+        schema = SchemaCatalog.from_openapi(OPENAPI)
+        with pytest.raises(ValueError, match="recipient_id, sender_id"):
+            schema.resolve("customers", "messages")
+        assert schema.resolve("customers", "messages", via="sender_id").column == "sender_id"
+
+    def test_unrelated_tables_raise(self):
+        schema = SchemaCatalog.from_openapi(OPENAPI)
+        with pytest.raises(ValueError, match="No relationship"):
+            schema.cardinality("products", "customers")
+
+
+class TestEmbed:
+    """Unit tests for rendering and validating embedded resources"""
+
+    def test_renders_nested_select(self):
+        embed = Embed(
+            "orders",
+            select="id,total",
+            alias="recent",
+            inner=True,
+            embed=[Embed("order_items", select="product_id")],
+        )
+        assert render_select("id,name", [embed]) == (
+            "id,name,recent:orders!inner(id,total,order_items(product_id))"
+        )
+        assert Embed("messages", via="sender_id").render() == "messages!sender_id(*)"
+
+    def test_parse_order(self):
+        assert parse_order("created_at.desc,id") == [("created_at", True, None), ("id", False, None)]
+        assert parse_order("x.asc.nullsfirst") == [("x", False, True)]
+        with pytest.raises(ValueError):
+            parse_order("x.sideways")
+
+    def test_to_one_embed_rejects_limit(self):
+        schema = SchemaCatalog.from_openapi(OPENAPI)
+        validate_embeds(schema, "customers", [Embed("orders", limit=5, embed=[Embed("customers")])])
+        with pytest.raises(ValueError, match="to-one"):
+            validate_embeds(schema, "orders", [Embed("customers", limit=1)])
+
+
+class TestFetchWithEmbeds:
+    """Embedded resources load in a single request with per-relation parameters"""
+
+    def test_one_request_with_scoped_parameters(self):
+        client = FakeSupabaseClient(rest_api)
+        db = SupabaseDatabaseService(client)
+
+        rows = asyncio.run(
+            db.fetch_data(
+                "customers",
+                select="id,name",
+                embed=[
+                    Embed(
+                        "orders",
+                        select="id",
+                        filters=col("status").eq("paid"),
+                        order="id.desc",
+                        limit=3,
+                        embed=[Embed("order_items", filters={"product_id": 7})],
+                    )
+                ],
+            )
+        )
+
+        assert rows[0]["orders"][0]["order_items"] == [{"product_id": 7}]
+        schema_request, data_request = client.requests
+        assert schema_request.headers["accept"] == "application/openapi+json"
+        params = data_request.url.params
+        assert params["select"] == "id,name,orders(id,order_items(*))"
+        assert params["orders.status"] == "eq.paid"
+        assert params["orders.order"] == "id.desc"
+        assert params["orders.limit"] == "3"
+        assert params["orders.order_items.product_id"] == "eq.7"
+
+    def test_invalid_embed_fails_before_the_request(self):
+        client = FakeSupabaseClient(rest_api)
+        db = SupabaseDatabaseService(client)
+
+        with pytest.raises(ValueError, match="No relationship"):
+            asyncio.run(db.fetch_data("products", embed=[Embed("customers")]))
+        assert len(client.requests) == 1  # * only the schema
+
+    def test_schema_is_cached(self):
+        client = FakeSupabaseClient(rest_api)
+        db = SupabaseDatabaseService(client)
+
+        async def main():
+            for _ in range(3):
+                await db.fetch_data("customers", embed=[Embed("orders")])
+
+        asyncio.run(main())
+        assert len(client.requests) == 4
+
+    def test_missing_schema_skips_validation(self):
+        def no_openapi(request: httpx.Request) -> httpx.Response:
+            if request.url.path.endswith("/rest/v1/"):
+                return httpx.Response(404)
+            return httpx.Response(200, json=[])
+
+        client = FakeSupabaseClient(no_openapi)
+        db = SupabaseDatabaseService(client)
+
+        async def main():
+            await db.fetch_data("customers", embed=[Embed("orders")])
+            await db.fetch_data("customers", embed=[Embed("orders")])
+
+        asyncio.run(main())
+        # * The failed schema load is not retried straight away
+        assert len(client.requests) == 3
+
+
+class TestSchemaCache:
+    """Unit tests for the TTL-bound schema cache"""
+
+    def test_reloads_after_ttl(self):
+        now = [0.0]
+        loads = []
+
+        async def loader():
+            loads.append(now[0])
+            return OPENAPI
+
+        cache = SchemaCache(loader, ttl=60, clock=lambda: now[0])
+
+        async def main():
+            first = await cache.get()
+            assert await cache.get() is first
+            now[0] = 61
+            assert await cache.get() is not first
+
+        asyncio.run(main())
+        assert loads == [0.0, 61]
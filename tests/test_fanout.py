@@ -0,0 +1,54 @@
+import asyncio
+
+import pytest
+
+from app.core.third_party_integrations.supabase_home.transport.fanout import (
+    gather_bounded,
+    gather_mapping,
+)
+
+
+class TestFanout:
+    """Unit tests for bounded concurrent fan-out"""
+
+    def test_results_keep_order_and_respect_limit(self):
+        running = []
+        peak = []
+
+        async def call(i):
+            running.append(i)
+            peak.append(len(running))
+            await asyncio.sleep(0.01 * (5 - i % 5))
+            running.remove(i)
+            return i
+
+        results = asyncio.run(gather_bounded([call(i) for i in range(10)], max_concurrency=3))
+        assert results == list(range(10))
+        assert max(peak) == 3
+
+    def test_failure_cancels_pending_calls(self):
+        started = []
+
+        async def call(i):
+            started.append(i)
+            await asyncio.sleep(0.01)
+            if i == 0:
+                raise RuntimeError("boom")
+            return i
+
+        with pytest.raises(RuntimeError):
+            asyncio.run(gather_bounded([call(i) for i in range(6)], max_concurrency=2))
+        assert len(started) < 6
+
+    def test_return_exceptions_and_mapping(self):
+        async def ok():
+            return 1
+
+        async def bad():
+            raise ValueError("nope")
+
+        results = asyncio.run(
+            gather_mapping({"a": ok(), "b": bad()}, return_exceptions=True)
+        )
+        assert results["a"] == 1
+        assert isinstance(results["b"], ValueError)
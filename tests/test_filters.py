@@ -0,0 +1,107 @@
+import asyncio
+
+import pytest
+
+from app.core.third_party_integrations.supabase_home.sdk.database import (
+    SupabaseDatabaseService,
+)
+from app.core.third_party_integrations.supabase_home.sdk.filters import (
+    Filter,
+    and_,
+    col,
+    compile_filter,
+    compile_shape,
+    not_,
+    or_,
+)
+from app.core.third_party_integrations.supabase_home.tests.helpers import (
+    FakeSupabaseClient,
+    echo_table,
+)
+
+
+class TestFilterCompilation:
+    """Unit tests for compiling filter expressions to PostgREST parameters"""
+
+    def test_conjunctions_become_separate_params(self):
+        expression = col("age").gte(18) & col("status").in_(["active", "on hold"]) & ~col("deleted_at").is_(None)
+        assert compile_filter(expression) == [
+            ("age", "gte.18"),
+            ("status", 'in.(active,"on hold")'),
+            ("deleted_at", "not.is.null"),
+        ]
+
+    def test_or_groups_quote_reserved_values(self):
+        expression = or_(col("name").ilike("%smith%"), and_(col("tier").eq("a,b"), col("vip").is_(True)))
+        assert compile_filter(expression) == [
+            ("or", '(name.ilike.*smith*,and(tier.eq."a,b",vip.is.true))'),
+        ]
+
+    def test_negated_and_uses_de_morgan(self):
+        expression = not_(col("a").eq(1) & or_(col("b").eq(2), col("c").eq(3)))
+        assert compile_filter(expression) == [("or", "(a.not.eq.1,not.or(b.eq.2,c.eq.3))")]
+        assert compile_filter(~or_(col("a").eq(1), col("b").eq(2))) == [
+            ("not.or", "(a.eq.1,b.eq.2)")
+        ]
+
+    def test_arrays_json_and_text_search(self):
+        expression = (
+            col("tags").contains(["x", "y"])
+            & col("meta").contains({"plan": "pro"})
+            & col("span").overlaps("[1,5)")
+            & col("doc").text_search("fat & rat", config="english", mode="plain")
+        )
+        assert compile_filter(expression) == [
+            ("tags", "cs.{x,y}"),
+            ("meta", 'cs.{"plan":"pro"}'),
+            ("span", "ov.[1,5)"),
+            ("doc", "plfts(english).fat & rat"),
+        ]
+
+    def test_embedded_resource_filters(self):
+        expression = col("orders.total").gt(100) & or_(
+            col("status").eq("paid"), col("status").eq("shipped"), on="orders"
+        )
+        assert compile_filter(expression) == [
+            ("orders.total", "gt.100"),
+            ("orders.or", "(status.eq.paid,status.eq.shipped)"),
+        ]
+
+    def test_compiled_form_is_cached_per_shape(self):
+        compile_shape.cache_clear()
+        for threshold in range(5):
+            compile_filter(col("age").gt(threshold) | col("vip").is_(True))
+        info = compile_shape.cache_info()
+        assert info.misses == 1 and info.hits == 4
+
+    def test_filter_subclasses_must_implement_the_expression_protocol(self):
+        class Partial(Filter):
+            def shape(self) -> tuple:
+                return ()
+
+        with pytest.raises(TypeError):
+            Filter()
+        with pytest.raises(TypeError):
+            Partial()
+
+
+class TestServiceFilters:
+    """Filter expressions are accepted by the database service methods"""
+
+    def test_fetch_update_delete_accept_expressions(self):
+        client = FakeSupabaseClient(echo_table)
+        db = SupabaseDatabaseService(client)
+        expression = col("age").gte(18) | col("vip").is_(True)
+
+        async def main():
+            await db.fetch_data("users", filters=expression)
+            await db.update_data("users", {"flag": 1}, expression)
+            await db.delete_data("users", col("id").in_([1, 2]))
+            await db.fetch_data("users", filters={"id": 1})
+
+        asyncio.run(main())
+        fetch, update, delete, legacy = client.requests
+        assert fetch.url.params["or"] == "(age.gte.18,vip.is.true)"
+        assert update.method == "PATCH" and update.url.params["or"] == "(age.gte.18,vip.is.true)"
+        assert delete.url.params["id"] == "in.(1,2)"
+        assert legacy.url.params["id"] == "eq.1"
@@ -0,0 +1,122 @@
+import asyncio
+
+import pytest
+
+from app.core.third_party_integrations.supabase_home.transport.hedging import (
+    Hedger,
+    LatencyTracker,
+)
+
+
+class TestHedger:
+    """Unit tests for hedged idempotent reads"""
+
+    @pytest.fixture
+    def hedger(self):
+        return Hedger(min_delay=0.01, max_delay=0.02, max_hedge_ratio=1.0, burst=1.0)
+
+    def test_latency_tracker_percentile(self):
+        tracker = LatencyTracker(refresh_every=1)
+        for value in range(1, 101):
+            tracker.record(value / 100)
+        assert tracker.percentile(0.95) == pytest.approx(0.96)
+        assert LatencyTracker().percentile(0.95) is None
+
+    def test_fast_call_is_not_hedged(self, hedger):
+        calls = []
+
+        async def fast():
+            calls.append(1)
+            return "primary"
+
+        assert asyncio.run(hedger.run("k", fast)) == "primary"
+        assert len(calls) == 1
+        assert hedger.stats()["hedges_sent"] == 0
+
+    def test_slow_call_is_hedged_and_hedge_wins(self, hedger):
+        calls = []
+        cancelled = []
+
+        async def sometimes_slow():
+            calls.append(1)
+            if len(calls) == 1:
+                try:
+                    await asyncio.sleep(1)
+                except asyncio.CancelledError:
+                    cancelled.append(1)
+                    raise
+                return "primary"
+            return "hedge"
+
+        async def main():
+            result = await hedger.run("k", sometimes_slow)
+            await asyncio.sleep(0)
+            return result
+
+        assert asyncio.run(main()) == "hedge"
+        assert cancelled == [1]
+        assert hedger.stats()["hedge_wins"] == 1
+
+    def test_budget_caps_hedges(self):
+        hedger = Hedger(min_delay=0.001, max_delay=0.001, max_hedge_ratio=0.0, burst=0.0)
+
+        async def slow():
+            await asyncio.sleep(0.01)
+            return "primary"
+
+        assert asyncio.run(hedger.run("k", slow)) == "primary"
+        assert hedger.stats()["hedges_sent"] == 0
+        assert hedger.stats()["budget_denied"] == 1
+
+    def test_failed_primary_falls_back_to_hedge(self, hedger):
+        calls = []
+
+        async def flaky():
+            calls.append(1)
+            if len(calls) == 1:
+                await asyncio.sleep(0.05)
+                raise ConnectionError("reset")
+            await asyncio.sleep(0.1)
+            return "hedge"
+
+        assert asyncio.run(hedger.run("k", flaky)) == "hedge"
+
+    def test_cancelled_primary_falls_back_to_hedge(self, hedger):
+        calls = []
+
+        async def cancelled_primary():
+            calls.append(1)
+            if len(calls) == 1:
+                await asyncio.sleep(0.05)
+                raise asyncio.CancelledError
+            await asyncio.sleep(0.1)
+            return "hedge"
+
+        assert asyncio.run(hedger.run("k", cancelled_primary)) == "hedge"
+
+    def test_cancelling_the_caller_cancels_both_attempts(self, hedger):
+        cancelled = []
+
+        async def slow():
+            try:
+                await asyncio.sleep(1)
+            except asyncio.CancelledError:
+                cancelled.append(1)
+                raise
+
+        async def main():
+            call = asyncio.ensure_future(hedger.run("k", slow))
+            await asyncio.sleep(0.05)
+            call.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await call
+            await asyncio.sleep(0)
+
+        asyncio.run(main())
+        assert cancelled == [1, 1]
+
+    def test_delay_follows_observed_latency(self):
+        hedger = Hedger(min_delay=0.0, max_delay=5.0, min_samples=1)
+        assert hedger.delay_for("k") == 5.0
+        hedger._record("k", 0.25)
+        assert hedger.delay_for("k") == 0.25
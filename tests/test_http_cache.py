@@ -0,0 +1,232 @@
+import asyncio
+import types
+
+import httpx
+
+from app.core.third_party_integrations.supabase_home.sdk.database import (
+    SupabaseDatabaseService,
+)
+from app.core.third_party_integrations.supabase_home.sdk.storage import (
+    SupabaseStorageService,
+)
+from app.core.third_party_integrations.supabase_home.tests.helpers import (
+    FakeSupabaseClient,
+    make_service,
+)
+from app.core.third_party_integrations.supabase_home.transport.http_cache import (
+    HTTPCache,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def response(status=200, content=b'[{"id": 1}]', **headers) -> httpx.Response:
+    return httpx.Response(status, content=content, headers=headers)
+
+
+class TestHTTPCache:
+    """Unit tests for the ETag-aware HTTP response cache"""
+
+    def test_fresh_entries_are_served_without_revalidation(self):
+        clock = FakeClock()
+        cache = HTTPCache(default_ttl=10, clock=clock)
+        cache.store("k", response(), [{"id": 1}], "/rest/v1/t")
+
+        entry, fresh = cache.lookup("k")
+        assert fresh and entry.value == [{"id": 1}]
+
+        clock.now = 11
+        entry, fresh = cache.lookup("k")
+        assert entry is not None and not fresh
+        assert cache.stats()["hits"] == 1
+
+    def test_stale_entries_revalidate_with_validators(self):
+        clock = FakeClock()
+        cache = HTTPCache(clock=clock)
+        cache.store(
+            "k",
+            response(ETag='"v1"', **{"Last-Modified": "Wed, 21 Oct 2015 07:28:00 GMT"}),
+            {"n": 1},
+            "/storage/v1/bucket/b",
+        )
+
+        entry, fresh = cache.lookup("k")
+        assert not fresh
+        assert cache.conditional_headers(entry) == {
+            "If-None-Match": '"v1"',
+            "If-Modified-Since": "Wed, 21 Oct 2015 07:28:00 GMT",
+        }
+        assert cache.revalidate("k", entry, response(304, b""), "/storage/v1/bucket/b") == {"n": 1}
+        assert cache.stats()["revalidated"] == 1
+
+    def test_uncacheable_responses_are_skipped(self):
+        cache = HTTPCache(default_ttl=10)
+        cache.store("no-store", response(**{"Cache-Control": "no-store"}), [], "/x")
+        cache.store("error", response(500), [], "/x")
+        cache.store("no-validators", response(), [], "/x")
+        assert len(cache) == 1
+        assert cache.lookup("no-validators")[0] is not None
+
+    def test_route_ttl_overrides_use_longest_prefix(self):
+        cache = HTTPCache(
+            default_ttl=1,
+            route_ttls={"/storage/v1": 5, "/storage/v1/bucket": 60},
+        )
+        assert cache.ttl_for("/storage/v1/bucket/avatars") == 60
+        assert cache.ttl_for("/storage/v1/object/a/b.png") == 5
+        assert cache.ttl_for("/rest/v1/t", response(**{"Cache-Control": "max-age=30"})) == 30
+        assert cache.ttl_for("/rest/v1/t") == 1
+
+    def test_lru_eviction_keeps_cache_within_byte_budget(self):
+        body = b"x" * 1000
+        cache = HTTPCache(max_bytes=4000, default_ttl=60)
+        for key in ("a", "b", "c"):
+            cache.store(key, response(content=body), key, "/x")
+        cache.lookup("a")  # a becomes most recently used
+        cache.store("d", response(content=body), "d", "/x")
+
+        assert cache.size_bytes <= 4000
+        assert cache.lookup("b")[0] is None
+        assert cache.lookup("a")[0] is not None
+
+    def test_invalidate_prefix_drops_matching_urls(self):
+        cache = HTTPCache(default_ttl=60)
+        key = ("GET", "https://x.supabase.co/rest/v1/t", (), "id", None)
+        other = ("GET", "https://x.supabase.co/rest/v1/u", (), "id", None)
+        cache.store(key, response(), [], "/rest/v1/t")
+        cache.store(other, response(), [], "/rest/v1/u")
+
+        assert cache.invalidate_prefix("https://x.supabase.co/rest/v1/t") == 1
+        assert cache.lookup(key)[0] is None
+        assert cache.lookup(other)[0] is not None
+
+    def test_invalidate_prefix_respects_path_boundaries(self):
+        cache = HTTPCache(default_ttl=60)
+        items = ("GET", "https://x.supabase.co/rest/v1/items", (("id", "eq.1"),), "id", None)
+        archive = ("GET", "https://x.supabase.co/rest/v1/items_archive", (), "id", None)
+        cache.store(items, response(), [], "/rest/v1/items")
+        cache.store(archive, response(), [], "/rest/v1/items_archive")
+
+        assert cache.invalidate_prefix("https://x.supabase.co/rest/v1/items") == 1
+        assert cache.lookup(items)[0] is None
+        assert cache.lookup(archive)[0] is not None
+
+    def test_invalidate_prefix_ignores_the_query_string(self):
+        cache = HTTPCache(default_ttl=60)
+        row_one = ("GET", "https://x.supabase.co/rest/v1/items", (("id", "eq.1"),), "id", None)
+        row_two = ("GET", "https://x.supabase.co/rest/v1/items?id=eq.2", (), "id", None)
+        child = ("GET", "https://x.supabase.co/storage/v1/object/b/dir/file", (), "id", None)
+        cache.store(row_one, response(), [], "/rest/v1/items")
+        cache.store(row_two, response(), [], "/rest/v1/items")
+        cache.store(child, response(), [], "/storage/v1/object/b/dir/file")
+
+        assert cache.invalidate_prefix("https://x.supabase.co/rest/v1/items?id=eq.1") == 2
+        assert cache.invalidate_prefix("https://x.supabase.co/storage/v1/object/b/dir/") == 1
+        assert len(cache) == 0
+
+
+BUCKET = {
+    "id": "avatars",
+    "name": "avatars",
+    "owner": "",
+    "public": True,
+    "created_at": "2024-01-01T00:00:00Z",
+    "updated_at": "2024-01-01T00:00:00Z",
+    "file_size_limit": None,
+    "allowed_mime_types": None,
+}
+
+
+def etag_server(body, etag='"v1"'):
+    """Handler answering 304 whenever the caller already holds `etag`."""
+    seen: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        if request.headers.get("If-None-Match") == etag:
+            return httpx.Response(304, headers={"ETag": etag})
+        if isinstance(body, bytes):
+            return httpx.Response(200, content=body, headers={"ETag": etag})
+        return httpx.Response(200, json=body, headers={"ETag": etag})
+
+    return handler, seen
+
+
+class FakeStorage:
+    """The bits of a storage3 client the SDK touches when reads are cached."""
+
+    _headers = {"apikey": "anon-key", "Authorization": "Bearer user-token"}
+
+    def from_(self, bucket_id):
+        async def remove(paths):
+            return [{"name": path} for path in paths]
+
+        return types.SimpleNamespace(remove=remove)
+
+
+class TestCachedSdkReads:
+    """Bucket metadata, downloads and fetch_data revalidate through the HTTP cache"""
+
+    def test_bucket_get_and_list_revalidate(self, monkeypatch):
+        handler, seen = etag_server(BUCKET)
+        http = make_service(monkeypatch, handler)
+        storage = SupabaseStorageService(types.SimpleNamespace(storage=FakeStorage()), http=http)
+
+        async def main():
+            first = await storage.bucket.get("avatars", cache=True)
+            second = await storage.bucket.get("avatars", cache=True)
+            await http.aclose()
+            return first, second
+
+        first, second = asyncio.run(main())
+        assert first.id == second.id == "avatars"
+        assert [r.headers.get("If-None-Match") for r in seen] == [None, '"v1"']
+        assert seen[0].headers["Authorization"] == "Bearer user-token"
+        assert http.http_cache.stats()["revalidated"] == 1
+
+    def test_public_download_revalidates_and_remove_invalidates(self, monkeypatch):
+        handler, seen = etag_server(b"\x89PNG")
+        http = make_service(monkeypatch, handler)
+        storage = SupabaseStorageService(types.SimpleNamespace(storage=FakeStorage()), http=http)
+
+        async def main():
+            bodies = [
+                await storage.file.download("avatars", "a.png", public=True, cache=True),
+                await storage.file.download("avatars", "a.png", public=True, cache=True),
+            ]
+            await storage.file.remove("avatars", ["a.png"])
+            bodies.append(await storage.file.download("avatars", "a.png", public=True, cache=True))
+            await http.aclose()
+            return bodies
+
+        assert asyncio.run(main()) == [b"\x89PNG"] * 3
+        assert seen[0].url.path == "/storage/v1/object/public/avatars/a.png"
+        assert [r.headers.get("If-None-Match") for r in seen] == [None, '"v1"', None]
+
+    def test_fetch_data_revalidates_and_writes_invalidate(self):
+        handler, seen = etag_server([{"code": "NZ"}])
+
+        def rest(request: httpx.Request) -> httpx.Response:
+            if request.method == "POST":
+                return httpx.Response(201, json=[{"code": "AU"}])
+            return handler(request)
+
+        db = SupabaseDatabaseService(FakeSupabaseClient(rest))
+
+        async def main():
+            first = await db.fetch_data("countries", revalidate=True)
+            second = await db.fetch_data("countries", revalidate=True)
+            await db.insert_data("countries", {"code": "AU"})
+            third = await db.fetch_data("countries", revalidate=True)
+            return first, second, third
+
+        first, second, third = asyncio.run(main())
+        assert first == third == [{"code": "NZ"}]
+        assert second is first
+        assert [r.headers.get("If-None-Match") for r in seen] == [None, '"v1"', None]
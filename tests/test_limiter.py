@@ -0,0 +1,119 @@
+import asyncio
+
+import httpx
+import pytest
+
+from app.core.third_party_integrations.supabase_home.exceptions.index import (
+    SupabaseConcurrencyLimitError,
+)
+from app.core.third_party_integrations.supabase_home.transport.limiter import (
+    AdaptiveLimiter,
+    AdaptiveLimiterRegistry,
+)
+
+
+class TestAdaptiveLimiter:
+    """Unit tests for the AIMD concurrency limiter"""
+
+    def test_caps_concurrency(self):
+        limiter = AdaptiveLimiter("rest", initial_limit=3, max_limit=3)
+        active = []
+        peak = []
+
+        async def call():
+            active.append(1)
+            peak.append(len(active))
+            await asyncio.sleep(0.01)
+            active.pop()
+            return httpx.Response(200)
+
+        async def main():
+            await asyncio.gather(*[limiter.run(call) for _ in range(12)])
+
+        asyncio.run(main())
+        assert max(peak) == 3
+        assert limiter.in_flight == 0
+
+    def test_shrinks_on_429_and_grows_on_success(self):
+        ticks = iter(range(1000))
+        limiter = AdaptiveLimiter(
+            "rest", initial_limit=10, backoff_ratio=0.5, clock=lambda: next(ticks) * 0.01
+        )
+
+        async def throttled():
+            return httpx.Response(429)
+
+        async def ok():
+            return httpx.Response(200)
+
+        asyncio.run(limiter.run(throttled))
+        assert limiter.limit == 5
+        for _ in range(20):
+            asyncio.run(limiter.run(ok))
+        assert limiter.limit > 5
+        assert limiter.snapshot()["total_throttled"] == 1
+
+    def test_latency_spike_shrinks_limit(self):
+        limiter = AdaptiveLimiter("rest", initial_limit=10, backoff_ratio=0.5)
+        for _ in range(11):
+            limiter._in_flight = 1
+            limiter.release(latency=0.01)
+        grown = limiter.limit
+        limiter._in_flight = 1
+        limiter.release(latency=1.0)
+        assert limiter.limit < grown
+
+    def test_never_drops_below_min_limit(self):
+        limiter = AdaptiveLimiter("rest", initial_limit=2, min_limit=2)
+        limiter._in_flight = 1
+        limiter.release(throttled=True)
+        assert limiter.limit == 2
+
+    def test_bounded_wait_rejects(self):
+        limiter = AdaptiveLimiter("storage", initial_limit=1, max_wait=0.01)
+
+        async def main():
+            await limiter.acquire()
+            with pytest.raises(SupabaseConcurrencyLimitError):
+                await limiter.acquire()
+            limiter.release()
+
+        asyncio.run(main())
+        assert limiter.snapshot()["total_rejected"] == 1
+
+    def test_slot_granted_as_wait_times_out_is_returned(self, monkeypatch):
+        limiter = AdaptiveLimiter("rest", initial_limit=1, max_limit=1)
+
+        async def racing_wait_for(future, timeout):
+            # * The running call finishes and hands its slot over just as the wait expires
+            limiter.release()
+            assert future.done()
+            raise asyncio.TimeoutError
+
+        async def main():
+            await limiter.acquire()
+            monkeypatch.setattr(asyncio, "wait_for", racing_wait_for)
+            with pytest.raises(SupabaseConcurrencyLimitError):
+                await limiter.acquire()
+            monkeypatch.undo()
+            await asyncio.wait_for(limiter.acquire(), 0.1)
+            limiter.release()
+
+        asyncio.run(main())
+        assert limiter.in_flight == 0
+
+    def test_full_queue_rejects_immediately(self):
+        limiter = AdaptiveLimiter("auth", initial_limit=1, max_queue=0)
+
+        async def main():
+            await limiter.acquire()
+            with pytest.raises(SupabaseConcurrencyLimitError):
+                await limiter.acquire()
+
+        asyncio.run(main())
+
+    def test_registry_per_area(self):
+        registry = AdaptiveLimiterRegistry(initial_limit=4)
+        assert registry.get("rest") is registry.get("rest")
+        assert registry.get("rest") is not registry.get("storage")
+        assert registry.snapshot()["rest"]["limit"] == 4
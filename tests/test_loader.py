@@ -0,0 +1,122 @@
+import asyncio
+
+import httpx
+
+from app.core.third_party_integrations.supabase_home.sdk.database import (
+    SupabaseDatabaseService,
+)
+from app.core.third_party_integrations.supabase_home.sdk.loader import chunk_keys
+from app.core.third_party_integrations.supabase_home.tests.helpers import (
+    FakeSupabaseClient,
+)
+
+USERS = [{"id": i, "team": i % 3} for i in range(1, 201)]
+
+
+def users_table(request: httpx.Request) -> httpx.Response:
+    column, expression = next(
+        (k, v) for k, v in request.url.params.multi_items() if v.startswith("in.")
+    )
+    wanted = set(expression[len("in.("):-1].split(","))
+    return httpx.Response(200, json=[row for row in USERS if str(row[column]) in wanted])
+
+
+class TestKeyLoader:
+    """Unit tests for DataLoader-style key batching"""
+
+    def test_same_tick_loads_share_one_query(self):
+        client = FakeSupabaseClient(users_table)
+        db = SupabaseDatabaseService(client)
+
+        async def main():
+            loader = db.loader("users")
+            return await asyncio.gather(loader.load(3), loader.load(1), loader.load(999), loader.load(3))
+
+        results = asyncio.run(main())
+        assert [row and row["id"] for row in results] == [3, 1, None, 3]
+        assert len(client.requests) == 1
+        assert client.requests[0].url.params["id"] == "in.(3,1,999)"
+
+    def test_memo_makes_repeated_keys_free(self):
+        client = FakeSupabaseClient(users_table)
+        db = SupabaseDatabaseService(client)
+
+        async def main():
+            loader = db.loader("users")
+            first = await loader.load_many([1, 2])
+            second = await loader.load_many([2, 1])
+            return first, second
+
+        first, second = asyncio.run(main())
+        assert [row["id"] for row in second] == [2, 1]
+        assert second[0] is first[1]
+        assert len(client.requests) == 1
+
+    def test_batches_split_to_url_budget(self):
+        client = FakeSupabaseClient(users_table)
+        db = SupabaseDatabaseService(client)
+
+        async def main():
+            loader = db.loader("users", max_url_length=400)
+            rows = await loader.load_many(range(1, 201))
+            return loader, rows
+
+        loader, rows = asyncio.run(main())
+        assert [row["id"] for row in rows] == list(range(1, 201))
+        assert loader.batches == len(client.requests) > 1
+        assert all(len(str(request.url)) < 600 for request in client.requests)
+
+    def test_many_groups_rows_per_key(self):
+        db = SupabaseDatabaseService(FakeSupabaseClient(users_table))
+
+        async def main():
+            loader = db.loaders().get("users", key="team", many=True)
+            return await loader.load_many([0, 7])
+
+        by_team, empty = asyncio.run(main())
+        assert len(by_team) == 66 and empty == []
+
+    def test_errors_reach_every_caller_and_are_not_memoized(self):
+        calls = []
+
+        def flaky(request):
+            calls.append(request)
+            if len(calls) == 1:
+                return httpx.Response(400, json={"message": "bad", "code": "22P02"})
+            return users_table(request)
+
+        db = SupabaseDatabaseService(FakeSupabaseClient(flaky))
+
+        async def main():
+            loader = db.loader("users")
+            failed = await asyncio.gather(loader.load(1), loader.load(2), return_exceptions=True)
+            return failed, await loader.load(1)
+
+        failed, retried = asyncio.run(main())
+        assert all(isinstance(error, Exception) for error in failed)
+        assert retried["id"] == 1
+
+    def test_clear_during_in_flight_batch_still_resolves_callers(self):
+        async def slow_users(request):
+            await asyncio.sleep(0.02)
+            return users_table(request)
+
+        client = FakeSupabaseClient(slow_users)
+        db = SupabaseDatabaseService(client)
+
+        async def main():
+            loader = db.loader("users")
+            pending = asyncio.gather(loader.load(1), loader.load(2))
+            await asyncio.sleep(0.005)
+            loader.clear()
+            rows = await asyncio.wait_for(pending, timeout=1.0)
+            return rows, await loader.load(1)
+
+        rows, reloaded = asyncio.run(main())
+        assert [row["id"] for row in rows] == [1, 2]
+        assert reloaded["id"] == 1
+        assert len(client.requests) == 2
+
+    def test_chunk_keys(self):
+        chunks = chunk_keys(list(range(100)), "id", budget=60)
+        assert sum(chunks, []) == list(range(100)) and len(chunks) > 1
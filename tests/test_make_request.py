@@ -0,0 +1,78 @@
+import asyncio
+
+import httpx
+
+from app.core.third_party_integrations.supabase_home.tests.helpers import make_service
+
+
+class TestPooledClient:
+    """The service owns one pooled HTTP client until aclose()"""
+
+    def test_client_is_reused_and_closed_by_aclose(self, monkeypatch):
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json={"path": request.url.path})
+
+        svc = make_service(monkeypatch, handler)
+
+        async def main():
+            await svc._make_request("GET", "/rest/v1/items")
+            first = svc._http_client
+            result = await svc._make_request("GET", "/rest/v1/other")
+            assert svc._http_client is first and not first.is_closed
+            await svc.aclose()
+            assert first.is_closed and svc._http_client is None
+            await svc._make_request("GET", "/rest/v1/items")
+            reopened = svc._http_client
+            await svc.aclose()
+            return first, reopened, result
+
+        first, reopened, result = asyncio.run(main())
+        assert result == {"path": "/rest/v1/other"}
+        assert reopened is not first and reopened.is_closed
+
+
+class TestRequestPipeline:
+    """Cache, single-flight, circuit breaker, retries and limiter on one request path"""
+
+    def test_layers_work_together(self, monkeypatch):
+        upstream = []
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            upstream.append(request)
+            await asyncio.sleep(0.01)
+            if len(upstream) == 1:
+                return httpx.Response(503)
+            return httpx.Response(
+                200,
+                json={"rows": [1, 2]},
+                headers={"ETag": '"v1"', "Cache-Control": "max-age=60"},
+            )
+
+        svc = make_service(
+            monkeypatch,
+            handler,
+            enable_http_cache=True,
+            enable_single_flight=True,
+            retry_backoff_base=0.001,
+            retry_backoff_max=0.001,
+        )
+
+        async def main():
+            results = await asyncio.gather(
+                *[svc._make_request("GET", "/rest/v1/items") for _ in range(5)]
+            )
+            cached = await svc._make_request("GET", "/rest/v1/items")
+            await svc.aclose()
+            return results, cached
+
+        results, cached = asyncio.run(main())
+        assert all(result == {"rows": [1, 2]} for result in results)
+        assert cached is results[0]
+        # * One 503 retried once; the other four callers shared that call
+        assert len(upstream) == 2
+        assert svc.single_flight.stats()["saved"] == 4
+        assert svc.http_cache.stats()["hits"] == 1
+        breaker = svc.circuit_breakers.get("rest").snapshot()
+        assert breaker["state"] == "closed" and breaker["consecutive_failures"] == 0
+        limiter = svc.limiters.get("rest").snapshot()
+        assert limiter["in_flight"] == 0 and limiter["total_rejected"] == 0
@@ -0,0 +1,145 @@
+import asyncio
+import gc
+import weakref
+
+import httpx
+import pytest
+
+from app.core.third_party_integrations.supabase_home.tests.helpers import make_service
+from app.core.third_party_integrations.supabase_home.transport.instrumentation import (
+    instrument,
+    instrument_class,
+)
+from app.core.third_party_integrations.supabase_home.transport.metrics import (
+    REQUEST_ERRORS,
+    REQUEST_LATENCY,
+    REQUESTS_IN_FLIGHT,
+    MetricsRegistry,
+    make_metrics_router,
+    metrics,
+)
+
+
+class TestMetricsRegistry:
+    """Unit tests for the Prometheus metrics registry"""
+
+    @pytest.fixture
+    def registry(self):
+        return MetricsRegistry()
+
+    def test_counter_and_gauge_render(self, registry):
+        counter = registry.counter("jobs_total", "Jobs run", ("kind",))
+        gauge = registry.gauge("queue_depth", "Queued jobs")
+        counter.inc("sync")
+        counter.inc("sync", amount=2)
+        gauge.set(value=4)
+        text = registry.render()
+        assert "# TYPE jobs_total counter" in text
+        assert 'jobs_total{kind="sync"} 3' in text
+        assert "queue_depth 4" in text
+
+    def test_histogram_buckets_are_cumulative(self, registry):
+        histogram = registry.histogram("latency_seconds", "Latency", ("op",), buckets=(0.1, 1.0))
+        for value in (0.05, 0.5, 5.0):
+            histogram.observe("read", value=value)
+        text = registry.render()
+        assert 'latency_seconds_bucket{op="read",le="0.1"} 1' in text
+        assert 'latency_seconds_bucket{op="read",le="1"} 2' in text
+        assert 'latency_seconds_bucket{op="read",le="+Inf"} 3' in text
+        assert 'latency_seconds_count{op="read"} 3' in text
+        assert 'latency_seconds_sum{op="read"} 5.55' in text
+
+    def test_label_mismatch_raises(self, registry):
+        counter = registry.counter("x_total", "X", ("a", "b"))
+        with pytest.raises(ValueError):
+            counter.inc("only-one")
+
+    def test_collectors_run_at_scrape(self, registry):
+        gauge = registry.gauge("state", "State")
+        registry.add_collector(lambda: gauge.set(value=7))
+        assert "state 7" in registry.render()
+
+    def test_collectors_can_be_removed(self, registry):
+        gauge = registry.gauge("state", "State")
+
+        def collect():
+            gauge.set(value=7)
+
+        registry.add_collector(collect)
+        registry.remove_collector(collect)
+        registry.remove_collector(collect)
+        assert "state 7" not in registry.render()
+
+    def test_service_gauges_do_not_keep_the_service_alive(self, monkeypatch):
+        def handler(request):
+            return httpx.Response(200, json=[])
+
+        closed = make_service(monkeypatch, handler)
+        asyncio.run(closed.aclose())
+        assert closed._metrics_collector not in metrics._collectors
+
+        dropped = weakref.ref(make_service(monkeypatch, handler))
+        gc.collect()
+        assert dropped() is None
+        assert "supabase_single_flight_saved" in metrics.render()
+
+    def test_metrics_router(self):
+        from fastapi import FastAPI
+        from fastapi.testclient import TestClient
+
+        app = FastAPI()
+        app.include_router(make_metrics_router())
+        response = TestClient(app).get("/metrics")
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+        assert "supabase_request_duration_seconds" in response.text
+
+
+class TestInstrumentation:
+    """Unit tests for the operation instrumentation decorators"""
+
+    def test_sync_function(self):
+        @instrument("tests.sync_op")
+        def op():
+            return 1
+
+        before = REQUEST_LATENCY.count("tests", "tests.sync_op")
+        assert op() == 1
+        assert REQUEST_LATENCY.count("tests", "tests.sync_op") == before + 1
+        assert REQUESTS_IN_FLIGHT.value("tests", "tests.sync_op") == 0
+
+    def test_awaitable_result_is_timed_until_awaited(self):
+        async def sdk_call():
+            return "done"
+
+        @instrument("tests.awaitable_op")
+        def op():
+            return sdk_call()
+
+        pending = op()
+        assert REQUESTS_IN_FLIGHT.value("tests", "tests.awaitable_op") == 1
+        assert asyncio.run(pending) == "done"
+        assert REQUESTS_IN_FLIGHT.value("tests", "tests.awaitable_op") == 0
+
+    def test_errors_are_classified(self):
+        @instrument("tests.failing_op")
+        async def op():
+            raise KeyError("missing")
+
+        with pytest.raises(KeyError):
+            asyncio.run(op())
+        assert REQUEST_ERRORS.value("tests", "tests.failing_op", "KeyError") == 1
+
+    def test_instrument_class_wraps_public_methods(self):
+        @instrument_class("tests.widget")
+        class Widget:
+            def list(self):
+                return []
+
+            def _private(self):
+                return None
+
+        Widget().list()
+        Widget()._private()
+        assert REQUEST_LATENCY.count("tests", "tests.widget.list") == 1
+        assert "tests.widget._private" not in metrics.render()
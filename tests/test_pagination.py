@@ -0,0 +1,101 @@
+import asyncio
+
+import httpx
+import pytest
+
+from app.core.third_party_integrations.supabase_home.sdk.database import (
+    SupabaseDatabaseService,
+)
+from app.core.third_party_integrations.supabase_home.sdk.pagination import (
+    KeysetCursor,
+    ensure_selected,
+    keyset_filter,
+    quote_value,
+)
+from app.core.third_party_integrations.supabase_home.tests.helpers import (
+    FakeSupabaseClient,
+)
+
+ROWS = [{"id": i, "name": f"row {i}"} for i in range(1, 26)]
+
+
+def keyset_table(request: httpx.Request) -> httpx.Response:
+    """Serve ROWS honouring `id=gt.N`, `order` and `limit` like PostgREST would."""
+    params = request.url.params
+    rows = ROWS
+    if "id" in params:
+        op, value = params["id"].split(".", 1)
+        assert op == "gt"
+        rows = [row for row in rows if row["id"] > int(value)]
+    assert params["order"] == "id.asc"
+    return httpx.Response(200, json=rows[: int(params["limit"])])
+
+
+class TestKeysetCursor:
+    """Unit tests for keyset cursor encoding and filter generation"""
+
+    def test_round_trips_through_token(self):
+        cursor = KeysetCursor(("created_at", "id"), ("2024-01-01T00:00:00+00:00", 7), True)
+        restored = KeysetCursor.decode(cursor.encode())
+        assert restored.columns == cursor.columns
+        assert restored.values == cursor.values
+        assert restored.descending
+
+    def test_invalid_token_is_rejected(self):
+        with pytest.raises(ValueError):
+            KeysetCursor.decode("not-a-cursor")
+
+    def test_composite_filter_uses_tiebreaker(self):
+        cursor = KeysetCursor(("created_at", "id"), ("2024-01-01T10:00:00", 7))
+        assert keyset_filter(cursor) == (
+            'created_at.gt."2024-01-01T10:00:00",'
+            'and(created_at.eq."2024-01-01T10:00:00",id.gt.7)'
+        )
+        assert keyset_filter(KeysetCursor(("id",))) is None
+
+    def test_quoting_escapes_reserved_characters(self):
+        assert quote_value('a,b"c') == '"a,b\\"c"'
+        assert quote_value(3) == "3"
+        with pytest.raises(ValueError):
+            quote_value(None)
+
+    def test_key_columns_are_added_to_projection(self):
+        assert ensure_selected("name", ["id"]) == "name,id"
+        assert ensure_selected("*", ["id"]) == "*"
+
+
+class TestKeysetIteration:
+    """Unit tests for streaming a table page by page"""
+
+    def test_aiter_rows_streams_every_row_once(self):
+        client = FakeSupabaseClient(keyset_table)
+        db = SupabaseDatabaseService(client)
+
+        async def main():
+            return [row async for row in db.aiter_rows("items", key=("id",), page_size=10)]
+
+        rows = asyncio.run(main())
+        assert [row["id"] for row in rows] == list(range(1, 26))
+        assert len(client.requests) == 3
+        assert "offset" not in client.requests[-1].url.params
+
+    def test_resume_from_saved_cursor(self):
+        db = SupabaseDatabaseService(FakeSupabaseClient(keyset_table))
+        cursor = KeysetCursor(("id",))
+
+        async def first_page():
+            async for page in db.aiter_rows("items", page_size=10, cursor=cursor, pages=True):
+                return page
+
+        async def rest(token):
+            return [row async for row in db.aiter_rows("items", page_size=10, cursor=token)]
+
+        page = asyncio.run(first_page())
+        assert len(page) == 10 and cursor.values is None  # page not yet consumed
+        cursor.advance(page[-1])
+        rows = asyncio.run(rest(cursor.encode()))
+        assert [row["id"] for row in rows] == list(range(11, 26))
+
+    def test_iter_rows_runs_without_event_loop(self):
+        db = SupabaseDatabaseService(FakeSupabaseClient(keyset_table))
+        assert sum(1 for _ in db.iter_rows("items", page_size=7)) == 25
@@ -0,0 +1,123 @@
+import asyncio
+
+from app.core.third_party_integrations.supabase_home.sdk.database import (
+    SupabaseDatabaseService,
+)
+from app.core.third_party_integrations.supabase_home.sdk.filters import col
+from app.core.third_party_integrations.supabase_home.sdk.query_cache import (
+    QueryCache,
+    embedded_tables,
+)
+from app.core.third_party_integrations.supabase_home.tests.helpers import (
+    FakeSupabaseClient,
+    echo_table,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def run_load(cache, key, loads, table="countries", tables=None):
+    async def load():
+        loads.append(key)
+        return [{"n": len(loads)}]
+
+    return cache.get_or_load(key, table, tables or frozenset({table}), load, lambda rows: 100)
+
+
+class TestQueryCache:
+    """Unit tests for the read-through query cache"""
+
+    def test_hits_within_ttl_and_misses_after(self):
+        clock = FakeClock()
+        cache = QueryCache(table_ttls={"countries": 10}, clock=clock)
+        loads = []
+
+        async def main():
+            first = await run_load(cache, "k", loads)
+            second = await run_load(cache, "k", loads)
+            clock.now = 11
+            third = await run_load(cache, "k", loads)
+            return first, second, third
+
+        first, second, third = asyncio.run(main())
+        assert first is second and third == [{"n": 2}]
+        assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 2
+
+    def test_stale_while_revalidate(self):
+        clock = FakeClock()
+        cache = QueryCache(table_ttls={"countries": 10}, stale_ttl=30, clock=clock)
+        loads = []
+
+        async def main():
+            await run_load(cache, "k", loads)
+            clock.now = 15
+            stale = await run_load(cache, "k", loads)
+            await asyncio.sleep(0)
+            await asyncio.sleep(0)
+            fresh = await run_load(cache, "k", loads)
+            return stale, fresh
+
+        stale, fresh = asyncio.run(main())
+        assert stale == [{"n": 1}] and fresh == [{"n": 2}]
+        assert len(loads) == 2 and cache.stats()["stale_hits"] == 1
+
+    def test_tables_without_ttl_are_not_cached(self):
+        cache = QueryCache(table_ttls={"countries": 10})
+        assert cache.caches("countries") and not cache.caches("orders")
+
+    def test_lru_eviction_by_bytes(self):
+        cache = QueryCache(max_bytes=250, default_ttl=60)
+        for key in ("a", "b", "c"):
+            cache.put(key, "t", frozenset({"t"}), key, 100)
+        assert len(cache) == 2 and cache.size_bytes == 200
+
+    def test_write_invalidates_embedding_queries_and_inflight_loads(self):
+        cache = QueryCache(default_ttl=60)
+        cache.put("customers+orders", "customers", frozenset({"customers", "orders"}), [], 10)
+        cache.put("countries", "countries", frozenset({"countries"}), [], 10)
+        assert cache.invalidate_table("orders") == 1
+        assert len(cache) == 1
+
+        async def racing_load():
+            async def load():
+                cache.invalidate_table("countries")  # a write lands mid-load
+                return []
+
+            await cache.get_or_load("k", "countries", frozenset({"countries"}), load, len)
+
+        asyncio.run(racing_load())
+        assert len(cache) == 0
+
+    def test_embedded_tables(self):
+        assert embedded_tables("id,author:users(name),orders!fk_orders(total,items(sku))") == {
+            "users",
+            "orders",
+            "items",
+        }
+
+
+class TestServiceQueryCache:
+    """fetch_data reads through the cache and writes invalidate it"""
+
+    def test_fetch_is_cached_until_write(self):
+        client = FakeSupabaseClient(echo_table)
+        db = SupabaseDatabaseService(client)
+        db.query_cache = QueryCache(table_ttls={"countries": 60})
+
+        async def main():
+            await db.fetch_data("countries", filters=col("active").is_(True), cache=True)
+            await db.fetch_data("countries", filters=col("active").is_(True), cache=True)
+            await db.fetch_data("countries", filters=col("active").is_(False), cache=True)
+            await db.update_data("countries", {"name": "x"}, {"id": 1})
+            await db.fetch_data("countries", filters=col("active").is_(True), cache=True)
+
+        asyncio.run(main())
+        gets = [request for request in client.requests if request.method == "GET"]
+        assert len(gets) == 3
+        assert db.query_cache.stats()["hits"] == 1
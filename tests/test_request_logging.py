@@ -0,0 +1,106 @@
+import logging
+
+import pytest
+
+from app.core.third_party_integrations.supabase_home.transport.request_logging import (
+    REDACTED,
+    RequestLogger,
+    redact,
+)
+
+
+class Exploding:
+    """Fails the test if anything tries to format it"""
+
+    def __str__(self):
+        raise AssertionError("argument was formatted")
+
+    __repr__ = __str__
+
+
+class TestRequestLogger:
+    """Unit tests for the hot-path request logger"""
+
+    @pytest.fixture
+    def test_logger(self):
+        return logging.getLogger("tests.supabase_home.request_logging")
+
+    def test_redact_nested_fields(self):
+        value = {
+            "Authorization": "Bearer secret",
+            "user": {"email": "a@b.c", "password": "hunter2"},
+            "items": [{"access_token": "t"}],
+        }
+        assert redact(value, frozenset({"authorization", "password", "access_token"})) == {
+            "Authorization": REDACTED,
+            "user": {"email": "a@b.c", "password": REDACTED},
+            "items": [{"access_token": REDACTED}],
+        }
+
+    def test_disabled_logger_is_a_no_op(self, test_logger, caplog):
+        request_log = RequestLogger(test_logger, enabled=False)
+        with caplog.at_level(logging.DEBUG, logger=test_logger.name):
+            request_log.response("GET", "/x", 200, 0.01, request_headers=Exploding())
+            request_log.failure("GET", "/x", "%s", Exploding())
+        assert caplog.records == []
+
+    def test_details_not_formatted_below_debug(self, test_logger, caplog):
+        request_log = RequestLogger(test_logger)
+        with caplog.at_level(logging.INFO, logger=test_logger.name):
+            request_log.response("GET", "/x", 200, 0.01, request_headers=Exploding())
+        assert len(caplog.records) == 1
+        assert caplog.records[0].getMessage() == "Supabase GET /x -> 200 in 10.0ms"
+
+    def test_debug_record_redacts_headers(self, test_logger, caplog):
+        request_log = RequestLogger(test_logger)
+        with caplog.at_level(logging.DEBUG, logger=test_logger.name):
+            request_log.response(
+                "POST",
+                "/x",
+                201,
+                0.01,
+                request_headers={"apikey": "service-role", "Accept": "json"},
+                data={"password": "hunter2"},
+                content=b"x" * 500,
+            )
+        message = caplog.records[-1].getMessage()
+        assert "service-role" not in message
+        assert "hunter2" not in message
+        assert "x" * 200 + "..." in message
+
+    def test_debug_body_preview_redacts_tokens(self, test_logger, caplog):
+        request_log = RequestLogger(test_logger, body_preview=40)
+        body = (
+            b'{"access_token": "eyJ-secret-access", "token_type": "bearer",'
+            b' "refresh_token": "secret-refresh", "user": {"email": "a@b.c"}}'
+        )
+        with caplog.at_level(logging.DEBUG, logger=test_logger.name):
+            request_log.response("POST", "/auth/v1/token", 200, 0.01, content=body)
+        message = caplog.records[-1].getMessage()
+        assert "eyJ" not in message and "secret" not in message
+        assert f'"access_token": "{REDACTED}"' in message
+
+    def test_preview_masks_a_token_cut_off_by_truncation(self, test_logger, caplog):
+        request_log = RequestLogger(test_logger, body_preview=30)
+        body = b'{"refresh_token": "secret-refresh-token-value"}' + b" " * 100_000
+        with caplog.at_level(logging.DEBUG, logger=test_logger.name):
+            request_log.response("POST", "/auth/v1/token", 200, 0.01, content=body)
+        message = caplog.records[-1].getMessage()
+        assert "secret" not in message
+        assert f'"refresh_token": "{REDACTED}"...' in message
+
+    def test_failure_details_are_redacted(self, test_logger, caplog):
+        request_log = RequestLogger(test_logger)
+        with caplog.at_level(logging.ERROR, logger=test_logger.name):
+            detail = {"access_token": "eyJ-leak", "msg": "bad"}
+            request_log.failure("POST", "/auth/v1/token", "HTTP %d %s", 400, detail)
+        message = caplog.records[-1].getMessage()
+        assert "eyJ-leak" not in message
+        assert "HTTP 400" in message and "bad" in message
+
+    def test_sampling_by_status_class(self, test_logger, caplog):
+        request_log = RequestLogger(test_logger, sample_rates={"2xx": 0.0})
+        with caplog.at_level(logging.INFO, logger=test_logger.name):
+            request_log.response("GET", "/x", 200, 0.01)
+            request_log.response("GET", "/x", 503, 0.01)
+        assert [r.levelno for r in caplog.records] == [logging.WARNING]
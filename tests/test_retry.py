@@ -0,0 +1,92 @@
+import asyncio
+
+import httpx
+import pytest
+
+from app.core.third_party_integrations.supabase_home.transport.retry import (
+    RetryPolicy,
+    parse_retry_after,
+)
+
+
+def _response(status_code: int, headers: dict[str, str] | None = None) -> httpx.Response:
+    return httpx.Response(status_code, headers=headers or {})
+
+
+class TestRetryPolicy:
+    """Unit tests for the Supabase request retry engine"""
+
+    @pytest.fixture
+    def policy(self):
+        return RetryPolicy(retry_attempts=3, backoff_base=0.0, backoff_max=0.0)
+
+    def run(self, policy, method, outcomes, **kwargs):
+        calls = []
+
+        async def send():
+            outcome = outcomes[len(calls)]
+            calls.append(outcome)
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+
+        result = asyncio.run(policy.execute(method, send, **kwargs))
+        return result, calls
+
+    def test_parse_retry_after_seconds(self):
+        assert parse_retry_after("2") == 2.0
+        assert parse_retry_after("garbage") is None
+        assert parse_retry_after(None) is None
+
+    def test_parse_retry_after_http_date(self):
+        assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+
+    def test_retries_transient_status_then_succeeds(self, policy):
+        result, calls = self.run(
+            policy, "GET", [_response(503), _response(429), _response(200)]
+        )
+        assert result.status_code == 200
+        assert len(calls) == 3
+
+    def test_returns_last_response_when_exhausted(self, policy):
+        result, calls = self.run(policy, "GET", [_response(502)] * 4)
+        assert result.status_code == 502
+        assert len(calls) == 4
+
+    def test_does_not_retry_post_status_by_default(self, policy):
+        result, calls = self.run(policy, "POST", [_response(503), _response(200)])
+        assert result.status_code == 503
+        assert len(calls) == 1
+
+    def test_retries_post_when_opted_in(self, policy):
+        result, calls = self.run(
+            policy,
+            "POST",
+            [_response(503), _response(200)],
+            retry_non_idempotent=True,
+        )
+        assert result.status_code == 200
+        assert len(calls) == 2
+
+    def test_connect_errors_are_retried_for_any_method(self, policy):
+        result, calls = self.run(
+            policy, "POST", [httpx.ConnectError("boom"), _response(201)]
+        )
+        assert result.status_code == 201
+        assert len(calls) == 2
+
+    def test_read_timeout_on_post_is_raised(self, policy):
+        with pytest.raises(httpx.ReadTimeout):
+            self.run(policy, "POST", [httpx.ReadTimeout("slow"), _response(201)])
+
+    def test_retry_after_beyond_budget_stops(self):
+        policy = RetryPolicy(retry_attempts=3, backoff_base=0.0, total_timeout=1.0)
+        result, calls = self.run(
+            policy, "GET", [_response(503, {"Retry-After": "10"}), _response(200)]
+        )
+        assert result.status_code == 503
+        assert len(calls) == 1
+
+    def test_backoff_is_capped(self):
+        policy = RetryPolicy(backoff_base=1.0, backoff_max=2.0)
+        assert all(0 <= policy.backoff(attempt) <= 2.0 for attempt in range(1, 10))
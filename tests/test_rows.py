@@ -0,0 +1,170 @@
+import asyncio
+import base64
+import dataclasses
+import datetime
+import decimal
+import typing
+
+import httpx
+import msgspec
+import pytest
+from postgrest.exceptions import APIError
+
+from app.core.third_party_integrations.supabase_home.sdk.database import (
+    SupabaseDatabaseService,
+)
+from app.core.third_party_integrations.supabase_home.sdk.rows import (
+    ROW_KINDS,
+    make_row_type,
+    rows_decoder,
+)
+from app.core.third_party_integrations.supabase_home.sdk.schema import SchemaCatalog
+from app.core.third_party_integrations.supabase_home.tests.helpers import (
+    FakeSupabaseClient,
+)
+from app.core.third_party_integrations.supabase_home.transport.codec import get_codec
+
+OPENAPI = {
+    "definitions": {
+        "events": {
+            "required": ["id", "kind", "at"],
+            "properties": {
+                "id": {"type": "integer", "format": "bigint"},
+                "kind": {"type": "string", "format": "text"},
+                "at": {"type": "string", "format": "timestamp with time zone"},
+                "score": {"type": "number", "format": "double precision"},
+                "tags": {"type": "array", "format": "text[]"},
+                "payload": {"format": "jsonb"},
+                "from": {"type": "string", "format": "text"},
+            },
+        }
+    }
+}
+
+EVENTS = [
+    {"id": 1, "kind": "click", "at": "2024-05-01T12:00:00+00:00", "score": 0.5,
+     "tags": ["a"], "payload": {"x": 1}, "from": "web"},
+    {"id": 2, "kind": "view", "at": "2024-05-01T12:01:00+00:00", "score": None,
+     "tags": None, "payload": None, "from": None},
+]
+
+
+def rest_api(rows):
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/rest/v1/"):
+            return httpx.Response(200, json=OPENAPI)
+        select = request.url.params.get("select", "*")
+        if select != "*":
+            columns = select.split(",")
+            return httpx.Response(200, json=[{c: row[c] for c in columns} for row in rows])
+        return httpx.Response(200, json=rows)
+
+    return handler
+
+
+class TestRowTypes:
+    """Unit tests for record types generated from the schema"""
+
+    def test_struct_fields_follow_the_schema(self):
+        events = SchemaCatalog.from_openapi(OPENAPI).table("events")
+        Row = make_row_type(events)
+        assert issubclass(Row, msgspec.Struct)
+        hints = typing.get_type_hints(Row)
+        assert hints["id"] is int
+        assert hints["at"] is datetime.datetime
+        assert hints["score"] == float | None
+        assert hints["tags"] == list[str] | None
+        assert make_row_type(events) is Row  # * built once
+
+        rows = rows_decoder(Row)(get_codec("json").encode(EVENTS))
+        assert rows[0].f_from == "web" and rows[1].score is None
+        assert rows[0].at.tzinfo is not None
+
+    def test_select_subset_aliases_and_json_paths(self):
+        events = SchemaCatalog.from_openapi(OPENAPI).table("events")
+        Row = make_row_type(events, "id,type:kind,payload->>x", "dataclass")
+        assert [field.name for field in dataclasses.fields(Row)] == ["id", "type", "x"]
+        assert not hasattr(Row(1, "a", None), "__dict__")
+
+    def test_invalid_selects(self):
+        events = SchemaCatalog.from_openapi(OPENAPI).table("events")
+        with pytest.raises(ValueError, match="Unknown column"):
+            make_row_type(events, "id,nope")
+        with pytest.raises(ValueError, match="embedded"):
+            make_row_type(events, "id,users(*)")
+        with pytest.raises(ValueError, match="field names"):
+            make_row_type(events, "*", "namedtuple")
+
+    def test_numeric_columns_decode_exactly(self):
+        ledger = SchemaCatalog.from_openapi(
+            {
+                "definitions": {
+                    "ledger": {
+                        "required": ["id"],
+                        "properties": {
+                            "id": {"type": "integer", "format": "bigint"},
+                            "amount": {"type": "number", "format": "numeric"},
+                            "rate": {"type": "number", "format": "double precision"},
+                        },
+                    }
+                }
+            }
+        ).table("ledger")
+        body = b'[{"id": 1, "amount": 12345678901234567890.12, "rate": 0.5}]'
+        for kind in ROW_KINDS:
+            (row,) = rows_decoder(make_row_type(ledger, kind=kind))(body)
+            # * A float would round this to 12345678901234567000
+            assert row.amount == decimal.Decimal("12345678901234567890.12")
+            assert row.rate == 0.5 and isinstance(row.rate, float)
+
+    def test_decoding_validates_types(self):
+        events = SchemaCatalog.from_openapi(OPENAPI).table("events")
+        body = b'[{"id": "one", "kind": "click", "at": "2024-05-01T12:00:00Z"}]'
+        for kind in ("struct", "dataclass"):
+            with pytest.raises(ValueError):
+                rows_decoder(make_row_type(events, "id,kind,at", kind))(body)
+        with pytest.raises(ValueError):
+            rows_decoder(make_row_type(events, "id,kind,at", "namedtuple"))(body)
+
+
+class TestFetchTyped:
+    """fetch_data decodes the raw response body into records"""
+
+    def test_generated_type(self):
+        client = FakeSupabaseClient(rest_api(EVENTS))
+        db = SupabaseDatabaseService(client)
+
+        rows = asyncio.run(db.fetch_data("events", as_type="namedtuple", select="id,kind,at"))
+        assert [(row.id, row.kind) for row in rows] == [(1, "click"), (2, "view")]
+        assert isinstance(rows[0], tuple)
+
+    def test_user_model(self):
+        class Event(msgspec.Struct):
+            id: int
+            kind: str
+
+        client = FakeSupabaseClient(rest_api(EVENTS))
+        db = SupabaseDatabaseService(client)
+
+        rows = asyncio.run(db.fetch_data("events", as_type=Event, cache=True))
+        assert rows == [Event(1, "click"), Event(2, "view")]
+        assert len(client.requests) == 1  # * no schema needed for a user model
+        assert get_codec("json").encode(rows) == b'[{"id":1,"kind":"click"},{"id":2,"kind":"view"}]'
+
+    def test_client_auth_is_sent(self):
+        client = FakeSupabaseClient(rest_api(EVENTS))
+        client.postgrest.auth(None, username="reporting", password="s3cret")
+        db = SupabaseDatabaseService(client)
+
+        asyncio.run(db.fetch_data("events", as_type=dict))
+        credentials = base64.b64encode(b"reporting:s3cret").decode()
+        assert client.requests[-1].headers["Authorization"] == f"Basic {credentials}"
+
+    def test_errors_raise_api_error(self):
+        def failing(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(400, json={"code": "42703", "message": "column does not exist"})
+
+        db = SupabaseDatabaseService(FakeSupabaseClient(failing))
+        with pytest.raises(APIError) as info:
+            asyncio.run(db.fetch_data("events", as_type=dict))
+        assert info.value.code == "42703"
@@ -0,0 +1,87 @@
+import asyncio
+
+import httpx
+import pytest
+
+from app.core.third_party_integrations.supabase_home.sdk.database import (
+    SupabaseDatabaseService,
+)
+from app.core.third_party_integrations.supabase_home.sdk.scan import (
+    compute_split_points,
+    partitions_from_points,
+)
+from app.core.third_party_integrations.supabase_home.tests.helpers import (
+    FakeSupabaseClient,
+    postgrest_table,
+)
+
+ROWS = [{"id": i, "value": i * 10} for i in range(1, 101)]
+
+
+def collect(db, **kwargs):
+    async def main():
+        return [page async for page in db.scan_table("items", "id", **kwargs)]
+
+    return asyncio.run(main())
+
+
+class TestSplitPoints:
+    """Unit tests for partition boundary computation"""
+
+    def test_integer_and_timestamp_ranges(self):
+        assert compute_split_points(0, 100, 4) == [25, 50, 75]
+        assert compute_split_points(
+            "2024-01-01T00:00:00+00:00", "2024-01-03T00:00:00+00:00", 2
+        ) == ["2024-01-02T00:00:00+00:00"]
+        assert compute_split_points(1, 2, 4) == []  # duplicates collapse
+        with pytest.raises(ValueError):
+            compute_split_points("a", "b", 2)
+
+    def test_partitions_cover_whole_key_space(self):
+        assert partitions_from_points([10, 20]) == [(None, 10), (10, 20), (20, None)]
+
+
+class TestParallelScan:
+    """Unit tests for the range-partitioned table scan"""
+
+    def test_reads_every_row_once(self):
+        db = SupabaseDatabaseService(FakeSupabaseClient(postgrest_table(ROWS)))
+        pages = collect(db, partitions=4, page_size=10)
+        ids = [row["id"] for page in pages for row in page]
+        assert sorted(ids) == list(range(1, 101))
+
+    def test_ordered_scan_preserves_key_order(self):
+        async def jittery(request):
+            await asyncio.sleep(0.001 * (hash(str(request.url)) % 5))
+            return postgrest_table(ROWS)(request)
+
+        db = SupabaseDatabaseService(FakeSupabaseClient(jittery))
+        pages = collect(db, split_points=[30, 60], page_size=7, ordered=True, max_concurrency=3)
+        assert [row["id"] for page in pages for row in page] == list(range(1, 101))
+
+    def test_failed_partition_resumes_from_last_page(self):
+        calls = {"failed": False}
+        serve = postgrest_table(ROWS)
+
+        def flaky(request):
+            if request.url.params.get_list("id") == ["gte.50", "gt.69"] and not calls["failed"]:
+                calls["failed"] = True
+                return httpx.Response(500, json={"message": "boom"})
+            return serve(request)
+
+        progress = []
+        db = SupabaseDatabaseService(FakeSupabaseClient(flaky))
+        pages = collect(
+            db,
+            split_points=[50],
+            page_size=10,
+            on_progress=lambda p: progress.append(p.as_dict()),
+        )
+        ids = [row["id"] for page in pages for row in page]
+        assert sorted(ids) == list(range(1, 101))
+        assert calls["failed"] and progress[-1]["retries"] == 1
+        assert progress[-1]["completed"] == 2 and progress[-1]["rows"] == 100
+
+    def test_empty_table_yields_nothing(self):
+        db = SupabaseDatabaseService(FakeSupabaseClient(postgrest_table([])))
+        assert collect(db) == []
@@ -0,0 +1,163 @@
+import asyncio
+import json
+import time
+
+import httpx
+import pytest
+
+from app.core.third_party_integrations.supabase_home.config import supabase_config
+from app.core.third_party_integrations.supabase_home.sdk.database import (
+    SupabaseDatabaseService,
+)
+from app.core.third_party_integrations.supabase_home.sdk.filters import col
+from app.core.third_party_integrations.supabase_home.sdk.schema import (
+    SchemaCache,
+    SchemaCatalog,
+    select_columns,
+)
+from app.core.third_party_integrations.supabase_home.tests.helpers import (
+    FakeSupabaseClient,
+)
+
+PK = "Note:\nThis is a Primary Key.<pk/>"
+
+OPENAPI = {
+    "swagger": "2.0",
+    "definitions": {
+        "users": {
+            "required": ["id", "email"],
+            "properties": {
+                "id": {"type": "string", "format": "uuid", "description": PK},
+                "email": {"type": "string", "format": "text"},
+                "password_hash": {"type": "string", "format": "text"},
+                "profile": {"format": "jsonb"},
+                "created_at": {"type": "string", "format": "timestamp with time zone", "default": "now()"},
+            },
+        },
+        "memberships": {
+            "properties": {
+                "team_id": {"type": "integer", "format": "bigint", "description": PK},
+                "user_id": {"type": "string", "format": "uuid", "description": PK},
+            },
+        },
+        "active_users": {"properties": {"email": {"type": "string"}}},
+    },
+}
+
+
+def rest_api(rows):
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/rest/v1/"):
+            return httpx.Response(200, json=OPENAPI)
+        return httpx.Response(200, json=rows)
+
+    return handler
+
+
+class TestSchemaCatalog:
+    """Unit tests for tables, columns and primary keys parsed from OpenAPI"""
+
+    def test_parses_columns_and_primary_keys(self):
+        schema = SchemaCatalog.from_openapi(OPENAPI)
+        users = schema.table("users")
+        assert list(users.columns) == ["id", "email", "password_hash", "profile", "created_at"]
+        assert users.columns["id"].format == "uuid"
+        assert users.columns["email"].required and not users.columns["profile"].required
+        assert users.columns["created_at"].default == "now()"
+        assert schema.primary_key("memberships") == ("team_id", "user_id")
+        assert schema.primary_key("active_users") == ()
+
+    def test_select_columns(self):
+        assert select_columns("id, name:email,profile->>city,created_at::date,*,orders(id,total)") == [
+            "id",
+            "email",
+            "profile",
+            "created_at",
+        ]
+
+    def test_validate_query_rejects_unknown_columns(self):
+        schema = SchemaCatalog.from_openapi(OPENAPI)
+        schema.validate_query("users", "id,email", col("profile->>city").eq("Oslo"), "created_at.desc")
+        with pytest.raises(ValueError, match="emial, nme"):
+            schema.validate_query("users", "id,emial", {"nme": "x"})
+        with pytest.raises(ValueError, match="Unknown column"):
+            schema.validate_query("users", order="updated_at.desc")
+        with pytest.raises(ValueError, match="Unknown table 'user'"):
+            schema.validate_query("user")
+
+    def test_projection_is_built_once(self):
+        schema = SchemaCatalog.from_openapi(OPENAPI)
+        projection = schema.projection("users", exclude=["password_hash"])
+        assert projection == "id,email,profile,created_at"
+        assert schema.projection("users", exclude=["password_hash"]) is projection
+        assert schema.projection("users", include=["email", "id"]) == "email,id"
+        with pytest.raises(ValueError):
+            schema.projection("users", include=["nope"])
+
+
+class TestSchemaCacheOnDisk:
+    """The OpenAPI document is shared across restarts through a file"""
+
+    def test_fresh_file_skips_the_fetch(self, tmp_path):
+        path = tmp_path / "schema.json"
+        loads = []
+
+        async def loader():
+            loads.append(1)
+            return OPENAPI
+
+        async def main():
+            await SchemaCache(loader, ttl=60, path=str(path)).get()
+            return await SchemaCache(loader, ttl=60, path=str(path)).get()
+
+        catalog = asyncio.run(main())
+        assert len(loads) == 1
+        assert catalog.primary_key("users") == ("id",)
+
+    def test_expired_or_corrupt_file_is_refetched(self, tmp_path):
+        path = tmp_path / "schema.json"
+        path.write_text(json.dumps({"fetched_at": time.time() - 120, "document": {"definitions": {}}}))
+        loads = []
+
+        async def loader():
+            loads.append(1)
+            return OPENAPI
+
+        asyncio.run(SchemaCache(loader, ttl=60, path=str(path)).get())
+        path.write_text("{not json")
+        asyncio.run(SchemaCache(loader, ttl=60, path=str(path)).get())
+        assert len(loads) == 2
+        assert "users" in json.loads(path.read_text())["document"]["definitions"]
+
+
+class TestSchemaInQueries:
+    """The database service uses the catalog for paging keys and validation"""
+
+    def test_aiter_rows_pages_on_primary_key(self):
+        client = FakeSupabaseClient(rest_api([]))
+        db = SupabaseDatabaseService(client)
+
+        async def main():
+            return [row async for row in db.aiter_rows("memberships")]
+
+        assert asyncio.run(main()) == []
+        params = client.requests[-1].url.params
+        assert params["order"] == "team_id.asc,user_id.asc"
+        assert params["select"] == "*"
+
+    def test_validate_columns_fails_before_the_request(self, monkeypatch):
+        monkeypatch.setattr(supabase_config, "validate_columns", True)
+        client = FakeSupabaseClient(rest_api([]))
+        db = SupabaseDatabaseService(client)
+
+        async def main():
+            with pytest.raises(ValueError, match="Unknown column"):
+                await db.fetch_data("users", select="id,emial")
+            select = await db.projection("users", exclude=["password_hash"])
+            await db.fetch_data("users", select=select)
+
+        asyncio.run(main())
+        assert [request.url.path for request in client.requests] == [
+            "/rest/v1/",
+            "/rest/v1/users",
+        ]
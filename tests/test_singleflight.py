@@ -0,0 +1,95 @@
+import asyncio
+
+import pytest
+
+from app.core.third_party_integrations.supabase_home.transport.singleflight import (
+    SingleFlight,
+    request_key,
+)
+
+
+class TestSingleFlight:
+    """Unit tests for single-flight request coalescing"""
+
+    def test_concurrent_calls_share_one_execution(self):
+        group = SingleFlight()
+        executions = []
+
+        async def fetch():
+            executions.append(1)
+            await asyncio.sleep(0.01)
+            return {"rows": [1, 2, 3]}
+
+        async def main():
+            return await asyncio.gather(*[group.do("k", fetch) for _ in range(10)])
+
+        results = asyncio.run(main())
+        assert len(executions) == 1
+        assert all(result is results[0] for result in results)
+        assert group.stats() == {"calls": 10, "executions": 1, "saved": 9, "in_flight": 0}
+
+    def test_errors_are_shared_and_not_cached(self):
+        group = SingleFlight()
+
+        async def boom():
+            await asyncio.sleep(0.01)
+            raise RuntimeError("upstream")
+
+        async def main():
+            return await asyncio.gather(
+                *[group.do("k", boom) for _ in range(3)], return_exceptions=True
+            )
+
+        results = asyncio.run(main())
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+        async def ok():
+            return 1
+
+        assert asyncio.run(group.do("k", ok)) == 1
+        assert group.executions == 2
+
+    def test_cancelling_the_leader_does_not_fail_followers(self):
+        group = SingleFlight()
+        executions = []
+
+        async def fetch():
+            executions.append(1)
+            await asyncio.sleep(0.05)
+            return {"rows": [1]}
+
+        async def main():
+            leader = asyncio.create_task(group.do("k", fetch))
+            await asyncio.sleep(0)
+            follower = asyncio.create_task(group.do("k", fetch))
+            await asyncio.sleep(0.01)
+            leader.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await leader
+            return await follower
+
+        assert asyncio.run(main()) == {"rows": [1]}
+        assert len(executions) == 1
+        assert group.stats()["in_flight"] == 0
+
+    def test_request_key_separates_identities(self):
+        anon = request_key("GET", "/rest/v1/t", {"b": 2, "a": 1}, {"apikey": "anon"})
+        same = request_key("get", "/rest/v1/t", {"a": 1, "b": 2}, {"apikey": "anon"})
+        user = request_key(
+            "GET", "/rest/v1/t", {"a": 1, "b": 2}, {"apikey": "anon", "Authorization": "Bearer u"}
+        )
+        assert anon == same
+        assert anon != user
+
+    @pytest.mark.parametrize("key", ["a", ("GET", "/x")])
+    def test_distinct_keys_do_not_coalesce(self, key):
+        group = SingleFlight()
+
+        async def value():
+            return key
+
+        async def main():
+            return await asyncio.gather(group.do(key, value), group.do("other", value))
+
+        asyncio.run(main())
+        assert group.executions == 2
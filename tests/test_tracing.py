@@ -0,0 +1,197 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from app.core.third_party_integrations.supabase_home.sdk.database import (
+    SupabaseDatabaseService,
+)
+from app.core.third_party_integrations.supabase_home.sdk.query_cache import QueryCache
+from app.core.third_party_integrations.supabase_home.tests.helpers import (
+    FakeSupabaseClient,
+    echo_table,
+    make_service,
+)
+from app.core.third_party_integrations.supabase_home.transport.instrumentation import (
+    instrument,
+)
+from app.core.third_party_integrations.supabase_home.transport.tracing import (
+    JsonLinesExporter,
+    RingBufferExporter,
+    parse_traceparent,
+    reset_trace_context,
+    set_span_attribute,
+    set_trace_context,
+    tracer,
+)
+
+
+class TestTracing:
+    """Unit tests for spans emitted by instrumented Supabase operations"""
+
+    @pytest.fixture
+    def ring(self):
+        exporter = tracer.add_exporter(RingBufferExporter(capacity=10))
+        yield exporter
+        tracer.remove_exporter(exporter)
+
+    def test_parse_traceparent(self):
+        header = "00-0af7651916cd43dd8448eb211c80319c-b7ad6b7169203331-01"
+        assert parse_traceparent(header) == (
+            "0af7651916cd43dd8448eb211c80319c",
+            "b7ad6b7169203331",
+        )
+        assert parse_traceparent("garbage") is None
+        assert parse_traceparent(None) is None
+
+    def test_disabled_tracer_creates_no_spans(self):
+        @instrument("tests.untraced")
+        def op():
+            set_span_attribute("ignored", True)
+            return 1
+
+        assert not tracer.enabled
+        assert op() == 1
+
+    def test_span_attributes_from_arguments_and_result(self, ring):
+        @instrument("database.fetch_data")
+        def fetch_data(table, select="*"):
+            return [{"id": 1}, {"id": 2}]
+
+        fetch_data("items")
+        (span,) = ring.spans()
+        assert span.name == "database.fetch_data"
+        assert span.attributes == {"db.table": "items", "result.rows": 2}
+        assert span.status == "ok"
+        assert span.duration is not None
+
+    def test_nested_spans_share_trace(self, ring):
+        @instrument("tests.inner")
+        async def inner():
+            set_span_attribute("cache.hit", False)
+
+        @instrument("tests.outer")
+        async def outer():
+            await inner()
+
+        asyncio.run(outer())
+        inner_span, outer_span = ring.spans()
+        assert inner_span.trace_id == outer_span.trace_id
+        assert inner_span.parent_id == outer_span.span_id
+        assert inner_span.attributes["cache.hit"] is False
+
+    def test_links_to_incoming_trace_context(self, ring):
+        @instrument("tests.linked")
+        def op():
+            return None
+
+        token = set_trace_context("00-0af7651916cd43dd8448eb211c80319c-b7ad6b7169203331-01")
+        try:
+            op()
+        finally:
+            reset_trace_context(token)
+        (span,) = ring.spans()
+        assert span.trace_id == "0af7651916cd43dd8448eb211c80319c"
+        assert span.parent_id == "b7ad6b7169203331"
+
+    def test_errors_are_recorded(self, ring):
+        @instrument("tests.failing")
+        def op():
+            raise ValueError("bad input")
+
+        with pytest.raises(ValueError):
+            op()
+        (span,) = ring.spans()
+        assert span.status == "error"
+        assert span.error == "ValueError: bad input"
+
+    def test_streamed_read_span_covers_the_iteration(self, ring):
+        async def slow_pages(request):
+            await asyncio.sleep(0.02)
+            after = request.url.params.get("id", "gt.0")
+            return httpx.Response(200, json=[] if after != "gt.0" else [{"id": 1}, {"id": 2}])
+
+        db = SupabaseDatabaseService(FakeSupabaseClient(slow_pages))
+
+        async def main():
+            return [row async for row in db.aiter_rows("items", key=("id",), page_size=2)]
+
+        assert len(asyncio.run(main())) == 2
+        (span,) = [span for span in ring.spans() if span.name == "database.aiter_rows"]
+        assert span.status == "ok"
+        assert span.attributes["db.table"] == "items"
+        assert span.duration >= 0.04
+
+    def test_generator_stopped_early_is_not_an_error(self, ring):
+        @instrument("tests.stream")
+        def stream():
+            yield from range(10)
+
+        assert [n for n, _ in zip(stream(), range(3))] == [0, 1, 2]
+        (span,) = ring.spans()
+        assert span.status == "ok"
+
+    def test_fresh_cache_hit_is_recorded_on_its_request_span(self, monkeypatch, ring):
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json=[], headers={"Cache-Control": "max-age=60"})
+
+        svc = make_service(monkeypatch, handler, enable_http_cache=True)
+
+        async def main():
+            await svc._make_request("GET", "/rest/v1/items")
+            await svc._make_request("GET", "/rest/v1/items")
+            await svc.aclose()
+
+        asyncio.run(main())
+        missed, hit = ring.spans()
+        assert missed.name == hit.name == "rest.get"
+        assert missed.attributes["cache.hit"] is False
+        assert hit.attributes["cache.hit"] is True
+        # * Only the miss reached the upstream
+        assert "http.response.bytes" in missed.attributes
+        assert "http.response.bytes" not in hit.attributes
+
+    def test_coalesced_callers_each_record_sharing_on_their_span(self, monkeypatch, ring):
+        async def handler(request: httpx.Request) -> httpx.Response:
+            await asyncio.sleep(0.01)
+            return httpx.Response(200, json=[])
+
+        svc = make_service(monkeypatch, handler, enable_single_flight=True)
+
+        async def main():
+            await asyncio.gather(*[svc._make_request("GET", "/rest/v1/items") for _ in range(3)])
+            await svc.aclose()
+
+        asyncio.run(main())
+        spans = ring.spans()
+        assert len(spans) == 3
+        shared = [span for span in spans if span.attributes.get("single_flight.shared")]
+        (leader,) = [span for span in spans if span not in shared]
+        assert len(shared) == 2 and "http.response.bytes" in leader.attributes
+
+    def test_query_cache_outcome_is_recorded_on_the_fetch_span(self, ring):
+        db = SupabaseDatabaseService(FakeSupabaseClient(echo_table))
+        db.query_cache = QueryCache(table_ttls={"countries": 60})
+
+        async def main():
+            await db.fetch_data("countries", cache=True)
+            await db.fetch_data("countries", cache=True)
+
+        asyncio.run(main())
+        missed, hit = [span for span in ring.spans() if span.name == "database.fetch_data"]
+        assert missed.attributes["cache.hit"] is False
+        assert hit.attributes["cache.hit"] is True
+
+    def test_json_lines_exporter(self, tmp_path):
+        path = tmp_path / "spans.jsonl"
+        exporter = tracer.add_exporter(JsonLinesExporter(path))
+        try:
+            with tracer.span("tests.manual", table="items"):
+                pass
+        finally:
+            tracer.remove_exporter(exporter)
+        (line,) = path.read_text().splitlines()
+        record = json.loads(line)
+        assert record["name"] == "tests.manual"
+        assert record["attributes"] == {"table": "items"}
@@ -0,0 +1,104 @@
+import asyncio
+import json
+
+from app.core.third_party_integrations.supabase_home.sdk.bulk import (
+    BulkWriteResult,
+    ChunkResult,
+)
+from app.core.third_party_integrations.supabase_home.sdk.write_buffer import (
+    WriteBehindBuffer,
+)
+
+
+class FakeCodec:
+    def encode(self, value):
+        return json.dumps(value).encode()
+
+
+class FakeDatabase:
+    def __init__(self, delay=0.0, fail_tables=()):
+        self.codec = FakeCodec()
+        self.batches = []
+        self.delay = delay
+        self.fail_tables = set(fail_tables)
+
+    async def bulk_insert(self, table, records, **options):
+        await asyncio.sleep(self.delay)
+        self.batches.append((table, list(records)))
+        chunk = ChunkResult(0, list(records))
+        if table in self.fail_tables:
+            chunk.error = RuntimeError("insert rejected")
+        return BulkWriteResult([chunk])
+
+
+class TestWriteBehindBuffer:
+    """Unit tests for the write-behind insert buffer"""
+
+    def test_flushes_on_row_threshold(self):
+        db = FakeDatabase()
+
+        async def main():
+            buffer = WriteBehindBuffer(db, max_rows=3, flush_interval=60)
+            for i in range(4):
+                await buffer.add("events", {"id": i})
+            await asyncio.sleep(0.01)
+            batches = list(db.batches)
+            for i in range(4, 7):
+                await buffer.add("events", {"id": i})
+            await buffer.aclose()
+            return batches
+
+        early = asyncio.run(main())
+        assert [len(rows) for _, rows in early] == [4]  # the 4th row joined the pending flush
+        assert [row["id"] for _, rows in db.batches for row in rows] == list(range(7))
+
+    def test_flushes_on_interval_and_byte_threshold(self):
+        db = FakeDatabase()
+
+        async def main():
+            buffer = WriteBehindBuffer(db, max_rows=100, max_bytes=40, flush_interval=0.02)
+            await buffer.add("events", {"payload": "x" * 50})
+            await buffer.add("audit", {"id": 1})
+            await asyncio.sleep(0.01)
+            by_bytes = [table for table, _ in db.batches]
+            await asyncio.sleep(0.05)
+            by_time = [table for table, _ in db.batches]
+            await buffer.aclose()
+            return by_bytes, by_time
+
+        by_bytes, by_time = asyncio.run(main())
+        assert by_bytes == ["events"]
+        assert sorted(by_time) == ["audit", "events"]
+
+    def test_backpressure_limits_pending_rows(self):
+        db = FakeDatabase(delay=0.01)
+        peak = []
+
+        async def main():
+            buffer = WriteBehindBuffer(db, max_rows=2, max_pending_rows=4, flush_interval=60)
+            for i in range(20):
+                await buffer.add("events", {"id": i})
+                peak.append(buffer.stats()["pending"]["events"])
+            await buffer.aclose()
+            return buffer.stats()
+
+        stats = asyncio.run(main())
+        assert max(peak) <= 4
+        assert stats["flushed_rows"] == 20 and stats["pending"] == {"events": 0}
+
+    def test_failed_batches_reach_hook(self):
+        failures = []
+
+        async def on_failure(table, rows, error):
+            failures.append((table, len(rows), str(error)))
+
+        async def main():
+            async with WriteBehindBuffer(
+                FakeDatabase(fail_tables={"events"}), on_failure=on_failure
+            ) as buffer:
+                await buffer.add_many("events", [{"id": 1}, {"id": 2}])
+            return buffer.stats()
+
+        stats = asyncio.run(main())
+        assert failures == [("events", 2, "insert rejected")]
+        assert stats["failed_rows"] == 2
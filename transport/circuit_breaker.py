@@ -0,0 +1,217 @@
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from enum import Enum
+from typing import Any, TypeVar
+
+import httpx
+
+from app.core.third_party_integrations.supabase_home.exceptions.index import (
+    SupabaseCircuitOpenError,
+)
+
+logger = logging.getLogger("apps.supabase_home")
+
+T = TypeVar("T")
+
+# * Endpoint prefixes mapped to the Supabase service area they belong to
+SERVICE_AREAS = {
+    "/rest/v1": "rest",
+    "/storage/v1": "storage",
+    "/auth/v1": "auth",
+    "/functions/v1": "functions",
+    "/realtime/v1": "realtime",
+}
+
+
+def service_area(endpoint: str) -> str:
+    """
+    Map a Supabase endpoint path to its service area (rest, storage, auth, ...).
+    """
+    for prefix, area in SERVICE_AREAS.items():
+        if endpoint.startswith(prefix):
+            return area
+    return "other"
+
+
+class CircuitState(str, Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker for a single Supabase service area.
+
+    Opens after `failure_threshold` consecutive failures and rejects calls until
+    `recovery_timeout` has passed. It then lets up to `half_open_max_calls`
+    probes through: a successful probe closes the circuit, a failed one reopens it.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        half_open_max_calls: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self._clock = clock
+        self._state = CircuitState.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probes_in_flight = 0
+        self.total_rejected = 0
+        self.total_opened = 0
+
+    @property
+    def state(self) -> CircuitState:
+        if (
+            self._state is CircuitState.OPEN
+            and self._clock() - self._opened_at >= self.recovery_timeout
+        ):
+            self._transition(CircuitState.HALF_OPEN)
+        return self._state
+
+    def retry_in(self) -> float:
+        if self._state is not CircuitState.OPEN:
+            return 0.0
+        return max(0.0, self.recovery_timeout - (self._clock() - self._opened_at))
+
+    def allow_request(self) -> bool:
+        state = self.state
+        if state is CircuitState.CLOSED:
+            return True
+        if (
+            state is CircuitState.HALF_OPEN
+            and self._probes_in_flight < self.half_open_max_calls
+        ):
+            self._probes_in_flight += 1
+            return True
+        self.total_rejected += 1
+        return False
+
+    def record_success(self) -> None:
+        self._failures = 0
+        if self._state is CircuitState.HALF_OPEN:
+            self._probes_in_flight = max(0, self._probes_in_flight - 1)
+            self._transition(CircuitState.CLOSED)
+
+    def record_failure(self) -> None:
+        self._failures += 1
+        if self._state is CircuitState.HALF_OPEN:
+            self._probes_in_flight = max(0, self._probes_in_flight - 1)
+            self._open()
+        elif (
+            self._state is CircuitState.CLOSED
+            and self._failures >= self.failure_threshold
+        ):
+            self._open()
+
+    def release(self) -> None:
+        """Give back a half-open probe slot for a call that ended without a verdict."""
+        if self._state is CircuitState.HALF_OPEN:
+            self._probes_in_flight = max(0, self._probes_in_flight - 1)
+
+    async def call(
+        self,
+        func: Callable[[], Awaitable[T]],
+        is_failure: Callable[[T], bool] | None = None,
+    ) -> T:
+        """
+        Run `func` through the breaker.
+
+        Args:
+            func: Zero-argument coroutine factory performing the call
+            is_failure: Classifies a returned value as a failure (e.g. HTTP 5xx)
+
+        Raises:
+            SupabaseCircuitOpenError: If the circuit rejects the call
+        """
+        if not self.allow_request():
+            raise SupabaseCircuitOpenError(self.name, self.retry_in())
+        try:
+            result = await func()
+        except httpx.TransportError:
+            self.record_failure()
+            raise
+        except BaseException:
+            self.release()
+            raise
+        if is_failure is not None and is_failure(result):
+            self.record_failure()
+        else:
+            self.record_success()
+        return result
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "state": self.state.value,
+            "consecutive_failures": self._failures,
+            "retry_in": round(self.retry_in(), 3),
+            "total_opened": self.total_opened,
+            "total_rejected": self.total_rejected,
+        }
+
+    def _open(self) -> None:
+        self._opened_at = self._clock()
+        self.total_opened += 1
+        self._transition(CircuitState.OPEN)
+
+    def _transition(self, state: CircuitState) -> None:
+        if state is self._state:
+            return
+        logger.warning(
+            "Supabase %s circuit %s -> %s", self.name, self._state.value, state.value
+        )
+        self._state = state
+        if state is not CircuitState.HALF_OPEN:
+            self._probes_in_flight = 0
+        if state is CircuitState.CLOSED:
+            self._failures = 0
+
+
+class CircuitBreakerRegistry:
+    """
+    Lazily creates one CircuitBreaker per service area with shared settings.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        half_open_max_calls: int = 1,
+    ):
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self._breakers: dict[str, CircuitBreaker] = {}
+
+    @classmethod
+    def from_config(cls, config: Any) -> "CircuitBreakerRegistry":
+        return cls(
+            failure_threshold=config.circuit_breaker_failure_threshold,
+            recovery_timeout=config.circuit_breaker_recovery_timeout,
+            half_open_max_calls=config.circuit_breaker_half_open_max_calls,
+        )
+
+    def get(self, area: str) -> CircuitBreaker:
+        breaker = self._breakers.get(area)
+        if breaker is None:
+            breaker = CircuitBreaker(
+                area,
+                failure_threshold=self.failure_threshold,
+                recovery_timeout=self.recovery_timeout,
+                half_open_max_calls=self.half_open_max_calls,
+            )
+            self._breakers[area] = breaker
+        return breaker
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        """Current state of every breaker, keyed by service area (for health checks/alerts)."""
+        return {area: breaker.snapshot() for area, breaker in self._breakers.items()}
@@ -0,0 +1,148 @@
+import dataclasses
+import datetime
+import decimal
+import json
+import logging
+import uuid
+from typing import Any
+
+from pydantic import PydanticSchemaGenerationError, TypeAdapter
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - optional dependency
+    msgspec = None
+
+logger = logging.getLogger("apps.supabase_home")
+
+
+def _default(value: Any) -> Any:
+    """Fallback encoder for types the stdlib json module does not know."""
+    if isinstance(value, (datetime.datetime, datetime.date, datetime.time)):
+        return value.isoformat()
+    if isinstance(value, (uuid.UUID, decimal.Decimal)):
+        return str(value)
+    if isinstance(value, (set, frozenset, tuple)):
+        return list(value)
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return dataclasses.asdict(value)
+    if msgspec is not None and isinstance(value, msgspec.Struct):
+        return msgspec.structs.asdict(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class JSONCodec:
+    """
+    Encodes request bodies and decodes Supabase responses.
+
+    Subclasses provide a faster backend; `decode_as` decodes straight into a
+    typed value (msgspec Struct, dataclass, pydantic model, `list[...]`, ...).
+    """
+
+    name = "json"
+
+    def __init__(self):
+        self._converters: dict[Any, Any] = {}
+
+    def encode(self, value: Any) -> bytes:
+        return json.dumps(value, default=_default, separators=(",", ":")).encode()
+
+    def decode(self, data: bytes | str) -> Any:
+        return json.loads(data)
+
+    def decode_as(self, data: bytes | str, type_: Any) -> Any:
+        return self._converter(type_)(self.decode(data))
+
+    def _converter(self, type_: Any) -> Any:
+        converter = self._converters.get(type_)
+        if converter is None:
+            try:
+                converter = TypeAdapter(type_).validate_python
+            except PydanticSchemaGenerationError:
+                # ? msgspec Structs are not pydantic-compatible; convert them with msgspec
+                if msgspec is None:
+                    raise
+                converter = lambda value: msgspec.convert(value, type_)  # noqa: E731
+            self._converters[type_] = converter
+        return converter
+
+
+class OrjsonCodec(JSONCodec):
+    name = "orjson"
+
+    def encode(self, value: Any) -> bytes:
+        return orjson.dumps(
+            value, default=_default, option=orjson.OPT_NON_STR_KEYS
+        )
+
+    def decode(self, data: bytes | str) -> Any:
+        return orjson.loads(data)
+
+
+class MsgspecCodec(JSONCodec):
+    name = "msgspec"
+
+    def __init__(self):
+        super().__init__()
+        self._encoder = msgspec.json.Encoder(enc_hook=_default)
+        self._decoder = msgspec.json.Decoder()
+        self._typed_decoders: dict[Any, Any] = {}
+
+    def encode(self, value: Any) -> bytes:
+        return self._encoder.encode(value)
+
+    def decode(self, data: bytes | str) -> Any:
+        return self._decoder.decode(data)
+
+    def decode_as(self, data: bytes | str, type_: Any) -> Any:
+        decoder = self._typed_decoders.get(type_)
+        if decoder is None:
+            try:
+                decoder = msgspec.json.Decoder(type_)
+            except TypeError:
+                # ? Types msgspec cannot handle (e.g. pydantic models) go through pydantic
+                decoder = False
+            self._typed_decoders[type_] = decoder
+        if decoder is False:
+            return super().decode_as(data, type_)
+        return decoder.decode(data)
+
+
+_BACKENDS = {
+    "json": (JSONCodec, True),
+    "orjson": (OrjsonCodec, orjson is not None),
+    "msgspec": (MsgspecCodec, msgspec is not None),
+}
+
+
+def available_codecs() -> list[str]:
+    return [name for name, (_, available) in _BACKENDS.items() if available]
+
+
+def get_codec(name: str = "auto") -> JSONCodec:
+    """
+    Build a codec by backend name.
+
+    Args:
+        name: "auto" (msgspec, then orjson, then stdlib), "msgspec", "orjson" or "json"
+
+    Returns:
+        A JSONCodec; falls back to the stdlib codec if the backend is not installed
+    """
+    if name == "auto":
+        for candidate in ("msgspec", "orjson"):
+            if _BACKENDS[candidate][1]:
+                return _BACKENDS[candidate][0]()
+        return JSONCodec()
+    if name not in _BACKENDS:
+        raise ValueError(f"Unknown JSON codec '{name}'; expected one of {list(_BACKENDS)}")
+    codec_cls, available = _BACKENDS[name]
+    if not available:
+        logger.warning("JSON codec '%s' is not installed; using stdlib json", name)
+        return JSONCodec()
+    return codec_cls()
@@ -0,0 +1,186 @@
+import asyncio
+import contextvars
+import inspect
+import math
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+
+import httpx
+
+from app.core.third_party_integrations.supabase_home.exceptions.index import (
+    SupabaseDeadlineExceededError,
+)
+
+# * Absolute monotonic deadline for the current request, or None when unbounded
+_deadline: contextvars.ContextVar[float | None] = contextvars.ContextVar(
+    "supabase_deadline", default=None
+)
+
+
+class TimeoutBudget:
+    """
+    Per-operation timeout limits, clipped to whatever the deadline leaves.
+
+    Args:
+        total: Upper bound for the whole call (seconds)
+        connect: Limit for establishing a connection
+        read: Limit for waiting on response bytes
+        write: Limit for sending request bytes
+        pool: Limit for waiting on a free pooled connection
+        min_remaining: Calls starting with less budget than this fail fast
+    """
+
+    def __init__(
+        self,
+        total: float = 30.0,
+        connect: float = 5.0,
+        read: float | None = None,
+        write: float | None = None,
+        pool: float = 5.0,
+        min_remaining: float = 0.05,
+    ):
+        self.total = total
+        self.connect = connect
+        self.read = read
+        self.write = write
+        self.pool = pool
+        self.min_remaining = min_remaining
+
+    @classmethod
+    def from_config(cls, config: Any) -> "TimeoutBudget":
+        return cls(
+            total=config.timeout,
+            connect=config.connect_timeout,
+            read=config.read_timeout,
+            pool=config.pool_timeout,
+            min_remaining=config.deadline_min_remaining,
+        )
+
+    def default_timeout(self) -> httpx.Timeout:
+        """Timeouts for a call made outside any deadline."""
+        return httpx.Timeout(
+            connect=self.connect,
+            read=self.total if self.read is None else self.read,
+            write=self.total if self.write is None else self.write,
+            pool=self.pool,
+        )
+
+    def httpx_timeout(self, operation: str, total: float | None = None) -> httpx.Timeout:
+        """
+        Build an httpx.Timeout for one upstream call, clipped to the remaining deadline.
+
+        Raises:
+            SupabaseDeadlineExceededError: If the deadline leaves less than `min_remaining`
+        """
+        budget = check_deadline(operation, total or self.total, self.min_remaining)
+
+        def clip(limit: float | None) -> float:
+            return budget if limit is None else min(limit, budget)
+
+        return httpx.Timeout(
+            connect=clip(self.connect),
+            read=clip(self.read),
+            write=clip(self.write),
+            pool=clip(self.pool),
+        )
+
+
+def has_deadline() -> bool:
+    return _deadline.get() is not None
+
+
+def remaining() -> float | None:
+    """Seconds left before the current deadline, or None when no deadline is set."""
+    deadline = _deadline.get()
+    if deadline is None:
+        return None
+    return deadline - time.monotonic()
+
+
+def deadline_expired(margin: float = 0.0) -> bool:
+    """Whether a deadline is set and has at most `margin` seconds left."""
+    left = remaining()
+    return left is not None and left <= margin
+
+
+def check_deadline(
+    operation: str, default: float | None = None, min_remaining: float = 0.0
+) -> float | None:
+    """
+    Return the usable budget for an operation: the smaller of `default` and the
+    time left on the deadline.
+
+    Raises:
+        SupabaseDeadlineExceededError: If the deadline is (nearly) spent
+    """
+    left = remaining()
+    if left is None:
+        return default
+    if left <= min_remaining:
+        raise SupabaseDeadlineExceededError(operation, max(0.0, left))
+    return left if default is None else min(default, left)
+
+
+@contextmanager
+def deadline(seconds: float) -> Iterator[float]:
+    """
+    Bound every Supabase call in this context to finish within `seconds`.
+
+    Nested deadlines can only shorten the budget, never extend it.
+    """
+    absolute = time.monotonic() + seconds
+    outer = _deadline.get()
+    if outer is not None:
+        absolute = min(absolute, outer)
+    token = _deadline.set(absolute)
+    try:
+        yield absolute
+    finally:
+        _deadline.reset(token)
+
+
+async def with_deadline(operation: str, awaitable: Any) -> Any:
+    """
+    Await `awaitable`, cancelling it when the current deadline passes.
+    """
+    try:
+        budget = check_deadline(operation)
+    except SupabaseDeadlineExceededError:
+        if inspect.iscoroutine(awaitable):
+            awaitable.close()
+        raise
+    if budget is None:
+        return await awaitable
+    try:
+        return await asyncio.wait_for(awaitable, budget)
+    except asyncio.TimeoutError:
+        raise SupabaseDeadlineExceededError(operation, 0.0) from None
+
+
+def deadline_middleware(seconds: float, min_seconds: float = 1.0):
+    """
+    FastAPI/Starlette HTTP middleware giving each request a Supabase time budget.
+
+    A client-supplied `X-Request-Timeout` header (seconds) can shorten it, but
+    never below `min_seconds` nor above `seconds`.
+
+    Usage:
+        app.middleware("http")(deadline_middleware(10.0))
+    """
+
+    async def middleware(request: Any, call_next: Any) -> Any:
+        budget = seconds
+        requested = request.headers.get("x-request-timeout")
+        if requested:
+            try:
+                value = float(requested)
+            except ValueError:
+                value = math.nan
+            if math.isfinite(value):
+                budget = min(seconds, max(min(min_seconds, seconds), value))
+        with deadline(budget):
+            return await call_next(request)
+
+    return middleware
@@ -0,0 +1,63 @@
+import asyncio
+import inspect
+from collections.abc import Awaitable, Iterable, Mapping
+from typing import TypeVar
+
+T = TypeVar("T")
+K = TypeVar("K")
+
+
+async def gather_bounded(
+    awaitables: Iterable[Awaitable[T]],
+    max_concurrency: int = 8,
+    return_exceptions: bool = False,
+) -> list[T]:
+    """
+    Await `awaitables` with at most `max_concurrency` running at once.
+
+    Results keep the input order. Without `return_exceptions` the first failure
+    cancels the calls that are still pending and is re-raised.
+
+    Args:
+        awaitables: Coroutines (not yet started) or other awaitables
+        max_concurrency: Upper bound on calls in flight
+        return_exceptions: Return exceptions in place of results instead of raising
+    """
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be at least 1")
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def run(awaitable: Awaitable[T]) -> T:
+        async with semaphore:
+            return await awaitable
+
+    awaitables = list(awaitables)
+    tasks = [asyncio.ensure_future(run(awaitable)) for awaitable in awaitables]
+    try:
+        return await asyncio.gather(*tasks, return_exceptions=return_exceptions)
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        # * Close coroutines that never got a slot so they do not warn "never awaited"
+        for awaitable in awaitables:
+            if (
+                inspect.iscoroutine(awaitable)
+                and inspect.getcoroutinestate(awaitable) == inspect.CORO_CREATED
+            ):
+                awaitable.close()
+
+
+async def gather_mapping(
+    awaitables: Mapping[K, Awaitable[T]],
+    max_concurrency: int = 8,
+    return_exceptions: bool = False,
+) -> dict[K, T]:
+    """
+    `gather_bounded` for named calls: returns a dict with the same keys.
+    """
+    results = await gather_bounded(
+        awaitables.values(), max_concurrency, return_exceptions=return_exceptions
+    )
+    return dict(zip(awaitables.keys(), results))
@@ -0,0 +1,183 @@
+import asyncio
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any, TypeVar
+
+from app.core.third_party_integrations.supabase_home.config import supabase_config
+from app.core.third_party_integrations.supabase_home.transport.metrics import metrics
+from app.core.third_party_integrations.supabase_home.transport.tracing import (
+    set_span_attribute,
+)
+
+T = TypeVar("T")
+
+HEDGES_SENT = metrics.counter(
+    "supabase_hedged_requests_total",
+    "Duplicate (hedge) requests sent for slow idempotent reads",
+    ("service",),
+)
+HEDGE_WINS = metrics.counter(
+    "supabase_hedge_wins_total",
+    "Hedge requests that finished before the original",
+    ("service",),
+)
+
+
+class LatencyTracker:
+    """
+    Sliding window of recent latencies with a cached percentile.
+    """
+
+    def __init__(self, window: int = 512, refresh_every: int = 32):
+        self._samples: deque[float] = deque(maxlen=window)
+        self._refresh_every = refresh_every
+        self._since_refresh = 0
+        self._cached: dict[float, float] = {}
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def record(self, latency: float) -> None:
+        self._samples.append(latency)
+        self._since_refresh += 1
+        if self._since_refresh >= self._refresh_every:
+            self._cached.clear()
+            self._since_refresh = 0
+
+    def percentile(self, q: float) -> float | None:
+        if not self._samples:
+            return None
+        value = self._cached.get(q)
+        if value is None:
+            ordered = sorted(self._samples)
+            value = ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+            self._cached[q] = value
+        return value
+
+
+class Hedger:
+    """
+    Sends a duplicate of a slow idempotent read and takes whichever finishes first.
+
+    The hedge fires after the observed `percentile` latency for the same key
+    (clamped to [min_delay, max_delay]; `max_delay` until `min_samples` are seen).
+    A token bucket caps hedges at `max_hedge_ratio` of all hedgeable requests.
+    """
+
+    def __init__(
+        self,
+        percentile: float = 0.95,
+        min_delay: float = 0.01,
+        max_delay: float = 2.0,
+        max_hedge_ratio: float = 0.1,
+        min_samples: int = 20,
+        burst: float = 10.0,
+    ):
+        self.percentile = percentile
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.max_hedge_ratio = max_hedge_ratio
+        self.min_samples = min_samples
+        self.burst = burst
+        self._tokens = burst
+        self._trackers: dict[Hashable, LatencyTracker] = {}
+        self.requests = 0
+        self.hedges_sent = 0
+        self.hedge_wins = 0
+        self.budget_denied = 0
+
+    @classmethod
+    def from_config(cls, config: Any) -> "Hedger":
+        return cls(
+            percentile=config.hedge_percentile,
+            min_delay=config.hedge_min_delay,
+            max_delay=config.hedge_max_delay,
+            max_hedge_ratio=config.hedge_max_ratio,
+        )
+
+    def delay_for(self, key: Hashable) -> float:
+        tracker = self._trackers.get(key)
+        if tracker is None or len(tracker) < self.min_samples:
+            return self.max_delay
+        observed = tracker.percentile(self.percentile)
+        return min(self.max_delay, max(self.min_delay, observed))
+
+    def _record(self, key: Hashable, latency: float) -> None:
+        tracker = self._trackers.get(key)
+        if tracker is None:
+            tracker = self._trackers[key] = LatencyTracker()
+        tracker.record(latency)
+
+    def _take_token(self) -> bool:
+        if self._tokens >= 1.0:
+            self._tokens -= 1.0
+            return True
+        self.budget_denied += 1
+        return False
+
+    async def run(
+        self,
+        key: Hashable,
+        func: Callable[[], Awaitable[T]],
+        service: str = "other",
+    ) -> T:
+        """
+        Run `func`, hedging it with a second call if it is slower than usual.
+
+        Args:
+            key: Latency bucket, e.g. ("rest", "/rest/v1/items")
+            func: Zero-argument coroutine factory; must be safe to call twice
+            service: Label for the hedge metrics
+        """
+        self.requests += 1
+        self._tokens = min(self.burst, self._tokens + self.max_hedge_ratio)
+        started = time.perf_counter()
+        primary = asyncio.ensure_future(func())
+        hedge: asyncio.Future | None = None
+        try:
+            done, _ = await asyncio.wait({primary}, timeout=self.delay_for(key))
+            if done or not self._take_token():
+                result = await primary
+                self._record(key, time.perf_counter() - started)
+                return result
+
+            self.hedges_sent += 1
+            HEDGES_SENT.inc(service)
+            set_span_attribute("hedge.sent", True)
+            hedge = asyncio.ensure_future(func())
+            pending = {primary, hedge}
+            first_error: BaseException | None = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    # ? A task cancelled from outside counts as a failed attempt
+                    if task.cancelled():
+                        continue
+                    if task.exception() is not None:
+                        first_error = first_error or task.exception()
+                        continue
+                    if task is hedge:
+                        self.hedge_wins += 1
+                        HEDGE_WINS.inc(service)
+                        set_span_attribute("hedge.won", True)
+                    self._record(key, time.perf_counter() - started)
+                    return task.result()
+            raise first_error or asyncio.CancelledError()
+        finally:
+            # * Whatever the outcome, no attempt outlives the call
+            for task in (primary, hedge):
+                if task is not None and not task.done():
+                    task.cancel()
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "hedges_sent": self.hedges_sent,
+            "hedge_wins": self.hedge_wins,
+            "budget_denied": self.budget_denied,
+            "hedge_rate": self.hedges_sent / self.requests if self.requests else 0.0,
+        }
+
+
+hedger = Hedger.from_config(supabase_config)
@@ -0,0 +1,198 @@
+import re
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Mapping
+from typing import Any
+from urllib.parse import urlsplit
+
+import httpx
+
+from app.core.third_party_integrations.supabase_home.transport.metrics import metrics
+
+_MAX_AGE = re.compile(r"max-age=(\d+)")
+
+CACHE_EVENTS = metrics.counter(
+    "supabase_http_cache_events_total",
+    "HTTP response cache lookups by outcome (hit, miss, revalidated)",
+    ("outcome",),
+)
+
+
+def _resource(url: str) -> str:
+    """`url` without query string, fragment or trailing slash."""
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}{parts.path}".rstrip("/")
+
+
+def _within(resource: str, ancestor: str) -> bool:
+    return resource == ancestor or resource.startswith(ancestor + "/")
+
+
+class CacheEntry:
+    __slots__ = ("value", "etag", "last_modified", "expires_at", "size")
+
+    def __init__(
+        self,
+        value: Any,
+        etag: str | None,
+        last_modified: str | None,
+        expires_at: float,
+        size: int,
+    ):
+        self.value = value
+        self.etag = etag
+        self.last_modified = last_modified
+        self.expires_at = expires_at
+        self.size = size
+
+
+class HTTPCache:
+    """
+    Size-bounded LRU of decoded GET responses with HTTP revalidation.
+
+    Entries are fresh for the route's TTL (longest matching prefix in
+    `route_ttls`, else the response's Cache-Control max-age, else `default_ttl`).
+    Stale entries that carry an ETag or Last-Modified are revalidated with
+    If-None-Match / If-Modified-Since, so a 304 skips both the body transfer
+    and JSON decoding. Cached values are shared and must be treated as read-only.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = 64 * 1024 * 1024,
+        default_ttl: float = 0.0,
+        route_ttls: Mapping[str, float] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        # * Longest prefix first so specific routes win over general ones
+        self.route_ttls = dict(
+            sorted((route_ttls or {}).items(), key=lambda item: -len(item[0]))
+        )
+        self._clock = clock
+        self._entries: OrderedDict[Hashable, CacheEntry] = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.revalidated = 0
+
+    @classmethod
+    def from_config(cls, config: Any) -> "HTTPCache":
+        return cls(
+            max_bytes=config.http_cache_max_bytes,
+            default_ttl=config.http_cache_default_ttl,
+            route_ttls=config.http_cache_route_ttls,
+        )
+
+    @property
+    def size_bytes(self) -> int:
+        return self._bytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def ttl_for(self, endpoint: str, response: httpx.Response | None = None) -> float:
+        for prefix, ttl in self.route_ttls.items():
+            if endpoint.startswith(prefix):
+                return ttl
+        if response is not None:
+            match = _MAX_AGE.search(response.headers.get("Cache-Control", ""))
+            if match:
+                return float(match.group(1))
+        return self.default_ttl
+
+    def lookup(self, key: Hashable) -> tuple[CacheEntry | None, bool]:
+        """
+        Returns:
+            (entry, fresh): the cached entry, if any, and whether it can be served as-is
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            CACHE_EVENTS.inc("miss")
+            return None, False
+        self._entries.move_to_end(key)
+        if self._clock() < entry.expires_at:
+            self.hits += 1
+            CACHE_EVENTS.inc("hit")
+            return entry, True
+        return entry, False
+
+    @staticmethod
+    def conditional_headers(entry: CacheEntry) -> dict[str, str]:
+        headers = {}
+        if entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+        return headers
+
+    def revalidate(self, key: Hashable, entry: CacheEntry, response: httpx.Response, endpoint: str) -> Any:
+        """Refresh an entry after a 304 Not Modified and return its cached value."""
+        self.revalidated += 1
+        CACHE_EVENTS.inc("revalidated")
+        entry.expires_at = self._clock() + self.ttl_for(endpoint, response)
+        entry.etag = response.headers.get("ETag", entry.etag)
+        return entry.value
+
+    def store(self, key: Hashable, response: httpx.Response, value: Any, endpoint: str) -> None:
+        if response.status_code != 200:
+            return
+        cache_control = response.headers.get("Cache-Control", "")
+        if "no-store" in cache_control:
+            return
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        ttl = 0.0 if "no-cache" in cache_control else self.ttl_for(endpoint, response)
+        if ttl <= 0 and not etag and not last_modified:
+            return
+        size = len(response.content) + 256
+        if size > self.max_bytes:
+            return
+        self.invalidate(key)
+        self._entries[key] = CacheEntry(
+            value, etag, last_modified, self._clock() + ttl, size
+        )
+        self._bytes += size
+        while self._bytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._bytes -= evicted.size
+
+    def invalidate(self, key: Hashable) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry.size
+
+    def invalidate_prefix(self, url: str) -> int:
+        """
+        Drop every entry for the resource at `url` or below it (keys are request_key tuples).
+
+        Paths are compared without their query string and on `/` boundaries, so a
+        write to `/rest/v1/items?id=eq.1` drops every cached read of `items` but
+        leaves `/rest/v1/items_archive` alone.
+        """
+        resource = _resource(url)
+        doomed = [
+            key
+            for key in self._entries
+            if isinstance(key, tuple)
+            and len(key) > 1
+            and _within(_resource(str(key[1])), resource)
+        ]
+        for key in doomed:
+            self.invalidate(key)
+        return len(doomed)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._bytes = 0
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "revalidated": self.revalidated,
+        }
@@ -0,0 +1,256 @@
+import functools
+import inspect
+import time
+from collections.abc import Callable
+from typing import Any, TypeVar
+
+from app.core.third_party_integrations.supabase_home.transport.deadline import (
+    check_deadline,
+    has_deadline,
+    with_deadline,
+)
+from app.core.third_party_integrations.supabase_home.transport.metrics import (
+    REQUEST_ERRORS,
+    REQUEST_LATENCY,
+    REQUESTS_IN_FLIGHT,
+    error_class,
+)
+from app.core.third_party_integrations.supabase_home.transport.tracing import (
+    activate,
+    deactivate,
+    tracer,
+)
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+# * Argument names copied onto spans, keyed to the attribute they become
+SPAN_ARGUMENTS = {
+    "table": "db.table",
+    "function_name": "function.name",
+    "bucket_id": "storage.bucket",
+    "path": "storage.path",
+    "channel_name": "realtime.channel",
+}
+
+
+class Operation:
+    """
+    Records latency, in-flight count, errors and (when tracing is on) a span
+    for one operation call.
+    """
+
+    __slots__ = ("labels", "started", "span")
+
+    def __init__(self, operation: str, attributes: dict[str, Any] | None = None):
+        self.labels = (operation.split(".", 1)[0], operation)
+        self.started = time.perf_counter()
+        self.span = tracer.start_span(operation, attributes) if tracer.enabled else None
+        REQUESTS_IN_FLIGHT.inc(*self.labels)
+
+    def finish(self, error: BaseException | None = None, result: Any = None) -> None:
+        REQUESTS_IN_FLIGHT.dec(*self.labels)
+        REQUEST_LATENCY.observe(*self.labels, value=time.perf_counter() - self.started)
+        if error is not None:
+            REQUEST_ERRORS.inc(*self.labels, error_class(error))
+        span = self.span
+        if span is not None:
+            if error is not None:
+                span.record_error(error)
+            else:
+                rows = _row_count(result)
+                if rows is not None:
+                    span.attributes.setdefault("result.rows", rows)
+            tracer.finish(span)
+
+
+def _row_count(result: Any) -> int | None:
+    data = getattr(result, "data", result)
+    return len(data) if isinstance(data, list) else None
+
+
+async def _await_operation(operation: Operation, awaitable: Any) -> Any:
+    token = activate(operation.span) if operation.span is not None else None
+    try:
+        result = await awaitable
+    except BaseException as e:
+        operation.finish(e)
+        raise
+    finally:
+        if token is not None:
+            deactivate(token)
+    operation.finish(result=result)
+    return result
+
+
+async def track(
+    operation: str, awaitable: Any, attributes: dict[str, Any] | None = None
+) -> Any:
+    """Await `awaitable`, recording it as one call of `operation`."""
+    return await _await_operation(Operation(operation, attributes), awaitable)
+
+
+def _span_argument_extractor(func: Callable) -> Callable[[tuple, dict], dict[str, Any]]:
+    """
+    Precompute where span-worthy arguments sit so calls avoid signature binding.
+    """
+    try:
+        parameters = list(inspect.signature(func).parameters)
+    except (TypeError, ValueError):
+        parameters = []
+    positions = [
+        (index, name, SPAN_ARGUMENTS[name])
+        for index, name in enumerate(parameters)
+        if name in SPAN_ARGUMENTS
+    ]
+
+    def extract(args: tuple, kwargs: dict) -> dict[str, Any]:
+        attributes = {}
+        for index, name, attribute in positions:
+            if name in kwargs:
+                attributes[attribute] = kwargs[name]
+            elif index < len(args):
+                attributes[attribute] = args[index]
+        return attributes
+
+    return extract
+
+
+def instrument(operation: str) -> Callable[[F], F]:
+    """
+    Record metrics and a span for every call of the decorated function.
+
+    Works for coroutine functions and for sync functions that return an
+    awaitable (the async supabase-py client), timing until the await completes.
+    Sync and async generator functions are timed until the iteration ends or
+    the consumer stops early.
+    Arguments such as `table`, `bucket_id` and `function_name` become span
+    attributes, and list results record their row count. Inside a `deadline()`
+    the call fails fast once the budget is spent and is cancelled when it runs out.
+
+    Args:
+        operation: Dotted name such as "database.fetch_data"; the first segment
+            becomes the `service` label
+    """
+
+    def decorator(func: F) -> F:
+        extract = _span_argument_extractor(func)
+
+        def start(args: tuple, kwargs: dict) -> Operation:
+            return Operation(operation, extract(args, kwargs) if tracer.enabled else None)
+
+        if inspect.isasyncgenfunction(func):
+
+            @functools.wraps(func)
+            async def async_gen_wrapper(*args: Any, **kwargs: Any) -> Any:
+                # ? The span covers the whole iteration, not just creating the generator
+                op = start(args, kwargs)
+                try:
+                    if has_deadline():
+                        check_deadline(operation)
+                    generator = func(*args, **kwargs)
+                    try:
+                        while True:
+                            token = activate(op.span) if op.span is not None else None
+                            try:
+                                item = await generator.__anext__()
+                            except StopAsyncIteration:
+                                break
+                            finally:
+                                if token is not None:
+                                    deactivate(token)
+                            yield item
+                    finally:
+                        await generator.aclose()
+                except GeneratorExit:
+                    # * The consumer stopped early; that is not a failure
+                    op.finish()
+                    raise
+                except BaseException as e:
+                    op.finish(e)
+                    raise
+                op.finish()
+
+            return async_gen_wrapper  # type: ignore[return-value]
+
+        if inspect.isgeneratorfunction(func):
+
+            @functools.wraps(func)
+            def gen_wrapper(*args: Any, **kwargs: Any) -> Any:
+                op = start(args, kwargs)
+                try:
+                    if has_deadline():
+                        check_deadline(operation)
+                    generator = func(*args, **kwargs)
+                    try:
+                        while True:
+                            token = activate(op.span) if op.span is not None else None
+                            try:
+                                item = next(generator)
+                            except StopIteration:
+                                break
+                            finally:
+                                if token is not None:
+                                    deactivate(token)
+                            yield item
+                    finally:
+                        generator.close()
+                except GeneratorExit:
+                    op.finish()
+                    raise
+                except BaseException as e:
+                    op.finish(e)
+                    raise
+                op.finish()
+
+            return gen_wrapper  # type: ignore[return-value]
+
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                awaitable = func(*args, **kwargs)
+                if has_deadline():
+                    awaitable = with_deadline(operation, awaitable)
+                return await _await_operation(start(args, kwargs), awaitable)
+
+            return async_wrapper  # type: ignore[return-value]
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            op = start(args, kwargs)
+            token = activate(op.span) if op.span is not None else None
+            try:
+                if has_deadline():
+                    check_deadline(operation)
+                result = func(*args, **kwargs)
+            except BaseException as e:
+                op.finish(e)
+                raise
+            finally:
+                if token is not None:
+                    deactivate(token)
+            if inspect.isawaitable(result):
+                if has_deadline():
+                    result = with_deadline(operation, result)
+                return _await_operation(op, result)
+            op.finish(result=result)
+            return result
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+def instrument_class(prefix: str) -> Callable[[type], type]:
+    """
+    Class decorator applying `instrument(f"{prefix}.{method}")` to every public method.
+    """
+
+    def decorator(cls: type) -> type:
+        for name, member in list(vars(cls).items()):
+            if name.startswith("_") or not inspect.isfunction(member):
+                continue
+            setattr(cls, name, instrument(f"{prefix}.{name}")(member))
+        return cls
+
+    return decorator
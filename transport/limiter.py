@@ -0,0 +1,197 @@
+import asyncio
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+import httpx
+
+from app.core.third_party_integrations.supabase_home.exceptions.index import (
+    SupabaseConcurrencyLimitError,
+)
+from app.core.third_party_integrations.supabase_home.transport.deadline import (
+    remaining,
+)
+
+
+class AdaptiveLimiter:
+    """
+    AIMD concurrency limiter for one Supabase service area.
+
+    The limit grows by roughly one slot per limit-sized window of successful
+    calls and shrinks multiplicatively on HTTP 429, timeouts or latency spikes
+    (latency above `latency_tolerance` times the smoothed baseline). Callers
+    beyond the limit wait in FIFO order for at most `max_wait` seconds (or the
+    remaining deadline, if shorter); at most `max_queue` callers may wait at once.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        initial_limit: int = 20,
+        min_limit: int = 1,
+        max_limit: int = 200,
+        backoff_ratio: float = 0.7,
+        latency_tolerance: float = 2.0,
+        max_wait: float = 5.0,
+        max_queue: int = 1000,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.name = name
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.backoff_ratio = backoff_ratio
+        self.latency_tolerance = latency_tolerance
+        self.max_wait = max_wait
+        self.max_queue = max_queue
+        self._clock = clock
+        self._limit = float(min(max(initial_limit, min_limit), max_limit))
+        self._in_flight = 0
+        self._waiters: deque[asyncio.Future] = deque()
+        self._baseline: float | None = None
+        self._samples = 0
+        self._last_decrease = 0.0
+        self.total_rejected = 0
+        self.total_throttled = 0
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    async def acquire(self) -> None:
+        if self._in_flight < self.limit and not self._waiters:
+            self._in_flight += 1
+            return
+        if len(self._waiters) >= self.max_queue:
+            self.total_rejected += 1
+            raise SupabaseConcurrencyLimitError(self.name, 0.0)
+        future = asyncio.get_running_loop().create_future()
+        self._waiters.append(future)
+        started = self._clock()
+        left = remaining()
+        max_wait = self.max_wait if left is None else max(0.0, min(self.max_wait, left))
+        try:
+            await asyncio.wait_for(future, max_wait)
+        except asyncio.TimeoutError:
+            self._hand_back(future)
+            self.total_rejected += 1
+            raise SupabaseConcurrencyLimitError(self.name, self._clock() - started)
+        except BaseException:
+            self._hand_back(future)
+            raise
+        finally:
+            if future in self._waiters:
+                self._waiters.remove(future)
+
+    def release(self, latency: float | None = None, throttled: bool = False) -> None:
+        """
+        Return a slot and adapt the limit.
+
+        Args:
+            latency: Seconds the call took; None skips latency-based adaptation
+            throttled: True when the upstream signalled overload (429 or timeout)
+        """
+        self._in_flight = max(0, self._in_flight - 1)
+        if throttled:
+            self.total_throttled += 1
+            self._decrease()
+        elif latency is not None:
+            if self._is_spike(latency):
+                self._decrease()
+            else:
+                self._limit = min(self.max_limit, self._limit + 1.0 / self._limit)
+        self._wake()
+
+    async def run(
+        self, func: Callable[[], Awaitable[httpx.Response]]
+    ) -> httpx.Response:
+        """Run one upstream attempt inside a concurrency slot."""
+        await self.acquire()
+        started = self._clock()
+        try:
+            response = await func()
+        except httpx.TimeoutException:
+            self.release(throttled=True)
+            raise
+        except BaseException:
+            self.release()
+            raise
+        self.release(
+            latency=self._clock() - started, throttled=response.status_code == 429
+        )
+        return response
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "limit": self.limit,
+            "in_flight": self._in_flight,
+            "queued": len(self._waiters),
+            "baseline_latency": self._baseline,
+            "total_rejected": self.total_rejected,
+            "total_throttled": self.total_throttled,
+        }
+
+    def _is_spike(self, latency: float) -> bool:
+        baseline = self._baseline
+        self._samples += 1
+        if baseline is None:
+            self._baseline = latency
+            return False
+        spike = self._samples > 10 and latency > baseline * self.latency_tolerance
+        if not spike:
+            self._baseline = baseline * 0.9 + latency * 0.1
+        return spike
+
+    def _decrease(self) -> None:
+        now = self._clock()
+        # * Shrink at most once per baseline round trip so a burst of 429s counts once
+        if now - self._last_decrease < (self._baseline or 0.0):
+            return
+        self._last_decrease = now
+        self._limit = max(float(self.min_limit), self._limit * self.backoff_ratio)
+
+    def _hand_back(self, future: asyncio.Future) -> None:
+        if future.done() and not future.cancelled():
+            # ? The slot was handed over just as we gave up waiting; pass it on
+            self._in_flight -= 1
+            self._wake()
+
+    def _wake(self) -> None:
+        while self._waiters and self._in_flight < self.limit:
+            future = self._waiters.popleft()
+            if not future.done():
+                self._in_flight += 1
+                future.set_result(None)
+
+
+class AdaptiveLimiterRegistry:
+    """
+    Lazily creates one AdaptiveLimiter per service area with shared settings.
+    """
+
+    def __init__(self, **limiter_options: Any):
+        self.limiter_options = limiter_options
+        self._limiters: dict[str, AdaptiveLimiter] = {}
+
+    @classmethod
+    def from_config(cls, config: Any) -> "AdaptiveLimiterRegistry":
+        return cls(
+            initial_limit=config.concurrency_initial_limit,
+            min_limit=config.concurrency_min_limit,
+            max_limit=config.concurrency_max_limit,
+            max_wait=config.concurrency_max_wait,
+            max_queue=config.concurrency_max_queue,
+        )
+
+    def get(self, area: str) -> AdaptiveLimiter:
+        limiter = self._limiters.get(area)
+        if limiter is None:
+            limiter = self._limiters[area] = AdaptiveLimiter(area, **self.limiter_options)
+        return limiter
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        return {area: limiter.snapshot() for area, limiter in self._limiters.items()}
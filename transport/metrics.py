@@ -0,0 +1,233 @@
+import bisect
+import math
+from collections.abc import Callable, Iterable, Sequence
+from typing import Any
+
+# * Latency buckets (seconds) tuned for Supabase round trips
+DEFAULT_LATENCY_BUCKETS = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0
+)
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{n}="{_escape(str(v))}"' for n, v in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class _Metric:
+    type_name = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values: dict[tuple[str, ...], Any] = {}
+
+    def _key(self, labels: Sequence[str]) -> tuple[str, ...]:
+        if len(labels) != len(self.labelnames):
+            raise ValueError(
+                f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}"
+            )
+        return tuple(labels)
+
+    def render(self) -> Iterable[str]:
+        yield f"# HELP {self.name} {self.documentation}"
+        yield f"# TYPE {self.name} {self.type_name}"
+        for labels, value in sorted(self._values.items()):
+            yield from self._render_sample(labels, value)
+
+    def _render_sample(self, labels: tuple[str, ...], value: Any) -> Iterable[str]:
+        yield f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(value)}"
+
+
+class Counter(_Metric):
+    type_name = "counter"
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        key = self._key(labels)
+        self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, *labels: str) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+
+class Gauge(_Metric):
+    type_name = "gauge"
+
+    def set(self, *labels: str, value: float) -> None:
+        self._values[self._key(labels)] = value
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        key = self._key(labels)
+        self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, *labels: str, amount: float = 1.0) -> None:
+        self.inc(*labels, amount=-amount)
+
+    def value(self, *labels: str) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+
+class Histogram(_Metric):
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, *labels: str, value: float) -> None:
+        key = self._key(labels)
+        state = self._values.get(key)
+        if state is None:
+            # * [per-bucket counts..., +Inf count, sum]
+            state = self._values[key] = [0] * (len(self.buckets) + 1) + [0.0]
+        state[bisect.bisect_left(self.buckets, value)] += 1
+        state[-1] += value
+
+    def count(self, *labels: str) -> int:
+        state = self._values.get(self._key(labels))
+        return sum(state[:-1]) if state else 0
+
+    def _render_sample(self, labels: tuple[str, ...], state: list) -> Iterable[str]:
+        cumulative = 0
+        for bound, count in zip(self.buckets + (math.inf,), state[:-1]):
+            cumulative += count
+            le = _format_labels(self.labelnames, labels, f'le="{_format_value(bound)}"')
+            yield f"{self.name}_bucket{le} {cumulative}"
+        plain = _format_labels(self.labelnames, labels)
+        yield f"{self.name}_sum{plain} {_format_value(state[-1])}"
+        yield f"{self.name}_count{plain} {cumulative}"
+
+
+class MetricsRegistry:
+    """
+    Minimal in-process metrics registry rendering the Prometheus text format.
+
+    Metrics are plain dict updates on the event loop thread, so recording is
+    cheap enough to leave on in production. Collectors registered with
+    `add_collector` run at scrape time to publish point-in-time gauges.
+    """
+
+    def __init__(self):
+        self._metrics: dict[str, _Metric] = {}
+        self._collectors: list[Callable[[], None]] = []
+
+    def _register(self, metric: _Metric) -> Any:
+        existing = self._metrics.get(metric.name)
+        if existing is not None:
+            return existing
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._register(Gauge(name, documentation, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+    ) -> Histogram:
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def add_collector(self, collector: Callable[[], None]) -> None:
+        self._collectors.append(collector)
+
+    def remove_collector(self, collector: Callable[[], None]) -> None:
+        """Stop running `collector` at scrape time; unknown collectors are ignored."""
+        if collector in self._collectors:
+            self._collectors.remove(collector)
+
+    def render(self) -> str:
+        # * Copy: a collector may remove itself while running
+        for collector in list(self._collectors):
+            collector()
+        lines: list[str] = []
+        for metric in self._metrics.values():
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+metrics = MetricsRegistry()
+
+REQUEST_LATENCY = metrics.histogram(
+    "supabase_request_duration_seconds",
+    "Latency of Supabase operations",
+    ("service", "operation"),
+)
+REQUESTS_IN_FLIGHT = metrics.gauge(
+    "supabase_requests_in_flight",
+    "Supabase operations currently in flight",
+    ("service", "operation"),
+)
+REQUEST_ERRORS = metrics.counter(
+    "supabase_request_errors_total",
+    "Failed Supabase operations by error class",
+    ("service", "operation", "error_class"),
+)
+REQUEST_RETRIES = metrics.counter(
+    "supabase_request_retries_total",
+    "Retries of Supabase HTTP requests",
+    ("service", "operation"),
+)
+BYTES_SENT = metrics.counter(
+    "supabase_request_bytes_sent_total",
+    "Request body bytes sent to Supabase",
+    ("service", "operation"),
+)
+BYTES_RECEIVED = metrics.counter(
+    "supabase_request_bytes_received_total",
+    "Response body bytes received from Supabase",
+    ("service", "operation"),
+)
+
+
+def error_class(error: BaseException) -> str:
+    """Short, low-cardinality label for an exception (HTTP status class or type name)."""
+    status_code = getattr(error, "status_code", None)
+    if isinstance(status_code, int):
+        return f"http_{status_code // 100}xx"
+    return type(error).__name__
+
+
+def make_metrics_router(registry: MetricsRegistry = metrics, path: str = "/metrics"):
+    """
+    Build a FastAPI router exposing `registry` in Prometheus text format.
+
+    Usage:
+        app.include_router(make_metrics_router())
+    """
+    from fastapi import APIRouter
+    from fastapi.responses import PlainTextResponse
+
+    router = APIRouter()
+
+    @router.get(path, include_in_schema=False)
+    async def prometheus_metrics() -> PlainTextResponse:
+        return PlainTextResponse(registry.render(), media_type=PROMETHEUS_CONTENT_TYPE)
+
+    return router
@@ -0,0 +1,193 @@
+import logging
+import random
+import re
+from collections.abc import Iterable, Mapping
+from typing import Any
+
+REDACTED = "***"
+
+# * Header and body field names whose values never reach the logs (case-insensitive)
+DEFAULT_REDACT_FIELDS = frozenset(
+    {
+        "authorization",
+        "apikey",
+        "cookie",
+        "set-cookie",
+        "password",
+        "access_token",
+        "refresh_token",
+        "service_role_key",
+        "token",
+    }
+)
+
+DEFAULT_SAMPLE_RATES = {"2xx": 1.0, "3xx": 1.0, "4xx": 1.0, "5xx": 1.0}
+
+
+def status_class(status_code: int) -> str:
+    return f"{status_code // 100}xx"
+
+
+def redact(value: Any, fields: frozenset[str]) -> Any:
+    """
+    Return a copy of `value` with sensitive mapping keys replaced by REDACTED.
+    """
+    if isinstance(value, Mapping):
+        return {
+            k: REDACTED if str(k).lower() in fields else redact(v, fields)
+            for k, v in value.items()
+        }
+    if isinstance(value, list):
+        return [redact(v, fields) for v in value]
+    return value
+
+
+# * A JSON `"key": value` pair whose value is a string (possibly cut off) or a scalar
+_JSON_PAIR = re.compile(r'"((?:[^"\\]|\\.)*)"(\s*:\s*)("(?:[^"\\]|\\.)*(?:"|$)|[^\s,{}\[\]"]+)')
+
+
+def redact_text(text: str, fields: frozenset[str]) -> str:
+    """
+    Mask the values of sensitive keys in (possibly truncated) JSON text.
+
+    A single regex pass over the text, so the cost is bounded by its length
+    rather than by the size of the document it was cut from.
+    """
+
+    def mask(match: re.Match) -> str:
+        if match.group(1).lower() not in fields:
+            return match.group(0)
+        return f'"{match.group(1)}"{match.group(2)}"{REDACTED}"'
+
+    return _JSON_PAIR.sub(mask, text)
+
+
+class _Lazy:
+    """
+    Defers redaction and formatting until a handler actually renders the record.
+    """
+
+    __slots__ = ("value", "fields", "limit")
+
+    def __init__(self, value: Any, fields: frozenset[str], limit: int | None = None):
+        self.value = value
+        self.fields = fields
+        self.limit = limit
+
+    def __str__(self) -> str:
+        value = self.value
+        if isinstance(value, bytes):
+            if not self.limit:
+                return ""
+            # ? Truncate first, then mask tokens (e.g. /auth/v1/token responses) in the preview
+            text = redact_text(value[: self.limit].decode("utf-8", "replace"), self.fields)
+            return text + ("..." if len(value) > self.limit else "")
+        if hasattr(value, "items") and not isinstance(value, Mapping):
+            value = dict(value.items())
+        return str(redact(value, self.fields))
+
+    __repr__ = __str__
+
+
+class RequestLogger:
+    """
+    Logging for the Supabase request hot path.
+
+    One record is emitted per completed request. Formatting is deferred to the
+    logging handlers, sensitive fields are redacted, and records are sampled by
+    status class. When disabled every call returns before touching its arguments.
+
+    Args:
+        logger: Target logger
+        enabled: Master switch, usually `SupabaseConfig.enable_logging`
+        sample_rates: Fraction of requests logged per status class ("2xx", "4xx", ...)
+        redact_fields: Header/body keys to mask
+        body_preview: Bytes of the response body included in DEBUG records
+    """
+
+    def __init__(
+        self,
+        logger: logging.Logger,
+        enabled: bool = True,
+        sample_rates: Mapping[str, float] | None = None,
+        redact_fields: Iterable[str] = DEFAULT_REDACT_FIELDS,
+        body_preview: int = 200,
+    ):
+        self.logger = logger
+        self.enabled = enabled
+        self.sample_rates = {**DEFAULT_SAMPLE_RATES, **(sample_rates or {})}
+        self.redact_fields = frozenset(f.lower() for f in redact_fields)
+        self.body_preview = body_preview
+
+    @classmethod
+    def from_config(cls, logger: logging.Logger, config: Any) -> "RequestLogger":
+        return cls(
+            logger,
+            enabled=config.enable_logging,
+            sample_rates=config.log_sample_rates,
+            redact_fields=DEFAULT_REDACT_FIELDS | set(config.log_redact_fields),
+        )
+
+    def _sampled(self, status_code: int) -> bool:
+        rate = self.sample_rates.get(status_class(status_code), 1.0)
+        return rate >= 1.0 or (rate > 0.0 and random.random() < rate)
+
+    def response(
+        self,
+        method: str,
+        url: str,
+        status_code: int,
+        elapsed: float,
+        request_headers: Mapping[str, str] | None = None,
+        params: Any = None,
+        data: Any = None,
+        response_headers: Any = None,
+        content: bytes | None = None,
+    ) -> None:
+        """Log the outcome of a completed request."""
+        if not self.enabled:
+            return
+        level = logging.WARNING if status_code >= 400 else logging.INFO
+        if not self.logger.isEnabledFor(level) or not self._sampled(status_code):
+            return
+        self.logger.log(
+            level,
+            "Supabase %s %s -> %d in %.1fms",
+            method,
+            url,
+            status_code,
+            elapsed * 1000,
+        )
+        if self.logger.isEnabledFor(logging.DEBUG):
+            fields = self.redact_fields
+            self.logger.debug(
+                "Supabase %s %s request headers=%s params=%s body=%s "
+                "response headers=%s body=%s",
+                method,
+                url,
+                _Lazy(request_headers, fields),
+                _Lazy(params, fields),
+                _Lazy(data, fields),
+                _Lazy(response_headers, fields),
+                _Lazy(content, fields, self.body_preview),
+            )
+
+    def retry(self, method: str, url: str, attempt: int, delay: float, reason: str) -> None:
+        if self.enabled:
+            self.logger.warning(
+                "Retrying Supabase %s %s (attempt %d) in %.2fs after %s",
+                method,
+                url,
+                attempt,
+                delay,
+                reason,
+            )
+
+    def failure(self, method: str, url: str, message: str, *args: Any) -> None:
+        """Log a failed request; never sampled. Mapping and list arguments are redacted."""
+        if self.enabled:
+            args = tuple(
+                _Lazy(arg, self.redact_fields) if isinstance(arg, (Mapping, list)) else arg
+                for arg in args
+            )
+            self.logger.error("Supabase %s %s failed: " + message, method, url, *args)
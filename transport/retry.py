@@ -0,0 +1,164 @@
+import asyncio
+import logging
+import random
+import time
+from collections.abc import Awaitable, Callable
+from email.utils import parsedate_to_datetime
+from typing import Any
+
+import httpx
+
+from app.core.third_party_integrations.supabase_home.transport.deadline import (
+    remaining,
+)
+
+logger = logging.getLogger("apps.supabase_home")
+
+# * Statuses that signal a transient upstream condition worth retrying
+RETRYABLE_STATUS_CODES = frozenset({408, 429, 502, 503, 504})
+# * Methods that can be replayed without changing the outcome on the server
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """
+    Parse a Retry-After header (delta-seconds or HTTP-date) into seconds.
+
+    Returns:
+        Seconds to wait, or None if the header is missing or malformed
+    """
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at is None:
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+class RetryPolicy:
+    """
+    Exponential backoff with full jitter, bounded by a total time budget and
+    by the request deadline, if one is set.
+
+    Args:
+        retry_attempts: Number of retries after the first attempt
+        backoff_base: Base delay in seconds, doubled on every retry
+        backoff_max: Upper bound for a single backoff delay
+        total_timeout: Total seconds allowed across all attempts and sleeps
+        retry_statuses: HTTP statuses that trigger a retry
+    """
+
+    def __init__(
+        self,
+        retry_attempts: int = 3,
+        backoff_base: float = 0.2,
+        backoff_max: float = 5.0,
+        total_timeout: float = 30.0,
+        retry_statuses: frozenset[int] = RETRYABLE_STATUS_CODES,
+    ):
+        self.retry_attempts = max(0, retry_attempts)
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.total_timeout = total_timeout
+        self.retry_statuses = retry_statuses
+
+    @classmethod
+    def from_config(cls, config: Any) -> "RetryPolicy":
+        return cls(
+            retry_attempts=config.retry_attempts,
+            backoff_base=config.retry_backoff_base,
+            backoff_max=config.retry_backoff_max,
+            total_timeout=config.retry_total_timeout,
+        )
+
+    def backoff(self, attempt: int) -> float:
+        """Full-jitter delay for the given retry number (1-based)."""
+        cap = min(self.backoff_max, self.backoff_base * (2 ** (attempt - 1)))
+        return random.uniform(0, cap)
+
+    def delay_for(self, attempt: int, response: httpx.Response | None) -> float:
+        """
+        Delay before the given retry, preferring the server's Retry-After hint.
+        """
+        delay = self.backoff(attempt)
+        if response is not None:
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            if retry_after is not None:
+                delay = max(delay, retry_after)
+        return delay
+
+    def is_retryable_error(self, error: Exception, idempotent: bool) -> bool:
+        # ? Connect failures never reached the server, so they are safe for any method
+        if isinstance(error, (httpx.ConnectError, httpx.ConnectTimeout)):
+            return True
+        return idempotent and isinstance(error, httpx.TransportError)
+
+    async def execute(
+        self,
+        method: str,
+        send: Callable[[], Awaitable[httpx.Response]],
+        retry_non_idempotent: bool = False,
+        on_retry: Callable[[int, float, str], None] | None = None,
+    ) -> httpx.Response:
+        """
+        Run `send` until it succeeds, is not retryable, or the budget runs out.
+
+        Args:
+            method: HTTP method, used to decide whether the request is idempotent
+            send: Zero-argument coroutine factory performing one attempt
+            retry_non_idempotent: Allow retrying POST/PATCH on retryable statuses
+            on_retry: Callback invoked with (attempt, delay, reason) before sleeping
+
+        Returns:
+            The last response received; exhausted retries return the last failure
+            response so the caller's status handling still applies.
+        """
+        idempotent = retry_non_idempotent or method.upper() in IDEMPOTENT_METHODS
+        started = time.monotonic()
+        attempt = 0
+        while True:
+            response: httpx.Response | None = None
+            try:
+                response = await send()
+            except httpx.TransportError as e:
+                if attempt >= self.retry_attempts or not self.is_retryable_error(
+                    e, idempotent
+                ):
+                    raise
+                reason = type(e).__name__
+                error: Exception | None = e
+            else:
+                if (
+                    attempt >= self.retry_attempts
+                    or not idempotent
+                    or response.status_code not in self.retry_statuses
+                ):
+                    return response
+                reason = f"HTTP {response.status_code}"
+                error = None
+
+            attempt += 1
+            delay = self.delay_for(attempt, response)
+            left = remaining()
+            if time.monotonic() - started + delay > self.total_timeout or (
+                left is not None and delay >= left
+            ):
+                logger.warning(
+                    "Supabase retry budget exhausted after %d attempt(s) (%s)",
+                    attempt,
+                    reason,
+                )
+                if error is not None:
+                    raise error
+                return response
+            if on_retry is not None:
+                on_retry(attempt, delay, reason)
+            await asyncio.sleep(delay)
@@ -0,0 +1,79 @@
+import asyncio
+import hashlib
+from collections.abc import Awaitable, Callable, Hashable, Mapping
+from typing import Any, TypeVar
+
+from app.core.third_party_integrations.supabase_home.transport.tracing import (
+    set_span_attribute,
+)
+
+T = TypeVar("T")
+
+
+def request_key(
+    method: str,
+    url: str,
+    params: Mapping[str, Any] | None,
+    headers: Mapping[str, str],
+) -> tuple:
+    """
+    Build a coalescing key from the method, URL, params and caller identity.
+
+    The identity is a digest of the apikey/Authorization headers, so callers
+    with different tokens (and therefore different RLS views) never share results.
+    """
+    identity = hashlib.sha256(
+        f"{headers.get('apikey', '')}|{headers.get('Authorization', '')}".encode()
+    ).hexdigest()
+    normalized_params = tuple(sorted((str(k), str(v)) for k, v in (params or {}).items()))
+    return (method.upper(), url, normalized_params, identity)
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent identical calls into one execution.
+
+    The first caller for a key starts the call as a detached task; every caller,
+    the first included, awaits that task and receives the same result (or
+    exception). Cancelling any caller leaves the call running for the others.
+    Shared results are the same object, so callers must treat them as read-only.
+    """
+
+    def __init__(self):
+        self._in_flight: dict[Hashable, asyncio.Task] = {}
+        self.calls = 0
+        self.executions = 0
+
+    @property
+    def saved(self) -> int:
+        """Upstream calls avoided by coalescing."""
+        return self.calls - self.executions
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[T]]) -> T:
+        self.calls += 1
+        task = self._in_flight.get(key)
+        if task is not None:
+            set_span_attribute("single_flight.shared", True)
+        else:
+            # ? Run detached from the leader so cancelling it does not fail the followers
+            task = asyncio.ensure_future(func())
+            self._in_flight[key] = task
+            self.executions += 1
+            task.add_done_callback(lambda done: self._finish(key, done))
+        # ? shield so one waiter's cancellation does not cancel the shared call
+        return await asyncio.shield(task)
+
+    def _finish(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        if not task.cancelled():
+            # * Mark retrieved so an unawaited failure does not warn
+            task.exception()
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "calls": self.calls,
+            "executions": self.executions,
+            "saved": self.saved,
+            "in_flight": len(self._in_flight),
+        }
@@ -0,0 +1,264 @@
+import contextvars
+import json
+import logging
+import os
+import re
+import secrets
+import threading
+import time
+from collections import deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+
+logger = logging.getLogger("apps.supabase_home")
+
+_TRACEPARENT = re.compile(r"^00-([0-9a-f]{32})-([0-9a-f]{16})-([0-9a-f]{2})$")
+
+# * The innermost active span, and the caller's trace context when no span is active
+_current_span: contextvars.ContextVar["Span | None"] = contextvars.ContextVar(
+    "supabase_current_span", default=None
+)
+_remote_parent: contextvars.ContextVar[tuple[str, str] | None] = contextvars.ContextVar(
+    "supabase_remote_parent", default=None
+)
+
+
+class Span:
+    """
+    One timed operation with attributes, linked to its parent by trace/span ids.
+    """
+
+    __slots__ = (
+        "name",
+        "trace_id",
+        "span_id",
+        "parent_id",
+        "start_time",
+        "duration",
+        "attributes",
+        "status",
+        "error",
+        "_started",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        trace_id: str,
+        parent_id: str | None,
+        attributes: dict[str, Any] | None = None,
+    ):
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = secrets.token_hex(8)
+        self.parent_id = parent_id
+        self.start_time = time.time()
+        self.duration: float | None = None
+        self.attributes = dict(attributes or {})
+        self.status = "ok"
+        self.error: str | None = None
+        self._started = time.perf_counter()
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def increment(self, key: str, amount: int = 1) -> None:
+        self.attributes[key] = self.attributes.get(key, 0) + amount
+
+    def record_error(self, error: BaseException) -> None:
+        self.status = "error"
+        self.error = f"{type(error).__name__}: {error}"
+
+    def end(self) -> None:
+        self.duration = time.perf_counter() - self._started
+
+    @property
+    def traceparent(self) -> str:
+        """W3C traceparent header value for propagating this span downstream."""
+        return f"00-{self.trace_id}-{self.span_id}-01"
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "start_time": self.start_time,
+            "duration_ms": None if self.duration is None else self.duration * 1000,
+            "attributes": self.attributes,
+            "status": self.status,
+            "error": self.error,
+        }
+
+
+class SpanExporter:
+    """Receives finished spans. Exporters must be fast and must not raise."""
+
+    def export(self, span: Span) -> None:
+        raise NotImplementedError
+
+    def close(self) -> None:
+        pass
+
+
+class RingBufferExporter(SpanExporter):
+    """Keeps the most recent `capacity` spans in memory for inspection."""
+
+    def __init__(self, capacity: int = 1000):
+        self._spans: deque[Span] = deque(maxlen=capacity)
+
+    def export(self, span: Span) -> None:
+        self._spans.append(span)
+
+    def spans(self, trace_id: str | None = None) -> list[Span]:
+        spans = list(self._spans)
+        if trace_id is not None:
+            spans = [s for s in spans if s.trace_id == trace_id]
+        return spans
+
+    def clear(self) -> None:
+        self._spans.clear()
+
+
+class JsonLinesExporter(SpanExporter):
+    """Appends each finished span as one JSON object per line."""
+
+    def __init__(self, path: str | os.PathLike):
+        self.path = os.fspath(path)
+        self._lock = threading.Lock()
+        self._file = open(self.path, "a", encoding="utf-8")
+
+    def export(self, span: Span) -> None:
+        line = json.dumps(span.to_dict(), default=str)
+        with self._lock:
+            self._file.write(line + "\n")
+            self._file.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            self._file.close()
+
+
+class Tracer:
+    """
+    Creates spans and hands finished ones to the registered exporters.
+
+    With no exporters registered the tracer is disabled and instrumentation
+    skips span creation entirely.
+    """
+
+    def __init__(self):
+        self.exporters: list[SpanExporter] = []
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.exporters)
+
+    def add_exporter(self, exporter: SpanExporter) -> SpanExporter:
+        self.exporters.append(exporter)
+        return exporter
+
+    def remove_exporter(self, exporter: SpanExporter) -> None:
+        self.exporters.remove(exporter)
+        exporter.close()
+
+    def start_span(self, name: str, attributes: dict[str, Any] | None = None) -> Span:
+        parent = _current_span.get()
+        if parent is not None:
+            return Span(name, parent.trace_id, parent.span_id, attributes)
+        remote = _remote_parent.get()
+        if remote is not None:
+            return Span(name, remote[0], remote[1], attributes)
+        return Span(name, secrets.token_hex(16), None, attributes)
+
+    def finish(self, span: Span) -> None:
+        span.end()
+        for exporter in self.exporters:
+            try:
+                exporter.export(span)
+            except Exception:
+                logger.exception("Span exporter %r failed", exporter)
+
+    @contextmanager
+    def span(self, name: str, **attributes: Any) -> Iterator[Span | None]:
+        """Context manager that makes a new span current for its body."""
+        if not self.enabled:
+            yield None
+            return
+        span = self.start_span(name, attributes)
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.record_error(e)
+            raise
+        finally:
+            _current_span.reset(token)
+            self.finish(span)
+
+
+tracer = Tracer()
+
+
+def current_span() -> Span | None:
+    return _current_span.get()
+
+
+def activate(span: Span | None) -> contextvars.Token:
+    return _current_span.set(span)
+
+
+def deactivate(token: contextvars.Token) -> None:
+    _current_span.reset(token)
+
+
+def set_span_attribute(key: str, value: Any) -> None:
+    """Set an attribute on the active span, if any."""
+    span = _current_span.get()
+    if span is not None:
+        span.attributes[key] = value
+
+
+def increment_span_attribute(key: str, amount: int = 1) -> None:
+    span = _current_span.get()
+    if span is not None:
+        span.increment(key, amount)
+
+
+def parse_traceparent(value: str | None) -> tuple[str, str] | None:
+    """Parse a W3C traceparent header into (trace_id, parent span id)."""
+    if not value:
+        return None
+    match = _TRACEPARENT.match(value.strip().lower())
+    if match is None or set(match.group(1)) == {"0"}:
+        return None
+    return match.group(1), match.group(2)
+
+
+def set_trace_context(traceparent: str | None) -> contextvars.Token:
+    """
+    Link spans created in this context to the caller's trace.
+
+    Returns:
+        A token for `reset_trace_context`
+    """
+    return _remote_parent.set(parse_traceparent(traceparent))
+
+
+def reset_trace_context(token: contextvars.Token) -> None:
+    _remote_parent.reset(token)
+
+
+async def trace_context_middleware(request: Any, call_next: Any) -> Any:
+    """
+    FastAPI/Starlette HTTP middleware linking Supabase spans to the incoming traceparent.
+
+    Usage:
+        app.middleware("http")(trace_context_middleware)
+    """
+    token = set_trace_context(request.headers.get("traceparent"))
+    try:
+        return await call_next(request)
+    finally:
+        reset_trace_context(token)